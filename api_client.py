@@ -8,6 +8,9 @@ and prints the resulting answer (either as a single JSON blob or as streamed JSO
 from __future__ import annotations
 
 import argparse
+import atexit
+from collections.abc import Iterator
+from importlib.util import find_spec
 import logging
 import json
 import sys
@@ -15,6 +18,7 @@ from os import getenv
 from typing import Any
 
 import httpx
+import orjson
 from httpx import HTTPStatusError, RequestError, ResponseNotRead
 
 from perplexity_webui_scraper import get_logger, set_debug_level
@@ -23,6 +27,39 @@ from perplexity_webui_scraper.logger import log_request_details, log_response_de
 
 logger = get_logger("perplexity_webui_scraper.api_client")
 
+# HTTP/2 needs the optional `h2` package (httpx[http2]); fall back to HTTP/1.1 keep-alive without it.
+_HTTP2_AVAILABLE = find_spec("h2") is not None
+
+_CLIENT: httpx.Client | None = None
+_CLIENT_KEY: tuple[str, float | None] | None = None
+
+
+def _get_client(base_url: str, timeout: float | None) -> httpx.Client:
+    """Return a shared keep-alive client, rebuilding it only when the target or timeout changes."""
+    global _CLIENT, _CLIENT_KEY
+    key = (base_url, timeout)
+    if _CLIENT is None or _CLIENT.is_closed or _CLIENT_KEY != key:
+        if _CLIENT is not None:
+            _CLIENT.close()
+        _CLIENT = httpx.Client(
+            base_url=base_url,
+            timeout=timeout,
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=30.0),
+        )
+        _CLIENT_KEY = key
+        logger.debug("Created shared HTTP client for %s (http2=%s)", base_url, _HTTP2_AVAILABLE)
+    return _CLIENT
+
+
+@atexit.register
+def _close_client() -> None:
+    global _CLIENT, _CLIENT_KEY
+    if _CLIENT is not None:
+        _CLIENT.close()
+    _CLIENT = None
+    _CLIENT_KEY = None
+
 
 def _sanitize_payload(payload: dict[str, Any]) -> dict[str, Any]:
     """Redact sensitive fields before logging."""
@@ -64,39 +101,84 @@ def build_payload(args: argparse.Namespace) -> dict[str, Any]:
     return filtered_payload
 
 
-def run_once(base_url: str, payload: dict[str, Any], timeout: float | None) -> None:
-    log_request_details(logger, "POST", f"{base_url}/ask", data=_sanitize_payload(payload))
-    with httpx.Client(base_url=base_url, timeout=timeout) as client:
-        response = client.post("/ask", json=payload)
-        response.raise_for_status()
-        json_response = response.json()
+def run_once(
+    base_url: str,
+    payload: dict[str, Any],
+    timeout: float | None,
+    client: httpx.Client | None = None,
+) -> None:
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        log_request_details(logger, "POST", f"{base_url}/ask", data=_sanitize_payload(payload))
+    client = client or _get_client(base_url, timeout)
+    response = client.post("/ask", json=payload)
+    response.raise_for_status()
+    json_response = orjson.loads(response.content)
+    if debug:
         log_response_details(logger, response.status_code, response_data=json_response)
+    if sys.stdout.isatty():
         print(json.dumps(json_response, indent=2, ensure_ascii=False))
+    else:
+        # Piped to a file or another tool: emit compact JSON without pretty-printing.
+        sys.stdout.buffer.write(orjson.dumps(json_response) + b"\n")
+
 
+def _iter_stream_batches(response: httpx.Response, chunk_size: int = 65536) -> Iterator[list[bytes]]:
+    """Split the raw response body into newline-delimited records, one batch per network chunk."""
+    buffer = bytearray()
+    for chunk in response.iter_bytes(chunk_size):
+        buffer += chunk
+        batch = []
+        while (index := buffer.find(b"\n")) >= 0:
+            batch.append(bytes(buffer[:index]))
+            del buffer[: index + 1]
+        if batch:
+            yield batch
+    if buffer:
+        yield [bytes(buffer)]
 
-def run_stream(base_url: str, payload: dict[str, Any], timeout: float | None) -> None:
-    log_request_details(logger, "POST", f"{base_url}/ask/stream", data=_sanitize_payload(payload))
-    with httpx.Client(base_url=base_url, timeout=timeout) as client:
-        with client.stream("POST", "/ask/stream", json=payload) as response:
-            try:
-                response.raise_for_status()
-            except HTTPStatusError:
-                # Consume the body so `response.text` becomes available to callers.
-                response.read()
-                raise
-            for line in response.iter_lines():
-                if not line:
+
+def run_stream(
+    base_url: str,
+    payload: dict[str, Any],
+    timeout: float | None,
+    client: httpx.Client | None = None,
+) -> None:
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        log_request_details(logger, "POST", f"{base_url}/ask/stream", data=_sanitize_payload(payload))
+    client = client or _get_client(base_url, timeout)
+    with client.stream("POST", "/ask/stream", json=payload) as response:
+        try:
+            response.raise_for_status()
+        except HTTPStatusError:
+            # Consume the body so `response.text` becomes available to callers.
+            response.read()
+            raise
+        # Write JSON lines straight to the binary buffer and flush once per network
+        # chunk, so every record the server sent together reaches the reader together.
+        out = sys.stdout.buffer
+        for batch in _iter_stream_batches(response):
+            stop = False
+            for line in batch:
+                if not line.strip():
                     continue
                 try:
-                    data = json.loads(line)
-                except json.JSONDecodeError:
-                    print(line, file=sys.stderr)
+                    data = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    print(line.decode("utf-8", errors="replace"), file=sys.stderr)
                     continue
 
-                logger.debug("Received stream line: %s", line)
-                print(json.dumps(data, ensure_ascii=False))
+                if debug:
+                    logger.debug("Received stream line: %s", line.decode("utf-8", errors="replace"))
+                out.write(orjson.dumps(data))
+                out.write(b"\n")
                 if data.get("error"):
+                    stop = True
                     break
+            out.flush()
+            if stop:
+                break
 
 
 def parse_args(argv: list[str]) -> argparse.Namespace:
@@ -190,12 +272,13 @@ def main(argv: list[str] | None = None) -> int:
         logger.debug("--verbrose enabled; debug logging active.")
 
     payload = build_payload(args)
+    client = _get_client(args.base_url, args.timeout)
 
     try:
         if args.stream:
-            run_stream(args.base_url, payload, args.timeout)
+            run_stream(args.base_url, payload, args.timeout, client=client)
         else:
-            run_once(args.base_url, payload, args.timeout)
+            run_once(args.base_url, payload, args.timeout, client=client)
     except HTTPStatusError as exc:
         detail = ""
         try:
@@ -4,13 +4,30 @@
 
 import argparse
 import concurrent.futures as futures
+import json
+from multiprocessing import freeze_support
 import os
 import sys
 import fitz  # PyMuPDF
 from pathlib import Path
 
-def pdf_pages_to_png_bytes(pdf_path: Path, dpi: int):
-    """Yield (page_index_1based, png_bytes) for each page in pdf_path."""
+def pdf_page_count(pdf_path: Path) -> int:
+    """Return the page count of pdf_path, or 0 if it cannot be opened or is encrypted."""
+    try:
+        doc = fitz.open(pdf_path)
+    except Exception as e:
+        print(f"[SKIP-OPEN] {pdf_path}: {e}", file=sys.stderr)
+        return 0
+    try:
+        if doc.needs_pass:
+            print(f"[SKIP-ENCRYPTED] {pdf_path}", file=sys.stderr)
+            return 0
+        return doc.page_count
+    finally:
+        doc.close()
+
+def pdf_page_pixmaps(pdf_path: Path, dpi: int, page_start: int = 0, page_end: int | None = None):
+    """Yield (page_index_1based, pixmap) for pages [page_start, page_end) in pdf_path."""
     try:
         doc = fitz.open(pdf_path)
     except Exception as e:
@@ -22,53 +39,95 @@ def pdf_pages_to_png_bytes(pdf_path: Path, dpi: int):
         return
     zoom = dpi / 72.0
     mat = fitz.Matrix(zoom, zoom)
-    for i in range(doc.page_count):
+    end = doc.page_count if page_end is None else min(page_end, doc.page_count)
+    for i in range(page_start, end):
         try:
             page = doc.load_page(i)
             pix = page.get_pixmap(matrix=mat, alpha=False)
-            png_bytes = pix.tobytes("png")
-            yield (i + 1), png_bytes
         except Exception as e:
             print(f"[SKIP-PAGE] {pdf_path} page {i+1}: {e}", file=sys.stderr)
+            continue
+        yield (i + 1), pix
     doc.close()
 
+def plan_page_ranges(page_counts: dict, jobs: int) -> list:
+    """Split every PDF into (pdf_path, page_start, page_end) tasks of roughly equal size.
+
+    Aim for about four tasks per worker so one long PDF cannot keep a single
+    worker busy while the rest sit idle.
+    """
+    total = sum(page_counts.values())
+    chunk = max(1, -(-total // (max(1, jobs) * 4)))
+    tasks = []
+    for pdf_path, count in page_counts.items():
+        for start in range(0, count, chunk):
+            tasks.append((pdf_path, start, min(start + chunk, count)))
+    return tasks
+
+# Cross-platform conservative cleanup
+_SANITIZE_TABLE = str.maketrans({c: "_" for c in '<>:"/\\|?*'})
+
 def sanitize_stem(stem: str) -> str:
-    # Cross-platform conservative cleanup
-    bad = '<>:"/\\|?*'
-    return "".join("_" if c in bad else c for c in stem).strip()
+    return stem.translate(_SANITIZE_TABLE).strip()
+
+FORMATS = ("png", "ppm", "raw")
 
-def convert_one_pdf(pdf_path: Path, out_dir: Path, dpi: int, ext: str) -> int:
-    stem = sanitize_stem(pdf_path.stem)
+def write_pixmap(pix, out_path: str, fmt: str) -> None:
+    """Write pix to out_path as PNG, binary PPM, or headerless RGB samples."""
+    if fmt == "png":
+        # MuPDF encodes straight to the file, so no intermediate PNG bytes object is built.
+        pix.save(out_path, output="png")
+        return
+    # ppm/raw skip deflate entirely; samples_mv is a view on the pixmap buffer, not a copy
+    with open(out_path, "wb") as f:
+        if fmt == "ppm":
+            f.write(f"P6\n{pix.width} {pix.height}\n255\n".encode("ascii"))
+        f.write(pix.samples_mv)
+    if fmt == "raw":
+        meta = {"width": pix.width, "height": pix.height, "channels": pix.n, "stride": pix.stride}
+        with open(out_path + ".json", "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+
+def convert_one_pdf(pdf_path: Path, out_dir: Path, dpi: int, ext: str,
+                    page_start: int = 0, page_end: int | None = None, fmt: str = "png") -> int:
+    # Only the page number changes inside the loop; build the rest of the path once.
+    prefix = str(out_dir / f"{sanitize_stem(pdf_path.stem)}-page")
+    suffix = f".{ext}"
     written = 0
-    for page_idx, png_bytes in pdf_pages_to_png_bytes(pdf_path, dpi):
-        out_name = f"{stem}-page{page_idx:03d}.{ext}"
-        out_path = out_dir / out_name
+    for page_idx, pix in pdf_page_pixmaps(pdf_path, dpi, page_start, page_end):
+        out_path = prefix + f"{page_idx:03d}" + suffix
         try:
-            # Always write PNG bytes; extension is user-controlled.
-            with open(out_path, "wb") as f:
-                f.write(png_bytes)
+            # The encoding follows fmt; the extension is user-controlled.
+            write_pixmap(pix, out_path, fmt)
             written += 1
         except Exception as e:
             print(f"[SKIP-WRITE] {out_path}: {e}", file=sys.stderr)
+    return written
+
+def report_pdf(pdf_path: Path, written: int, ext: str, fmt: str = "png") -> None:
     if written == 0:
         print(f"[NO-OUTPUT] {pdf_path}", file=sys.stderr)
-    else:
-        if ext.lower() != "png":
-            print(f"[NOTE] {pdf_path.name}: wrote PNG bytes with .{ext} extension", file=sys.stderr)
-    return written
+        return
+    if ext.lower() != fmt:
+        print(f"[NOTE] {pdf_path.name}: wrote {fmt.upper()} bytes with .{ext} extension", file=sys.stderr)
+    print(f"[DONE] {pdf_path.name}: {written} pages")
 
 def find_pdfs(in_dir: Path):
-    for p in sorted(in_dir.iterdir()):
-        if p.is_file() and p.suffix.lower() == ".pdf":
-            yield p
+    # scandir entries carry their file type, so filtering needs no extra stat per entry
+    with os.scandir(in_dir) as it:
+        pdfs = [Path(e.path) for e in it if e.name.lower().endswith(".pdf") and e.is_file()]
+    pdfs.sort()
+    yield from pdfs
 
 def main():
     ap = argparse.ArgumentParser(description="Convert all PDFs in a directory to per-page images.")
     ap.add_argument("--in", dest="in_dir", required=True, help="Input directory containing PDFs")
     ap.add_argument("--out", dest="out_dir", required=True, help="Output directory for images")
     ap.add_argument("--dpi", type=int, default=144, help="Render DPI (default: 144)")
-    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 4, help="Parallel workers per PDF (default: CPU count)")
-    ap.add_argument("--ext", type=str, default="png", help="Output extension (default: png). If set to 'pgn', PNG bytes are still written.")
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 4, help="Parallel worker processes (default: CPU count)")
+    ap.add_argument("--format", dest="fmt", choices=FORMATS, default="png",
+                    help="Output encoding (default: png). 'ppm' and 'raw' skip compression; 'raw' also writes a .json sidecar with the dimensions.")
+    ap.add_argument("--ext", type=str, default=None, help="Output extension (default: same as --format). If set to 'pgn', PNG bytes are still written.")
     args = ap.parse_args()
 
     in_dir = Path(args.in_dir).expanduser().resolve()
@@ -84,23 +143,38 @@ def main():
         print(f"[ERROR] No PDFs found in: {in_dir}", file=sys.stderr)
         sys.exit(3)
 
-    ext = args.ext.lstrip(".")
+    fmt = args.fmt
+    ext = args.ext.lstrip(".") if args.ext else fmt
     dpi = max(36, args.dpi)
 
-    # One job per PDF
-    total_pages = 0
-    with futures.ThreadPoolExecutor(max_workers=max(1, args.jobs)) as ex:
-        futs = {ex.submit(convert_one_pdf, p, out_dir, dpi, ext): p for p in pdfs}
+    # Shard by page range rather than by PDF so one long document does not dominate a
+    # single worker; rendering and image encoding are CPU-bound, so use processes
+    page_counts = {p: pdf_page_count(p) for p in pdfs}
+    tasks = plan_page_ranges(page_counts, args.jobs)
+    written = dict.fromkeys(pdfs, 0)
+    pending = dict.fromkeys(pdfs, 0)
+    for p, _, _ in tasks:
+        pending[p] += 1
+    for p in pdfs:
+        if not pending[p]:
+            report_pdf(p, 0, ext, fmt)
+
+    with futures.ProcessPoolExecutor(max_workers=max(1, args.jobs)) as ex:
+        futs = {ex.submit(convert_one_pdf, p, out_dir, dpi, ext, start, end, fmt): (p, start, end)
+                for p, start, end in tasks}
         for fut in futures.as_completed(futs):
-            p = futs[fut]
+            p, start, end = futs[fut]
             try:
-                n = fut.result()
-                total_pages += n
-                print(f"[DONE] {p.name}: {n} pages")
+                written[p] += fut.result()
             except Exception as e:
-                print(f"[FAIL] {p}: {e}", file=sys.stderr)
+                print(f"[FAIL] {p} pages {start+1}-{end}: {e}", file=sys.stderr)
+            pending[p] -= 1
+            if not pending[p]:
+                report_pdf(p, written[p], ext, fmt)
 
+    total_pages = sum(written.values())
     print(f"[SUMMARY] PDFs: {len(pdfs)} | Images written: {total_pages} | Output: {out_dir}")
 
 if __name__ == "__main__":
+    freeze_support()
     main()
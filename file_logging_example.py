@@ -4,6 +4,7 @@ Simple example of saving debug output to a log file.
 This script demonstrates how to set up file logging for the Perplexity WebUI Scraper.
 """
 
+from collections import deque
 import logging
 from os import getenv
 from pathlib import Path
@@ -62,25 +63,30 @@ def main():
             print(f"✓ Debug log saved: {log_file}")
             print(f"✓ File size: {file_size:,} bytes")
 
-            # Count lines in log file
+            # Count lines and keep the first/last 3 in a single pass over the file
+            head = []
+            tail = deque(maxlen=3)
+            line_count = 0
             with open(log_file, 'r', encoding='utf-8') as f:
-                line_count = sum(1 for _ in f)
+                for line in f:
+                    line_count += 1
+                    if line_count <= 3:
+                        head.append(line)
+                    tail.append(line)
             print(f"✓ Log entries: {line_count} lines")
             print()
 
             # Show sample of log content
             print("Sample log entries:")
             print("-" * 30)
-            with open(log_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                # Show first 3 and last 3 lines
-                for i, line in enumerate(lines[:3]):
-                    print(f"{i+1:3d}: {line.rstrip()}")
+            # Show first 3 and last 3 lines
+            for i, line in enumerate(head):
+                print(f"{i+1:3d}: {line.rstrip()}")
 
-                if len(lines) > 6:
-                    print("    ... (more entries in between)")
-                    for i, line in enumerate(lines[-3:], len(lines)-2):
-                        print(f"{i:3d}: {line.rstrip()}")
+            if line_count > 6:
+                print("    ... (more entries in between)")
+                for i, line in enumerate(tail, line_count-2):
+                    print(f"{i:3d}: {line.rstrip()}")
 
             print("-" * 30)
             print()
@@ -93,7 +99,7 @@ def main():
 
     except Exception as e:
         print(f"❌ Error during query: {e}")
-        logger.error(f"Query failed: {e}")
+        logger.error("Query failed: %s", e)
 
 
 if __name__ == "__main__":
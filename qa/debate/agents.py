@@ -2,442 +2,327 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import hashlib
+import logging
 import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Sequence
+from typing import Any, Callable, Hashable, Iterator, Sequence
 
-from .prompts import DebateTurn, format_history, HUGGING_DEBATER_PROMPT, PERPLEXITY_DEBATER_PROMPT, WRITER_DEBATER_PROMPT, ASK_QUESTIONS_DEBATER_PROMPT, ANSWER_QUESTIONS_DEBATER_PROMPT, INTEGRATION_EXPERT_DEBATER_PROMPT, FUNCTIONAL_SPEC_DEBATER_PROMPT, TECHNICAL_SPEC_DEBATER_PROMPT, CONFIGURATION_AGENT_PROMPT, DATA_MIGRATION_AGENT_PROMPT, REPORTING_AGENT_PROMPT, SECURITY_AGENT_PROMPT, TESTING_AGENT_PROMPT, CHANGE_MGMT_AGENT_PROMPT, MONITORING_AGENT_PROMPT, LEARNING_AGENT_PROMPT, METADATA_EXTRACT_AGENT_PROMPT, INTERNET_RESEARCH_AGENT_PROMPT, CRITIQUE_AGENT_PROMPT, COMPRESSION_AGENT_PROMPT, TODO_AGENT_PROMPT, MR_PROMPT_BUILDER_AGENT_PROMPT
-from .clients import HuggingFaceClient, PerplexityClient
+import orjson
+
+from .prompts import DebateTurn, format_history, render_prompt, HUGGING_DEBATER_PROMPT, PERPLEXITY_DEBATER_PROMPT, WRITER_DEBATER_PROMPT, ASK_QUESTIONS_DEBATER_PROMPT, ANSWER_QUESTIONS_DEBATER_PROMPT, INTEGRATION_EXPERT_DEBATER_PROMPT, FUNCTIONAL_SPEC_DEBATER_PROMPT, TECHNICAL_SPEC_DEBATER_PROMPT, CONFIGURATION_AGENT_PROMPT, DATA_MIGRATION_AGENT_PROMPT, REPORTING_AGENT_PROMPT, SECURITY_AGENT_PROMPT, TESTING_AGENT_PROMPT, CHANGE_MGMT_AGENT_PROMPT, MONITORING_AGENT_PROMPT, LEARNING_AGENT_PROMPT, METADATA_EXTRACT_AGENT_PROMPT, INTERNET_RESEARCH_AGENT_PROMPT, CRITIQUE_AGENT_PROMPT, COMPRESSION_AGENT_PROMPT, TODO_AGENT_PROMPT, MR_PROMPT_BUILDER_AGENT_PROMPT
+
+logger = logging.getLogger(__name__)
 
 
 class DebateAgent:
+    __slots__ = ("name", "stance", "persona")
+
     def __init__(self, name: str, stance: str, persona: str) -> None:
-        self.name = name
-        self.stance = stance
-        self.persona = persona
+        self.name = sys.intern(name)
+        self.stance = sys.intern(stance)
+        self.persona = sys.intern(persona)
 
-    def _build_prompt(self, topic: str, history: Sequence[DebateTurn], opponent: "DebateAgent") -> str:
+    def _build_prompt(self, topic: str, history: Sequence[DebateTurn], conversation: str | None = None) -> str:
         raise NotImplementedError
 
-    def respond(self, topic: str, history: Sequence[DebateTurn], opponent: "DebateAgent") -> str:
+    def respond(self, topic: str, history: Sequence[DebateTurn], opponent: "DebateAgent | None" = None, conversation: str | None = None, *, bypass_cache: bool = False) -> str:
         raise NotImplementedError
 
-
-class HuggingDebater(DebateAgent):
-    def __init__(self, client: HuggingFaceClient) -> None:
-        super().__init__("Hugging", "defend the proposition", "a pragmatic solution architect")
-        self._client = client
-
-    def _build_prompt(self, topic: str, history: Sequence[DebateTurn], opponent: "DebateAgent") -> str:
-        conversation = format_history(history)
-        prompt = HUGGING_DEBATER_PROMPT.format(topic=topic, conversation=conversation)
-        print(f"[DEBUG] {self.name}._build_prompt: SOLUTION_ARCHITECT prompt, length={len(prompt)}, history_turns={len(history)}", file=sys.stderr)
-        return prompt
-
-    def respond(self, topic: str, history: Sequence[DebateTurn], opponent: DebateAgent) -> str:
-        print(f"[DEBUG] HuggingDebater.respond: building prompt", file=sys.stderr)
-        prompt = self._build_prompt(topic, history, opponent)
-        print(f"[DEBUG] HuggingDebater.respond: calling API with client config (URL: {self._client.config.url}, Model: {self._client.config.model})", file=sys.stderr)
-        return self._client.call_api(prompt)
-
-
-class PerplexityDebater(DebateAgent):
-    def __init__(self, client: PerplexityClient) -> None:
-        super().__init__("Perplexity", "challenge the proposition", "an investigative strategist")
-        self._client = client
-
-    def _build_prompt(self, topic: str, history: Sequence[DebateTurn], opponent: "DebateAgent") -> str:
-        conversation = format_history(history)
-        prompt = PERPLEXITY_DEBATER_PROMPT.format(topic=topic, conversation=conversation)
-        print(f"[DEBUG] {self.name}._build_prompt: FACT_CHECK prompt, length={len(prompt)}, history_turns={len(history)}", file=sys.stderr)
-        return prompt
-
-    def respond(self, topic: str, history: Sequence[DebateTurn], opponent: DebateAgent) -> str:
-        print(f"[DEBUG] PerplexityDebater.respond: building prompt", file=sys.stderr)
-        prompt = self._build_prompt(topic, history, opponent)
-        return self._client.call_api(prompt)
-
-
-class WriterDebater(DebateAgent):
-    def __init__(self, client: HuggingFaceClient) -> None:
-        super().__init__("Writer", "synthesize and summarize", "a technical writer")
-        self._client = client
-
-    def _build_prompt(self, topic: str, history: Sequence[DebateTurn], opponent: "DebateAgent") -> str:
-        conversation = format_history(history)
-        prompt = WRITER_DEBATER_PROMPT.format(topic=topic, conversation=conversation)
-        print(f"[DEBUG] {self.name}._build_prompt: TECHNICAL_WRITER prompt, length={len(prompt)}, history_turns={len(history)}", file=sys.stderr)
-        return prompt
-
-    def respond(self, topic: str, history: Sequence[DebateTurn], opponent: DebateAgent) -> str:
-        print(f"[DEBUG] WriterDebater.respond: building prompt", file=sys.stderr)
-        prompt = self._build_prompt(topic, history, opponent)
-        print(f"[DEBUG] WriterDebater.respond: calling API with client config (URL: {self._client.config.url}, Model: {self._client.config.model})", file=sys.stderr)
-        return self._client.call_api(prompt)
-
-
-class AskQuestionsDebater(DebateAgent):
-    def __init__(self, client: HuggingFaceClient) -> None:
-        super().__init__("AskQuestions", "ask clarifying questions", "a curious inquirer")
-        self._client = client
-
-    def _build_prompt(self, topic: str, history: Sequence[DebateTurn], opponent: "DebateAgent") -> str:
-        conversation = format_history(history)
-        prompt = ASK_QUESTIONS_DEBATER_PROMPT.format(topic=topic, conversation=conversation)
-        print(f"[DEBUG] {self.name}._build_prompt: ASK_QUESTIONS prompt, length={len(prompt)}, history_turns={len(history)}", file=sys.stderr)
-        return prompt
-
-    def respond(self, topic: str, history: Sequence[DebateTurn], opponent: DebateAgent) -> str:
-        print(f"[DEBUG] AskQuestionsDebater.respond: building prompt", file=sys.stderr)
-        prompt = self._build_prompt(topic, history, opponent)
-        print(f"[DEBUG] AskQuestionsDebater.respond: calling API with client config (URL: {self._client.config.url}, Model: {self._client.config.model})", file=sys.stderr)
-        return self._client.call_api(prompt)
-
-
-class AnswerQuestionsDebater(DebateAgent):
-    def __init__(self, client: HuggingFaceClient) -> None:
-        super().__init__("AnswerQuestions", "answer questions", "a knowledgeable responder")
-        self._client = client
-
-    def _build_prompt(self, topic: str, history: Sequence[DebateTurn], opponent: "DebateAgent") -> str:
-        conversation = format_history(history)
-        prompt = ANSWER_QUESTIONS_DEBATER_PROMPT.format(topic=topic, conversation=conversation)
-        print(f"[DEBUG] {self.name}._build_prompt: ANSWER_QUESTIONS prompt, length={len(prompt)}, history_turns={len(history)}", file=sys.stderr)
-        return prompt
-
-    def respond(self, topic: str, history: Sequence[DebateTurn], opponent: DebateAgent) -> str:
-        print(f"[DEBUG] AnswerQuestionsDebater.respond: building prompt", file=sys.stderr)
-        prompt = self._build_prompt(topic, history, opponent)
-        print(f"[DEBUG] AnswerQuestionsDebater.respond: calling API with client config (URL: {self._client.config.url}, Model: {self._client.config.model})", file=sys.stderr)
-        return self._client.call_api(prompt)
-
-
-class IntegrationExpertDebater(DebateAgent):
-    def __init__(self, client: HuggingFaceClient) -> None:
-        super().__init__("IntegrationExpert", "provide integration architecture expertise", "a senior SAP Integration Architect")
+    async def arespond(self, topic: str, history: Sequence[DebateTurn], opponent: "DebateAgent | None" = None, conversation: str | None = None, *, bypass_cache: bool = False) -> str:
+        """Run ``respond`` on a worker thread so several agents can wait on their APIs at once."""
+        return await asyncio.to_thread(self.respond, topic, history, opponent, conversation, bypass_cache=bypass_cache)
+
+    def respond_stream(self, topic: str, history: Sequence[DebateTurn], opponent: "DebateAgent | None" = None, conversation: str | None = None, *, bypass_cache: bool = False) -> Iterator[str]:
+        """Yield the response in pieces; agents without a streaming client yield it whole."""
+        yield self.respond(topic, history, opponent, conversation, bypass_cache=bypass_cache)
+
+
+# Exact-match cache of client responses, keyed on (client cache key, prompt digest).
+PROMPT_CACHE_SIZE = 1024
+
+_prompt_cache: OrderedDict[tuple[Hashable, str], str] = OrderedDict()
+_prompt_cache_lock = threading.Lock()
+_inflight: dict[tuple[Hashable, str], Future[str]] = {}
+
+
+def _prompt_key(client: Any, prompt: str) -> tuple[Hashable, str]:
+    # Clients expose a stable ``cache_key`` (endpoint settings or session token). Others are
+    # keyed on the object itself, which the entry keeps alive, so its id is never reused.
+    return getattr(client, "cache_key", client), hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _cache_get(key: tuple[Hashable, str]) -> str | None:
+    with _prompt_cache_lock:
+        cached = _prompt_cache.get(key)
+        if cached is not None:
+            _prompt_cache.move_to_end(key)
+        return cached
+
+
+def _cache_put(key: tuple[Hashable, str], response: str) -> None:
+    with _prompt_cache_lock:
+        _prompt_cache[key] = response
+        _prompt_cache.move_to_end(key)
+        while len(_prompt_cache) > PROMPT_CACHE_SIZE:
+            _prompt_cache.popitem(last=False)
+
+
+def cached_call(client: Any, prompt: str, *, bypass_cache: bool = False) -> str:
+    """
+    Return ``client.call_api(prompt)``, reusing the answer for a prompt already
+    sent to the same client. ``bypass_cache`` forces a fresh call and refreshes the entry.
+    Concurrent callers with the same key share one in-flight request.
+    """
+    return _cached_call(client, prompt, bypass_cache=bypass_cache)[0]
+
+
+def _cached_call(client: Any, prompt: str, *, bypass_cache: bool = False) -> tuple[str, bool]:
+    """``cached_call`` that also reports whether this caller made the API call itself."""
+    key = _prompt_key(client, prompt)
+    with _prompt_cache_lock:
+        if not bypass_cache:
+            cached = _prompt_cache.get(key)
+            if cached is not None:
+                _prompt_cache.move_to_end(key)
+                return cached, False
+        pending = _inflight.get(key)
+        leader = pending is None
+        if leader:
+            pending = _inflight[key] = Future()
+    if not leader:
+        logger.debug("cached_call: joining in-flight request for identical prompt")
+        return pending.result(), False
+    try:
+        response = client.call_api(prompt)
+    except BaseException as exc:
+        pending.set_exception(exc)
+        raise
+    else:
+        _cache_put(key, response)
+        pending.set_result(response)
+        return response, True
+    finally:
+        with _prompt_cache_lock:
+            _inflight.pop(key, None)
+
+
+def clear_prompt_cache() -> None:
+    with _prompt_cache_lock:
+        _prompt_cache.clear()
+
+
+@dataclass(frozen=True, slots=True)
+class AgentSpec:
+    """Everything that distinguishes one debate agent from another."""
+
+    name: str
+    stance: str
+    persona: str
+    prompt_template: str
+    log_label: str
+    post_process: Callable[[str], str] | None = None
+
+
+# Prompts depend only on (template, topic, conversation); the opponent never enters them,
+# so an agent asked again in the same round reuses its rendered prompt.
+@lru_cache(maxsize=4)
+def _render_cached(template: str, topic: str, conversation: str) -> str:
+    return render_prompt(template, topic, conversation)
+
+
+class GenericAgent(DebateAgent):
+    """Debate agent driven entirely by an ``AgentSpec``; works with any client exposing ``call_api``."""
+
+    __slots__ = ("spec", "kind", "_client")
+
+    def __init__(self, spec: AgentSpec, client: Any, kind: str = "GenericAgent") -> None:
+        super().__init__(spec.name, spec.stance, spec.persona)
+        self.spec = spec
+        self.kind = kind
         self._client = client
 
-    def _build_prompt(self, topic: str, history: Sequence[DebateTurn], opponent: "DebateAgent") -> str:
-        conversation = format_history(history)
-        prompt = INTEGRATION_EXPERT_DEBATER_PROMPT.format(topic=topic, conversation=conversation)
-        print(f"[DEBUG] {self.name}._build_prompt: INTEGRATION_EXPERT prompt, length={len(prompt)}, history_turns={len(history)}", file=sys.stderr)
-        return prompt
-
-    def respond(self, topic: str, history: Sequence[DebateTurn], opponent: DebateAgent) -> str:
-        print(f"[DEBUG] IntegrationExpertDebater.respond: building prompt", file=sys.stderr)
-        prompt = self._build_prompt(topic, history, opponent)
-        print(f"[DEBUG] IntegrationExpertDebater.respond: calling API with client config (URL: {self._client.config.url}, Model: {self._client.config.model})", file=sys.stderr)
-        return self._client.call_api(prompt)
-
-
-class FunctionalSpecDebater(DebateAgent):
-    def __init__(self, client: HuggingFaceClient) -> None:
-        super().__init__("FunctionalSpec", "provide functional specifications", "a senior SAP Functional Analyst")
-        self._client = client
-
-    def _build_prompt(self, topic: str, history: Sequence[DebateTurn], opponent: "DebateAgent") -> str:
-        conversation = format_history(history)
-        prompt = FUNCTIONAL_SPEC_DEBATER_PROMPT.format(topic=topic, conversation=conversation)
-        print(f"[DEBUG] {self.name}._build_prompt: FUNCTIONAL_SPEC prompt, length={len(prompt)}, history_turns={len(history)}", file=sys.stderr)
-        return prompt
-
-    def respond(self, topic: str, history: Sequence[DebateTurn], opponent: DebateAgent) -> str:
-        print(f"[DEBUG] FunctionalSpecDebater.respond: building prompt", file=sys.stderr)
-        prompt = self._build_prompt(topic, history, opponent)
-        print(f"[DEBUG] FunctionalSpecDebater.respond: calling API with client config (URL: {self._client.config.url}, Model: {self._client.config.model})", file=sys.stderr)
-        return self._client.call_api(prompt)
-
-
-class TechnicalSpecDebater(DebateAgent):
-    def __init__(self, client: HuggingFaceClient) -> None:
-        super().__init__("TechnicalSpec", "provide technical specifications", "a senior SAP Technical Architect")
-        self._client = client
-
-    def _build_prompt(self, topic: str, history: Sequence[DebateTurn], opponent: "DebateAgent") -> str:
-        conversation = format_history(history)
-        prompt = TECHNICAL_SPEC_DEBATER_PROMPT.format(topic=topic, conversation=conversation)
-        print(f"[DEBUG] {self.name}._build_prompt: TECHNICAL_SPEC prompt, length={len(prompt)}, history_turns={len(history)}", file=sys.stderr)
-        return prompt
-
-    def respond(self, topic: str, history: Sequence[DebateTurn], opponent: DebateAgent) -> str:
-        print(f"[DEBUG] TechnicalSpecDebater.respond: building prompt", file=sys.stderr)
-        prompt = self._build_prompt(topic, history, opponent)
-        print(f"[DEBUG] TechnicalSpecDebater.respond: calling API with client config (URL: {self._client.config.url}, Model: {self._client.config.model})", file=sys.stderr)
-        return self._client.call_api(prompt)
-
-
-class ConfigurationAgent(DebateAgent):
-    def __init__(self, client: HuggingFaceClient) -> None:
-        super().__init__("Configuration", "handle module configuration", "a senior SAP SuccessFactors Configuration Specialist")
-        self._client = client
+    @property
+    def client(self) -> Any:
+        return self._client
 
-    def _build_prompt(self, topic: str, history: Sequence[DebateTurn], opponent: "DebateAgent") -> str:
-        conversation = format_history(history)
-        prompt = CONFIGURATION_AGENT_PROMPT.format(topic=topic, conversation=conversation)
-        print(f"[DEBUG] {self.name}._build_prompt: CONFIGURATION_AGENT prompt, length={len(prompt)}, history_turns={len(history)}", file=sys.stderr)
+    def _build_prompt(self, topic: str, history: Sequence[DebateTurn], conversation: str | None = None) -> str:
+        if conversation is None:
+            conversation = format_history(history)
+        prompt = _render_cached(self.spec.prompt_template, topic, conversation)
+        logger.debug("%s._build_prompt: %s prompt, length=%d, history_turns=%d", self.name, self.spec.log_label, len(prompt), len(history))
         return prompt
 
-    def respond(self, topic: str, history: Sequence[DebateTurn], opponent: DebateAgent) -> str:
-        print(f"[DEBUG] ConfigurationAgent.respond: building prompt", file=sys.stderr)
-        prompt = self._build_prompt(topic, history, opponent)
-        print(f"[DEBUG] ConfigurationAgent.respond: calling API with client config (URL: {self._client.config.url}, Model: {self._client.config.model})", file=sys.stderr)
-        return self._client.call_api(prompt)
-
-
-class DataMigrationAgent(DebateAgent):
-    def __init__(self, client: HuggingFaceClient) -> None:
-        super().__init__("DataMigration", "handle data migration processes", "a senior SAP SuccessFactors Data Migration Specialist")
-        self._client = client
-
-    def _build_prompt(self, topic: str, history: Sequence[DebateTurn], opponent: "DebateAgent") -> str:
-        conversation = format_history(history)
-        prompt = DATA_MIGRATION_AGENT_PROMPT.format(topic=topic, conversation=conversation)
-        print(f"[DEBUG] {self.name}._build_prompt: DATA_MIGRATION_AGENT prompt, length={len(prompt)}, history_turns={len(history)}", file=sys.stderr)
-        return prompt
-
-    def respond(self, topic: str, history: Sequence[DebateTurn], opponent: DebateAgent) -> str:
-        print(f"[DEBUG] DataMigrationAgent.respond: building prompt", file=sys.stderr)
-        prompt = self._build_prompt(topic, history, opponent)
-        print(f"[DEBUG] DataMigrationAgent.respond: calling API with client config (URL: {self._client.config.url}, Model: {self._client.config.model})", file=sys.stderr)
-        return self._client.call_api(prompt)
-
-
-class ReportingAgent(DebateAgent):
-    def __init__(self, client: HuggingFaceClient) -> None:
-        super().__init__("Reporting", "build and optimize reports", "a senior SAP SuccessFactors Reporting Analyst")
-        self._client = client
-
-    def _build_prompt(self, topic: str, history: Sequence[DebateTurn], opponent: "DebateAgent") -> str:
-        conversation = format_history(history)
-        prompt = REPORTING_AGENT_PROMPT.format(topic=topic, conversation=conversation)
-        print(f"[DEBUG] {self.name}._build_prompt: REPORTING_AGENT prompt, length={len(prompt)}, history_turns={len(history)}", file=sys.stderr)
-        return prompt
-
-    def respond(self, topic: str, history: Sequence[DebateTurn], opponent: DebateAgent) -> str:
-        print(f"[DEBUG] ReportingAgent.respond: building prompt", file=sys.stderr)
-        prompt = self._build_prompt(topic, history, opponent)
-        print(f"[DEBUG] ReportingAgent.respond: calling API with client config (URL: {self._client.config.url}, Model: {self._client.config.model})", file=sys.stderr)
-        return self._client.call_api(prompt)
-
-
-class SecurityAgent(DebateAgent):
-    def __init__(self, client: HuggingFaceClient) -> None:
-        super().__init__("Security", "manage security and access", "a senior SAP SuccessFactors Security Architect")
-        self._client = client
-
-    def _build_prompt(self, topic: str, history: Sequence[DebateTurn], opponent: "DebateAgent") -> str:
-        conversation = format_history(history)
-        prompt = SECURITY_AGENT_PROMPT.format(topic=topic, conversation=conversation)
-        print(f"[DEBUG] {self.name}._build_prompt: SECURITY_AGENT prompt, length={len(prompt)}, history_turns={len(history)}", file=sys.stderr)
-        return prompt
-
-    def respond(self, topic: str, history: Sequence[DebateTurn], opponent: DebateAgent) -> str:
-        print(f"[DEBUG] SecurityAgent.respond: building prompt", file=sys.stderr)
-        prompt = self._build_prompt(topic, history, opponent)
-        print(f"[DEBUG] SecurityAgent.respond: calling API with client config (URL: {self._client.config.url}, Model: {self._client.config.model})", file=sys.stderr)
-        return self._client.call_api(prompt)
-
-
-class TestingAgent(DebateAgent):
-    def __init__(self, client: HuggingFaceClient) -> None:
-        super().__init__("Testing", "automate and manage testing processes", "a senior SAP SuccessFactors Quality Assurance Engineer")
-        self._client = client
-
-    def _build_prompt(self, topic: str, history: Sequence[DebateTurn], opponent: "DebateAgent") -> str:
-        conversation = format_history(history)
-        prompt = TESTING_AGENT_PROMPT.format(topic=topic, conversation=conversation)
-        print(f"[DEBUG] {self.name}._build_prompt: TESTING_AGENT prompt, length={len(prompt)}, history_turns={len(history)}", file=sys.stderr)
-        return prompt
-
-    def respond(self, topic: str, history: Sequence[DebateTurn], opponent: DebateAgent) -> str:
-        print(f"[DEBUG] TestingAgent.respond: building prompt", file=sys.stderr)
-        prompt = self._build_prompt(topic, history, opponent)
-        print(f"[DEBUG] TestingAgent.respond: calling API with client config (URL: {self._client.config.url}, Model: {self._client.config.model})", file=sys.stderr)
-        return self._client.call_api(prompt)
-
-
-class ChangeMgmtAgent(DebateAgent):
-    def __init__(self, client: HuggingFaceClient) -> None:
-        super().__init__("ChangeMgmt", "manage release and change processes", "a senior SAP SuccessFactors Change Management Specialist")
-        self._client = client
-
-    def _build_prompt(self, topic: str, history: Sequence[DebateTurn], opponent: "DebateAgent") -> str:
-        conversation = format_history(history)
-        prompt = CHANGE_MGMT_AGENT_PROMPT.format(topic=topic, conversation=conversation)
-        print(f"[DEBUG] {self.name}._build_prompt: CHANGE_MGMT_AGENT prompt, length={len(prompt)}, history_turns={len(history)}", file=sys.stderr)
-        return prompt
-
-    def respond(self, topic: str, history: Sequence[DebateTurn], opponent: DebateAgent) -> str:
-        print(f"[DEBUG] ChangeMgmtAgent.respond: building prompt", file=sys.stderr)
-        prompt = self._build_prompt(topic, history, opponent)
-        print(f"[DEBUG] ChangeMgmtAgent.respond: calling API with client config (URL: {self._client.config.url}, Model: {self._client.config.model})", file=sys.stderr)
-        return self._client.call_api(prompt)
-
-
-class MonitoringAgent(DebateAgent):
-    def __init__(self, client: HuggingFaceClient) -> None:
-        super().__init__("Monitoring", "monitor system health and performance", "a senior SAP SuccessFactors System Monitoring Specialist")
-        self._client = client
-
-    def _build_prompt(self, topic: str, history: Sequence[DebateTurn], opponent: "DebateAgent") -> str:
-        conversation = format_history(history)
-        prompt = MONITORING_AGENT_PROMPT.format(topic=topic, conversation=conversation)
-        print(f"[DEBUG] {self.name}._build_prompt: MONITORING_AGENT prompt, length={len(prompt)}, history_turns={len(history)}", file=sys.stderr)
-        return prompt
-
-    def respond(self, topic: str, history: Sequence[DebateTurn], opponent: DebateAgent) -> str:
-        print(f"[DEBUG] MonitoringAgent.respond: building prompt", file=sys.stderr)
-        prompt = self._build_prompt(topic, history, opponent)
-        print(f"[DEBUG] MonitoringAgent.respond: calling API with client config (URL: {self._client.config.url}, Model: {self._client.config.model})", file=sys.stderr)
-        return self._client.call_api(prompt)
-
-
-class LearningAgent(DebateAgent):
-    def __init__(self, client: HuggingFaceClient) -> None:
-        super().__init__("Learning", "manage Learning Management System", "a senior SAP SuccessFactors Learning Management Specialist")
-        self._client = client
-
-    def _build_prompt(self, topic: str, history: Sequence[DebateTurn], opponent: "DebateAgent") -> str:
-        conversation = format_history(history)
-        prompt = LEARNING_AGENT_PROMPT.format(topic=topic, conversation=conversation)
-        print(f"[DEBUG] {self.name}._build_prompt: LEARNING_AGENT prompt, length={len(prompt)}, history_turns={len(history)}", file=sys.stderr)
-        return prompt
-
-    def respond(self, topic: str, history: Sequence[DebateTurn], opponent: DebateAgent) -> str:
-        print(f"[DEBUG] LearningAgent.respond: building prompt", file=sys.stderr)
-        prompt = self._build_prompt(topic, history, opponent)
-        print(f"[DEBUG] LearningAgent.respond: calling API with client config (URL: {self._client.config.url}, Model: {self._client.config.model})", file=sys.stderr)
-        return self._client.call_api(prompt)
-
-
-class MetadataExtractAgent(DebateAgent):
-    def __init__(self, client: HuggingFaceClient) -> None:
-        super().__init__("MetadataExtract", "extract and analyze system metadata", "a senior SAP SuccessFactors Metadata Extraction Specialist")
-        self._client = client
-
-    def _build_prompt(self, topic: str, history: Sequence[DebateTurn], opponent: "DebateAgent") -> str:
-        conversation = format_history(history)
-        prompt = METADATA_EXTRACT_AGENT_PROMPT.format(topic=topic, conversation=conversation)
-        print(f"[DEBUG] {self.name}._build_prompt: METADATA_EXTRACT_AGENT prompt, length={len(prompt)}, history_turns={len(history)}", file=sys.stderr)
-        return prompt
-
-    def respond(self, topic: str, history: Sequence[DebateTurn], opponent: DebateAgent) -> str:
-        print(f"[DEBUG] MetadataExtractAgent.respond: building prompt", file=sys.stderr)
-        prompt = self._build_prompt(topic, history, opponent)
-        print(f"[DEBUG] MetadataExtractAgent.respond: calling API with client config (URL: {self._client.config.url}, Model: {self._client.config.model})", file=sys.stderr)
-        response = self._client.call_api(prompt)
-
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        meta_dir = Path("meta")
-        try:
-            meta_dir.mkdir(parents=True, exist_ok=True)
-            file_path = meta_dir / f"metadataextract_{timestamp}.txt"
-            with file_path.open("w", encoding="utf-8") as fh:
-                fh.write(response)
-        except Exception as exc:
-            print(f"[DEBUG] MetadataExtractAgent.respond: failed to save response: {exc!r}", file=sys.stderr)
-
+    def respond(self, topic: str, history: Sequence[DebateTurn], opponent: DebateAgent | None = None, conversation: str | None = None, *, bypass_cache: bool = False) -> str:
+        logger.debug("%s.respond: building prompt", self.kind)
+        prompt = self._build_prompt(topic, history, conversation)
+        config = getattr(self._client, "config", None)
+        if config is not None:
+            logger.debug("%s.respond: calling API with client config (URL: %s, Model: %s)", self.kind, config.url, config.model)
+        response, fresh = _cached_call(self._client, prompt, bypass_cache=bypass_cache)
+        logger.debug("%s.respond: response received, length=%d", self.kind, len(response))
+        # Post-processing may have side effects (e.g. saving extracts), so it runs once per API answer.
+        if fresh and self.spec.post_process is not None:
+            response = self.spec.post_process(response)
         return response
 
-
-class InternetResearchAgent(DebateAgent):
-    def __init__(self, client) -> None:  # Using generic client type as this can use either Perplexity or HuggingFace
-        super().__init__("InternetResearch", "conduct internet research", "an internet research specialist")
-        self._client = client
-
-    def _build_prompt(self, topic: str, history: Sequence[DebateTurn], opponent: "DebateAgent") -> str:
-        conversation = format_history(history)
-        prompt = INTERNET_RESEARCH_AGENT_PROMPT.format(topic=topic, conversation=conversation)
-        print(f"[DEBUG] {self.name}._build_prompt: INTERNET_RESEARCH_AGENT prompt, length={len(prompt)}, history_turns={len(history)}", file=sys.stderr)
-        return prompt
-
-    def respond(self, topic: str, history: Sequence[DebateTurn], opponent: DebateAgent) -> str:
-        print(f"[DEBUG] InternetResearchAgent.respond: building prompt", file=sys.stderr)
-        prompt = self._build_prompt(topic, history, opponent)
-        return self._client.call_api(prompt)
-
-
-class CritiqueAgent(DebateAgent):
-    def __init__(self, client: HuggingFaceClient) -> None:
-        super().__init__("Critique", "perform quality assurance review", "a senior SAP Quality Assurance Specialist")
-        self._client = client
-
-    def _build_prompt(self, topic: str, history: Sequence[DebateTurn], opponent: "DebateAgent") -> str:
-        conversation = format_history(history)
-        prompt = CRITIQUE_AGENT_PROMPT.format(topic=topic, conversation=conversation)
-        print(f"[DEBUG] {self.name}._build_prompt: CRITIQUE_AGENT prompt, length={len(prompt)}, history_turns={len(history)}", file=sys.stderr)
-        return prompt
-
-    def respond(self, topic: str, history: Sequence[DebateTurn], opponent: DebateAgent) -> str:
-        print(f"[DEBUG] CritiqueAgent.respond: building prompt", file=sys.stderr)
-        prompt = self._build_prompt(topic, history, opponent)
-        print(f"[DEBUG] CritiqueAgent.respond: calling API with client config (URL: {self._client.config.url}, Model: {self._client.config.model})", file=sys.stderr)
-        return self._client.call_api(prompt)
-
-
-class CompressionAgent(DebateAgent):
-    def __init__(self, client: HuggingFaceClient) -> None:
-        super().__init__("Compression", "summarize conversation history", "a conversation compression specialist")
-        self._client = client
-
-    def _build_prompt(self, topic: str, history: Sequence[DebateTurn], opponent: "DebateAgent") -> str:
-        conversation = format_history(history)
-        prompt = COMPRESSION_AGENT_PROMPT.format(topic=topic, conversation=conversation)
-        print(f"[DEBUG] {self.name}._build_prompt: COMPRESSION_AGENT prompt, length={len(prompt)}, history_turns={len(history)}", file=sys.stderr)
-        return prompt
-
-    def respond(self, topic: str, history: Sequence[DebateTurn], opponent: DebateAgent) -> str:
-        print(f"[DEBUG] CompressionAgent.respond: building prompt", file=sys.stderr)
-        prompt = self._build_prompt(topic, history, opponent)
-        print(f"[DEBUG] CompressionAgent.respond: calling API with client config (URL: {self._client.config.url}, Model: {self._client.config.model})", file=sys.stderr)
-        response = self._client.call_api(prompt)
-
-        # Check if this is a request to compress and reset the conversation
-        if "RESET_CONVERSATION" in response.upper():
-            print(f"[DEBUG] CompressionAgent.respond: detected RESET_CONVERSATION request", file=sys.stderr)
-            # Extract the compressed summary and indicate reset is needed
-            # For now, we'll just return the response as-is and let the core logic handle the reset
-            pass
-
-        return response
-
-
-class TodoAgent(DebateAgent):
-    def __init__(self, client: HuggingFaceClient) -> None:
-        super().__init__("Todo", "generate todo lists from discussions", "a task management specialist")
-        self._client = client
-
-    def _build_prompt(self, topic: str, history: Sequence[DebateTurn], opponent: "DebateAgent") -> str:
-        conversation = format_history(history)
-        prompt = TODO_AGENT_PROMPT.format(topic=topic, conversation=conversation)
-        print(f"[DEBUG] {self.name}._build_prompt: TODO_AGENT prompt, length={len(prompt)}, history_turns={len(history)}", file=sys.stderr)
-        return prompt
-
-    def respond(self, topic: str, history: Sequence[DebateTurn], opponent: DebateAgent) -> str:
-        print(f"[DEBUG] TodoAgent.respond: building prompt", file=sys.stderr)
-        prompt = self._build_prompt(topic, history, opponent)
-        print(f"[DEBUG] TodoAgent.respond: calling API with client config (URL: {self._client.config.url}, Model: {self._client.config.model})", file=sys.stderr)
-
-        response = self._client.call_api(prompt)
-        print(f"[DEBUG] TodoAgent.respond: response received, length={len(response)}", file=sys.stderr)
-
-        return response
-
-
-class MrPromptBuilderAgent(DebateAgent):
-    def __init__(self, client: HuggingFaceClient) -> None:
-        super().__init__("MrPromptBuilder", "craft and optimize prompts for various use cases", "a senior prompt engineering specialist")
-        self._client = client
-
-    def _build_prompt(self, topic: str, history: Sequence[DebateTurn], opponent: "DebateAgent") -> str:
-        conversation = format_history(history)
-        prompt = MR_PROMPT_BUILDER_AGENT_PROMPT.format(topic=topic, conversation=conversation)
-        print(f"[DEBUG] {self.name}._build_prompt: MR_PROMPT_BUILDER_AGENT prompt, length={len(prompt)}, history_turns={len(history)}", file=sys.stderr)
-        return prompt
-
-    def respond(self, topic: str, history: Sequence[DebateTurn], opponent: DebateAgent) -> str:
-        print(f"[DEBUG] MrPromptBuilderAgent.respond: building prompt", file=sys.stderr)
-        prompt = self._build_prompt(topic, history, opponent)
-        print(f"[DEBUG] MrPromptBuilderAgent.respond: calling API with client config (URL: {self._client.config.url}, Model: {self._client.config.model})", file=sys.stderr)
-        return self._client.call_api(prompt)
+    def respond_stream(self, topic: str, history: Sequence[DebateTurn], opponent: DebateAgent | None = None, conversation: str | None = None, *, bypass_cache: bool = False) -> Iterator[str]:
+        """
+        Yield the response as the client produces it; ``post_process`` sees the full text
+        once a fresh stream ends. A cached ``respond`` answer is served whole, without
+        post-processing again. Streamed text is not cached: a stream may skip rewrites
+        that ``call_api`` would return.
+        """
+        call_api_stream = getattr(self._client, "call_api_stream", None)
+        if call_api_stream is None:
+            yield self.respond(topic, history, opponent, conversation, bypass_cache=bypass_cache)
+            return
+        logger.debug("%s.respond_stream: building prompt", self.kind)
+        prompt = self._build_prompt(topic, history, conversation)
+        key = _prompt_key(self._client, prompt)
+        response = None if bypass_cache else _cache_get(key)
+        if response is not None:
+            yield response
+            return
+        parts: list[str] = []
+        for piece in call_api_stream(prompt):
+            parts.append(piece)
+            yield piece
+        response = "".join(parts).strip()
+        logger.debug("%s.respond_stream: response received, length=%d", self.kind, len(response))
+        if self.spec.post_process is not None:
+            self.spec.post_process(response)
+
+
+# Metadata extracts are buffered and appended to one JSONL file per session; a
+# single background worker keeps the appends in order.
+META_FLUSH_EVERY = 8
+_IO_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="debate-io")
+_META_DIR = Path("meta")
+_META_SESSION_FILE = _META_DIR / f"metadataextract_session_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+_meta_dir_ready = False
+_meta_pending: list[tuple[str, str]] = []
+_meta_lock = threading.Lock()
+
+
+def _write_meta(batch: list[tuple[str, str]]) -> None:
+    global _meta_dir_ready
+    if not batch:
+        return
+    try:
+        if not _meta_dir_ready:
+            _META_DIR.mkdir(parents=True, exist_ok=True)
+            _meta_dir_ready = True
+        payload = b"".join(
+            orjson.dumps({"ts": ts, "body": body}, option=orjson.OPT_APPEND_NEWLINE) for ts, body in batch
+        )
+        with open(_META_SESSION_FILE, "ab") as fh:
+            fh.write(payload)
+    except Exception as exc:
+        logger.debug("MetadataExtractAgent.respond: failed to save %d responses: %r", len(batch), exc)
+
+
+def flush_metadata_extracts() -> None:
+    """Write any buffered metadata extracts now; also runs at interpreter exit."""
+    with _meta_lock:
+        batch = _meta_pending[:]
+        _meta_pending.clear()
+    _write_meta(batch)
+
+
+atexit.register(flush_metadata_extracts)
+
+
+def _save_metadata_extract(response: str) -> str:
+    """Buffer a timestamped copy of every metadata extraction for the session file under ``meta/``."""
+    with _meta_lock:
+        _meta_pending.append((datetime.now().isoformat(timespec="seconds"), response))
+        full = len(_meta_pending) >= META_FLUSH_EVERY
+    if full:
+        _IO_POOL.submit(flush_metadata_extracts)
+    return response
+
+
+def _note_compression_reset(response: str) -> str:
+    # The reset itself is handled by run_debate; the response is returned as-is.
+    if "RESET_CONVERSATION" in response.upper():
+        logger.debug("CompressionAgent.respond: detected RESET_CONVERSATION request")
+    return response
+
+
+AGENT_SPECS: dict[str, AgentSpec] = {
+    "HuggingDebater": AgentSpec("Hugging", "defend the proposition", "a pragmatic solution architect", HUGGING_DEBATER_PROMPT, "SOLUTION_ARCHITECT"),
+    "PerplexityDebater": AgentSpec("Perplexity", "challenge the proposition", "an investigative strategist", PERPLEXITY_DEBATER_PROMPT, "FACT_CHECK"),
+    "WriterDebater": AgentSpec("Writer", "synthesize and summarize", "a technical writer", WRITER_DEBATER_PROMPT, "TECHNICAL_WRITER"),
+    "AskQuestionsDebater": AgentSpec("AskQuestions", "ask clarifying questions", "a curious inquirer", ASK_QUESTIONS_DEBATER_PROMPT, "ASK_QUESTIONS"),
+    "AnswerQuestionsDebater": AgentSpec("AnswerQuestions", "answer questions", "a knowledgeable responder", ANSWER_QUESTIONS_DEBATER_PROMPT, "ANSWER_QUESTIONS"),
+    "IntegrationExpertDebater": AgentSpec("IntegrationExpert", "provide integration architecture expertise", "a senior SAP Integration Architect", INTEGRATION_EXPERT_DEBATER_PROMPT, "INTEGRATION_EXPERT"),
+    "FunctionalSpecDebater": AgentSpec("FunctionalSpec", "provide functional specifications", "a senior SAP Functional Analyst", FUNCTIONAL_SPEC_DEBATER_PROMPT, "FUNCTIONAL_SPEC"),
+    "TechnicalSpecDebater": AgentSpec("TechnicalSpec", "provide technical specifications", "a senior SAP Technical Architect", TECHNICAL_SPEC_DEBATER_PROMPT, "TECHNICAL_SPEC"),
+    "ConfigurationAgent": AgentSpec("Configuration", "handle module configuration", "a senior SAP SuccessFactors Configuration Specialist", CONFIGURATION_AGENT_PROMPT, "CONFIGURATION_AGENT"),
+    "DataMigrationAgent": AgentSpec("DataMigration", "handle data migration processes", "a senior SAP SuccessFactors Data Migration Specialist", DATA_MIGRATION_AGENT_PROMPT, "DATA_MIGRATION_AGENT"),
+    "ReportingAgent": AgentSpec("Reporting", "build and optimize reports", "a senior SAP SuccessFactors Reporting Analyst", REPORTING_AGENT_PROMPT, "REPORTING_AGENT"),
+    "SecurityAgent": AgentSpec("Security", "manage security and access", "a senior SAP SuccessFactors Security Architect", SECURITY_AGENT_PROMPT, "SECURITY_AGENT"),
+    "TestingAgent": AgentSpec("Testing", "automate and manage testing processes", "a senior SAP SuccessFactors Quality Assurance Engineer", TESTING_AGENT_PROMPT, "TESTING_AGENT"),
+    "ChangeMgmtAgent": AgentSpec("ChangeMgmt", "manage release and change processes", "a senior SAP SuccessFactors Change Management Specialist", CHANGE_MGMT_AGENT_PROMPT, "CHANGE_MGMT_AGENT"),
+    "MonitoringAgent": AgentSpec("Monitoring", "monitor system health and performance", "a senior SAP SuccessFactors System Monitoring Specialist", MONITORING_AGENT_PROMPT, "MONITORING_AGENT"),
+    "LearningAgent": AgentSpec("Learning", "manage Learning Management System", "a senior SAP SuccessFactors Learning Management Specialist", LEARNING_AGENT_PROMPT, "LEARNING_AGENT"),
+    "MetadataExtractAgent": AgentSpec("MetadataExtract", "extract and analyze system metadata", "a senior SAP SuccessFactors Metadata Extraction Specialist", METADATA_EXTRACT_AGENT_PROMPT, "METADATA_EXTRACT_AGENT", post_process=_save_metadata_extract),
+    "InternetResearchAgent": AgentSpec("InternetResearch", "conduct internet research", "an internet research specialist", INTERNET_RESEARCH_AGENT_PROMPT, "INTERNET_RESEARCH_AGENT"),
+    "CritiqueAgent": AgentSpec("Critique", "perform quality assurance review", "a senior SAP Quality Assurance Specialist", CRITIQUE_AGENT_PROMPT, "CRITIQUE_AGENT"),
+    "CompressionAgent": AgentSpec("Compression", "summarize conversation history", "a conversation compression specialist", COMPRESSION_AGENT_PROMPT, "COMPRESSION_AGENT", post_process=_note_compression_reset),
+    "TodoAgent": AgentSpec("Todo", "generate todo lists from discussions", "a task management specialist", TODO_AGENT_PROMPT, "TODO_AGENT"),
+    "MrPromptBuilderAgent": AgentSpec("MrPromptBuilder", "craft and optimize prompts for various use cases", "a senior prompt engineering specialist", MR_PROMPT_BUILDER_AGENT_PROMPT, "MR_PROMPT_BUILDER_AGENT"),
+}
+
+
+def _agent_class(kind: str) -> type[GenericAgent]:
+    spec = AGENT_SPECS[kind]
+
+    def __init__(self: GenericAgent, client: Any) -> None:
+        GenericAgent.__init__(self, spec, client, kind)
+
+    namespace = {"__slots__": (), "__init__": __init__, "__module__": __name__, "__doc__": f"The {spec.name} agent; ``{kind}(client)``."}
+    return type(kind, (GenericAgent,), namespace)
+
+
+# One GenericAgent subclass per spec, bound to it, so the former class names still
+# construct, subclass and work with ``isinstance``.
+AGENT_CLASSES: dict[str, type[GenericAgent]] = {kind: _agent_class(kind) for kind in AGENT_SPECS}
+
+
+def make_agent(kind: str, client: Any) -> GenericAgent:
+    """Build the agent registered under ``kind`` in ``AGENT_SPECS``."""
+    return AGENT_CLASSES[kind](client)
+
+
+HuggingDebater = AGENT_CLASSES["HuggingDebater"]
+PerplexityDebater = AGENT_CLASSES["PerplexityDebater"]
+WriterDebater = AGENT_CLASSES["WriterDebater"]
+AskQuestionsDebater = AGENT_CLASSES["AskQuestionsDebater"]
+AnswerQuestionsDebater = AGENT_CLASSES["AnswerQuestionsDebater"]
+IntegrationExpertDebater = AGENT_CLASSES["IntegrationExpertDebater"]
+FunctionalSpecDebater = AGENT_CLASSES["FunctionalSpecDebater"]
+TechnicalSpecDebater = AGENT_CLASSES["TechnicalSpecDebater"]
+ConfigurationAgent = AGENT_CLASSES["ConfigurationAgent"]
+DataMigrationAgent = AGENT_CLASSES["DataMigrationAgent"]
+ReportingAgent = AGENT_CLASSES["ReportingAgent"]
+SecurityAgent = AGENT_CLASSES["SecurityAgent"]
+TestingAgent = AGENT_CLASSES["TestingAgent"]
+ChangeMgmtAgent = AGENT_CLASSES["ChangeMgmtAgent"]
+MonitoringAgent = AGENT_CLASSES["MonitoringAgent"]
+LearningAgent = AGENT_CLASSES["LearningAgent"]
+MetadataExtractAgent = AGENT_CLASSES["MetadataExtractAgent"]
+InternetResearchAgent = AGENT_CLASSES["InternetResearchAgent"]
+CritiqueAgent = AGENT_CLASSES["CritiqueAgent"]
+CompressionAgent = AGENT_CLASSES["CompressionAgent"]
+TodoAgent = AGENT_CLASSES["TodoAgent"]
+MrPromptBuilderAgent = AGENT_CLASSES["MrPromptBuilderAgent"]
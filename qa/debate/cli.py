@@ -3,749 +3,285 @@
 from __future__ import annotations
 
 import argparse
+import logging
 import os
 import sys
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable
+from typing import TYPE_CHECKING, Any, Callable, Iterable
 
-from dotenv import load_dotenv
+from dotenv import find_dotenv, load_dotenv
+from generate_wricef_prompts import (
+    DEFAULT_API_URL as DEFAULT_HUGGING_URL,
+    DEFAULT_MODEL as DEFAULT_HUGGING_MODEL,
+    DEFAULT_TEMPERATURE as DEFAULT_HUGGING_TEMPERATURE,
+    ENV_TOKEN_KEY as HUGGING_TOKEN_ENV,
+)
 
-from .core import run_debate
-from .agents import HuggingDebater, PerplexityDebater, WriterDebater, AskQuestionsDebater, AnswerQuestionsDebater, IntegrationExpertDebater, FunctionalSpecDebater, TechnicalSpecDebater, ConfigurationAgent, DataMigrationAgent, ReportingAgent, SecurityAgent, TestingAgent, ChangeMgmtAgent, MonitoringAgent, LearningAgent, MetadataExtractAgent, InternetResearchAgent, CritiqueAgent, CompressionAgent, TodoAgent, MrPromptBuilderAgent
-from .clients import HuggingFaceClient, PerplexityClient, ApiConfig
+from .core import MAX_CONCURRENCY, run_debate
+from .clients import HuggingFaceClient, PerplexityClient, ApiConfig, close_clients, prewarm
 
+if TYPE_CHECKING:
+    from .agents import GenericAgent
 
-def build_hugging_config(args: argparse.Namespace) -> ApiConfig:
-    print("[DEBUG] build_hugging_config: checking token", file=sys.stderr)
-    from generate_wricef_prompts import ENV_TOKEN_KEY as HUGGING_TOKEN_ENV
-    token = args.hugging_token or os.getenv(HUGGING_TOKEN_ENV, "").strip()
-    if not token:
-        raise ValueError(
-            f"Hugging API token required. Provide --hugging-token or set {HUGGING_TOKEN_ENV}."
-        )
-    print(f"[DEBUG] build_hugging_config: token found, length={len(token)}", file=sys.stderr)
-    config = ApiConfig(
-        url=args.hugging_url,
-        token=token,
-        model=args.hugging_model,
-        temperature=args.hugging_temperature,
-        timeout=args.hugging_timeout,
-        include_raw=False,
-    )
-    print(f"[DEBUG] build_hugging_config: created config (url={config.url}, model={config.model}, temp={config.temperature})", file=sys.stderr)
-    return config
-
-
-def build_perplexity_agent(args: argparse.Namespace) -> PerplexityDebater:
-    print("[DEBUG] build_perplexity_agent: checking session token", file=sys.stderr)
-    session_token = (args.perplexity_token or os.getenv("PERPLEXITY_SESSION_TOKEN", "")).strip()
-    if not session_token:
-        raise ValueError("Perplexity session token required. Provide --perplexity-token or set PERPLEXITY_SESSION_TOKEN.")
-    print(f"[DEBUG] build_perplexity_agent: token found, length={len(session_token)}", file=sys.stderr)
-    client = PerplexityClient(session_token=session_token)
-    return PerplexityDebater(client)
-
-
-def build_writer_agent(args: argparse.Namespace) -> WriterDebater:
-    print("[DEBUG] build_writer_agent: checking token", file=sys.stderr)
-    from generate_wricef_prompts import (
-        DEFAULT_API_URL as DEFAULT_HUGGING_URL,
-        DEFAULT_MODEL as DEFAULT_HUGGING_MODEL,
-        ENV_TOKEN_KEY as HUGGING_TOKEN_ENV
-    )
-    token = args.writer_token or os.getenv("WRITER_TOKEN", "").strip() or os.getenv(HUGGING_TOKEN_ENV, "").strip()
-    if not token:
-        raise ValueError(
-            f"Writer API token required. Provide --writer-token or set WRITER_TOKEN or {HUGGING_TOKEN_ENV}."
-        )
-
-    # Check for writer-specific URL in environment
-    url = args.writer_url or os.getenv("WRITER_API_URL", "").strip()
-    if not url:
-        # If no URL provided via argument or environment, fall back to default
-        url = DEFAULT_HUGGING_URL
-
-    # Check for writer-specific model in environment
-    model = args.writer_model or os.getenv("WRITER_MODEL", "").strip() or DEFAULT_HUGGING_MODEL
-
-    print(f"[DEBUG] build_writer_agent: token found, length={len(token)}", file=sys.stderr)
-    config = ApiConfig(
-        url=url,
-        token=token,
-        model=model,
-        temperature=args.writer_temperature,
-        timeout=args.writer_timeout,
-        include_raw=False,
-    )
-    print(f"[DEBUG] build_writer_agent: created config (url={config.url}, model={config.model}, temp={config.temperature})", file=sys.stderr)
-    client = HuggingFaceClient(config=config)
-    return WriterDebater(client)
-
-
-def build_askquestions_agent(args: argparse.Namespace) -> AskQuestionsDebater:
-    print("[DEBUG] build_askquestions_agent: checking token", file=sys.stderr)
-    from generate_wricef_prompts import (
-        DEFAULT_API_URL as DEFAULT_HUGGING_URL,
-        DEFAULT_MODEL as DEFAULT_HUGGING_MODEL,
-        ENV_TOKEN_KEY as HUGGING_TOKEN_ENV
-    )
-    token = args.askquestions_token or os.getenv("ASKQUESTIONS_TOKEN", "").strip() or os.getenv(HUGGING_TOKEN_ENV, "").strip()
-    if not token:
-        raise ValueError(
-            f"AskQuestions API token required. Provide --askquestions-token or set ASKQUESTIONS_TOKEN or {HUGGING_TOKEN_ENV}."
-        )
-
-    # Check for askquestions-specific URL in environment
-    url = args.askquestions_url or os.getenv("ASKQUESTIONS_API_URL", "").strip()
-    if not url:
-        # If no URL provided via argument or environment, fall back to default
-        url = DEFAULT_HUGGING_URL
-
-    # Check for askquestions-specific model in environment
-    model = args.askquestions_model or os.getenv("ASKQUESTIONS_MODEL", "").strip() or DEFAULT_HUGGING_MODEL
-
-    print(f"[DEBUG] build_askquestions_agent: token found, length={len(token)}", file=sys.stderr)
-    config = ApiConfig(
-        url=url,
-        token=token,
-        model=model,
-        temperature=args.askquestions_temperature,
-        timeout=args.askquestions_timeout,
-        include_raw=False,
-    )
-    print(f"[DEBUG] build_askquestions_agent: created config (url={config.url}, model={config.model}, temp={config.temperature})", file=sys.stderr)
-    client = HuggingFaceClient(config=config)
-    return AskQuestionsDebater(client)
-
-
-def build_answerquestions_agent(args: argparse.Namespace) -> AnswerQuestionsDebater:
-    print("[DEBUG] build_answerquestions_agent: checking token", file=sys.stderr)
-    from generate_wricef_prompts import (
-        DEFAULT_API_URL as DEFAULT_HUGGING_URL,
-        DEFAULT_MODEL as DEFAULT_HUGGING_MODEL,
-        ENV_TOKEN_KEY as HUGGING_TOKEN_ENV
-    )
-    token = args.answerquestions_token or os.getenv("ANSWERQUESTIONS_TOKEN", "").strip() or os.getenv(HUGGING_TOKEN_ENV, "").strip()
-    if not token:
-        raise ValueError(
-            f"AnswerQuestions API token required. Provide --answerquestions-token or set ANSWERQUESTIONS_TOKEN or {HUGGING_TOKEN_ENV}."
-        )
-
-    # Check for answerquestions-specific URL in environment
-    url = args.answerquestions_url or os.getenv("ANSWERQUESTIONS_API_URL", "").strip()
-    if not url:
-        # If no URL provided via argument or environment, fall back to default
-        url = DEFAULT_HUGGING_URL
-
-    # Check for answerquestions-specific model in environment
-    model = args.answerquestions_model or os.getenv("ANSWERQUESTIONS_MODEL", "").strip() or DEFAULT_HUGGING_MODEL
-
-    print(f"[DEBUG] build_answerquestions_agent: token found, length={len(token)}", file=sys.stderr)
-    config = ApiConfig(
-        url=url,
-        token=token,
-        model=model,
-        temperature=args.answerquestions_temperature,
-        timeout=args.answerquestions_timeout,
-        include_raw=False,
-    )
-    print(f"[DEBUG] build_answerquestions_agent: created config (url={config.url}, model={config.model}, temp={config.temperature})", file=sys.stderr)
-    client = HuggingFaceClient(config=config)
-    return AnswerQuestionsDebater(client)
-
-
-def build_integrationexpert_agent(args: argparse.Namespace) -> IntegrationExpertDebater:
-    print("[DEBUG] build_integrationexpert_agent: checking token", file=sys.stderr)
-    from generate_wricef_prompts import (
-        DEFAULT_API_URL as DEFAULT_HUGGING_URL,
-        DEFAULT_MODEL as DEFAULT_HUGGING_MODEL,
-        ENV_TOKEN_KEY as HUGGING_TOKEN_ENV
-    )
-    token = args.integrationexpert_token or os.getenv("INTEGRATIONEXPERT_TOKEN", "").strip() or os.getenv(HUGGING_TOKEN_ENV, "").strip()
-    if not token:
-        raise ValueError(
-            f"IntegrationExpert API token required. Provide --integrationexpert-token or set INTEGRATIONEXPERT_TOKEN or {HUGGING_TOKEN_ENV}."
-        )
-
-    # Check for integrationexpert-specific URL in environment
-    url = args.integrationexpert_url or os.getenv("INTEGRATIONEXPERT_API_URL", "").strip()
-    if not url:
-        # If no URL provided via argument or environment, fall back to default
-        url = DEFAULT_HUGGING_URL
-
-    # Check for integrationexpert-specific model in environment
-    model = args.integrationexpert_model or os.getenv("INTEGRATIONEXPERT_MODEL", "").strip() or DEFAULT_HUGGING_MODEL
-
-    print(f"[DEBUG] build_integrationexpert_agent: token found, length={len(token)}", file=sys.stderr)
-    config = ApiConfig(
-        url=url,
-        token=token,
-        model=model,
-        temperature=args.integrationexpert_temperature,
-        timeout=args.integrationexpert_timeout,
-        include_raw=False,
-    )
-    print(f"[DEBUG] build_integrationexpert_agent: created config (url={config.url}, model={config.model}, temp={config.temperature})", file=sys.stderr)
-    client = HuggingFaceClient(config=config)
-    return IntegrationExpertDebater(client)
-
-
-def build_functionalspec_agent(args: argparse.Namespace) -> FunctionalSpecDebater:
-    print("[DEBUG] build_functionalspec_agent: checking token", file=sys.stderr)
-    from generate_wricef_prompts import (
-        DEFAULT_API_URL as DEFAULT_HUGGING_URL,
-        DEFAULT_MODEL as DEFAULT_HUGGING_MODEL,
-        ENV_TOKEN_KEY as HUGGING_TOKEN_ENV
-    )
-    token = args.functionalspec_token or os.getenv("FUNCTIONALSPEC_TOKEN", "").strip() or os.getenv(HUGGING_TOKEN_ENV, "").strip()
-    if not token:
-        raise ValueError(
-            f"FunctionalSpec API token required. Provide --functionalspec-token or set FUNCTIONALSPEC_TOKEN or {HUGGING_TOKEN_ENV}."
-        )
-
-    # Check for functionalspec-specific URL in environment
-    url = args.functionalspec_url or os.getenv("FUNCTIONALSPEC_API_URL", "").strip()
-    if not url:
-        # If no URL provided via argument or environment, fall back to default
-        url = DEFAULT_HUGGING_URL
-
-    # Check for functionalspec-specific model in environment
-    model = args.functionalspec_model or os.getenv("FUNCTIONALSPEC_MODEL", "").strip() or DEFAULT_HUGGING_MODEL
-
-    print(f"[DEBUG] build_functionalspec_agent: token found, length={len(token)}", file=sys.stderr)
-    config = ApiConfig(
-        url=url,
-        token=token,
-        model=model,
-        temperature=args.functionalspec_temperature,
-        timeout=args.functionalspec_timeout,
-        include_raw=False,
-    )
-    print(f"[DEBUG] build_functionalspec_agent: created config (url={config.url}, model={config.model}, temp={config.temperature})", file=sys.stderr)
-    client = HuggingFaceClient(config=config)
-    return FunctionalSpecDebater(client)
-
-
-def build_technicalspec_agent(args: argparse.Namespace) -> TechnicalSpecDebater:
-    print("[DEBUG] build_technicalspec_agent: checking token", file=sys.stderr)
-    from generate_wricef_prompts import (
-        DEFAULT_API_URL as DEFAULT_HUGGING_URL,
-        DEFAULT_MODEL as DEFAULT_HUGGING_MODEL,
-        ENV_TOKEN_KEY as HUGGING_TOKEN_ENV
-    )
-    token = args.technicalspec_token or os.getenv("TECHNICALSPEC_TOKEN", "").strip() or os.getenv(HUGGING_TOKEN_ENV, "").strip()
-    if not token:
-        raise ValueError(
-            f"TechnicalSpec API token required. Provide --technicalspec-token or set TECHNICALSPEC_TOKEN or {HUGGING_TOKEN_ENV}."
-        )
-
-    # Check for technicalspec-specific URL in environment
-    url = args.technicalspec_url or os.getenv("TECHNICALSPEC_API_URL", "").strip()
-    if not url:
-        # If no URL provided via argument or environment, fall back to default
-        url = DEFAULT_HUGGING_URL
-
-    # Check for technicalspec-specific model in environment
-    model = args.technicalspec_model or os.getenv("TECHNICALSPEC_MODEL", "").strip() or DEFAULT_HUGGING_MODEL
-
-    print(f"[DEBUG] build_technicalspec_agent: token found, length={len(token)}", file=sys.stderr)
-    config = ApiConfig(
-        url=url,
-        token=token,
-        model=model,
-        temperature=args.technicalspec_temperature,
-        timeout=args.technicalspec_timeout,
-        include_raw=False,
-    )
-    print(f"[DEBUG] build_technicalspec_agent: created config (url={config.url}, model={config.model}, temp={config.temperature})", file=sys.stderr)
-    client = HuggingFaceClient(config=config)
-    return TechnicalSpecDebater(client)
+logger = logging.getLogger(__name__)
 
+# Plain-dict copy of the environment taken after .env is loaded; os.environ
+# re-encodes keys and values on every lookup.
+_ENV: dict[str, str] | None = None
 
-def build_configagent(args: argparse.Namespace) -> ConfigurationAgent:
-    print("[DEBUG] build_configagent: checking token", file=sys.stderr)
-    from generate_wricef_prompts import (
-        DEFAULT_API_URL as DEFAULT_HUGGING_URL,
-        DEFAULT_MODEL as DEFAULT_HUGGING_MODEL,
-        ENV_TOKEN_KEY as HUGGING_TOKEN_ENV
-    )
-    token = args.configagent_token or os.getenv("CONFIGAGENT_TOKEN", "").strip() or os.getenv(HUGGING_TOKEN_ENV, "").strip()
-    if not token:
-        raise ValueError(
-            f"Configuration API token required. Provide --configagent-token or set CONFIGAGENT_TOKEN or {HUGGING_TOKEN_ENV}."
-        )
 
-    # Check for configagent-specific URL in environment
-    url = args.configagent_url or os.getenv("CONFIGAGENT_API_URL", "").strip()
-    if not url:
-        # If no URL provided via argument or environment, fall back to default
-        url = DEFAULT_HUGGING_URL
-
-    # Check for configagent-specific model in environment
-    model = args.configagent_model or os.getenv("CONFIGAGENT_MODEL", "").strip() or DEFAULT_HUGGING_MODEL
-
-    print(f"[DEBUG] build_configagent: token found, length={len(token)}", file=sys.stderr)
-    config = ApiConfig(
-        url=url,
-        token=token,
-        model=model,
-        temperature=args.configagent_temperature,
-        timeout=args.configagent_timeout,
-        include_raw=False,
-    )
-    print(f"[DEBUG] build_configagent: created config (url={config.url}, model={config.model}, temp={config.temperature})", file=sys.stderr)
-    client = HuggingFaceClient(config=config)
-    return ConfigurationAgent(client)
+_dotenv_stamp: tuple[str, float] | None = None
 
 
-def build_datamigrationagent(args: argparse.Namespace) -> DataMigrationAgent:
-    print("[DEBUG] build_datamigrationagent: checking token", file=sys.stderr)
-    from generate_wricef_prompts import (
-        DEFAULT_API_URL as DEFAULT_HUGGING_URL,
-        DEFAULT_MODEL as DEFAULT_HUGGING_MODEL,
-        ENV_TOKEN_KEY as HUGGING_TOKEN_ENV
-    )
-    token = args.datamigrationagent_token or os.getenv("DATAMIGRATIONAGENT_TOKEN", "").strip() or os.getenv(HUGGING_TOKEN_ENV, "").strip()
-    if not token:
-        raise ValueError(
-            f"DataMigration API token required. Provide --datamigrationagent-token or set DATAMIGRATIONAGENT_TOKEN or {HUGGING_TOKEN_ENV}."
-        )
+def _refresh_env() -> None:
+    global _ENV
+    _ENV = dict(os.environ)
 
-    # Check for datamigrationagent-specific URL in environment
-    url = args.datamigrationagent_url or os.getenv("DATAMIGRATIONAGENT_API_URL", "").strip()
-    if not url:
-        # If no URL provided via argument or environment, fall back to default
-        url = DEFAULT_HUGGING_URL
-
-    # Check for datamigrationagent-specific model in environment
-    model = args.datamigrationagent_model or os.getenv("DATAMIGRATIONAGENT_MODEL", "").strip() or DEFAULT_HUGGING_MODEL
-
-    print(f"[DEBUG] build_datamigrationagent: token found, length={len(token)}", file=sys.stderr)
-    config = ApiConfig(
-        url=url,
-        token=token,
-        model=model,
-        temperature=args.datamigrationagent_temperature,
-        timeout=args.datamigrationagent_timeout,
-        include_raw=False,
-    )
-    print(f"[DEBUG] build_datamigrationagent: created config (url={config.url}, model={config.model}, temp={config.temperature})", file=sys.stderr)
-    client = HuggingFaceClient(config=config)
-    return DataMigrationAgent(client)
 
+def _load_env_once() -> None:
+    """Load .env unless the same file, unchanged, was already loaded; then refresh the snapshot."""
+    global _dotenv_stamp
+    dotenv_path = find_dotenv()
+    try:
+        stamp = (dotenv_path, os.path.getmtime(dotenv_path)) if dotenv_path else ("", 0.0)
+    except OSError:
+        stamp = (dotenv_path, 0.0)
+    if stamp != _dotenv_stamp:
+        if dotenv_path:
+            load_dotenv(dotenv_path)
+        _dotenv_stamp = stamp
+    _refresh_env()
 
-def build_reportingagent(args: argparse.Namespace) -> ReportingAgent:
-    print("[DEBUG] build_reportingagent: checking token", file=sys.stderr)
-    from generate_wricef_prompts import (
-        DEFAULT_API_URL as DEFAULT_HUGGING_URL,
-        DEFAULT_MODEL as DEFAULT_HUGGING_MODEL,
-        ENV_TOKEN_KEY as HUGGING_TOKEN_ENV
-    )
-    token = args.reportingagent_token or os.getenv("REPORTINGAGENT_TOKEN", "").strip() or os.getenv(HUGGING_TOKEN_ENV, "").strip()
-    if not token:
-        raise ValueError(
-            f"Reporting API token required. Provide --reportingagent-token or set REPORTINGAGENT_TOKEN or {HUGGING_TOKEN_ENV}."
-        )
 
-    # Check for reportingagent-specific URL in environment
-    url = args.reportingagent_url or os.getenv("REPORTINGAGENT_API_URL", "").strip()
-    if not url:
-        # If no URL provided via argument or environment, fall back to default
-        url = DEFAULT_HUGGING_URL
-
-    # Check for reportingagent-specific model in environment
-    model = args.reportingagent_model or os.getenv("REPORTINGAGENT_MODEL", "").strip() or DEFAULT_HUGGING_MODEL
-
-    print(f"[DEBUG] build_reportingagent: token found, length={len(token)}", file=sys.stderr)
-    config = ApiConfig(
-        url=url,
-        token=token,
-        model=model,
-        temperature=args.reportingagent_temperature,
-        timeout=args.reportingagent_timeout,
-        include_raw=False,
-    )
-    print(f"[DEBUG] build_reportingagent: created config (url={config.url}, model={config.model}, temp={config.temperature})", file=sys.stderr)
-    client = HuggingFaceClient(config=config)
-    return ReportingAgent(client)
-
-
-def build_securityagent(args: argparse.Namespace) -> SecurityAgent:
-    print("[DEBUG] build_securityagent: checking token", file=sys.stderr)
-    from generate_wricef_prompts import (
-        DEFAULT_API_URL as DEFAULT_HUGGING_URL,
-        DEFAULT_MODEL as DEFAULT_HUGGING_MODEL,
-        ENV_TOKEN_KEY as HUGGING_TOKEN_ENV
-    )
-    token = args.securityagent_token or os.getenv("SECURITYAGENT_TOKEN", "").strip() or os.getenv(HUGGING_TOKEN_ENV, "").strip()
-    if not token:
-        raise ValueError(
-            f"Security API token required. Provide --securityagent-token or set SECURITYAGENT_TOKEN or {HUGGING_TOKEN_ENV}."
-        )
+def _env(key: str) -> str:
+    if _ENV is None:
+        _load_env_once()
+    return _ENV.get(key, "")
 
-    # Check for securityagent-specific URL in environment
-    url = args.securityagent_url or os.getenv("SECURITYAGENT_API_URL", "").strip()
-    if not url:
-        # If no URL provided via argument or environment, fall back to default
-        url = DEFAULT_HUGGING_URL
-
-    # Check for securityagent-specific model in environment
-    model = args.securityagent_model or os.getenv("SECURITYAGENT_MODEL", "").strip() or DEFAULT_HUGGING_MODEL
-
-    print(f"[DEBUG] build_securityagent: token found, length={len(token)}", file=sys.stderr)
-    config = ApiConfig(
-        url=url,
-        token=token,
-        model=model,
-        temperature=args.securityagent_temperature,
-        timeout=args.securityagent_timeout,
-        include_raw=False,
-    )
-    print(f"[DEBUG] build_securityagent: created config (url={config.url}, model={config.model}, temp={config.temperature})", file=sys.stderr)
-    client = HuggingFaceClient(config=config)
-    return SecurityAgent(client)
 
+def _first_nonempty(*candidates: str | None) -> str:
+    """Return the first candidate that is non-blank once stripped, else an empty string."""
+    for candidate in candidates:
+        if candidate:
+            stripped = candidate.strip()
+            if stripped:
+                return stripped
+    return ""
 
-def build_testingagent(args: argparse.Namespace) -> TestingAgent:
-    print("[DEBUG] build_testingagent: checking token", file=sys.stderr)
-    from generate_wricef_prompts import (
-        DEFAULT_API_URL as DEFAULT_HUGGING_URL,
-        DEFAULT_MODEL as DEFAULT_HUGGING_MODEL,
-        ENV_TOKEN_KEY as HUGGING_TOKEN_ENV
-    )
-    token = args.testingagent_token or os.getenv("TESTINGAGENT_TOKEN", "").strip() or os.getenv(HUGGING_TOKEN_ENV, "").strip()
-    if not token:
-        raise ValueError(
-            f"Testing API token required. Provide --testingagent-token or set TESTINGAGENT_TOKEN or {HUGGING_TOKEN_ENV}."
-        )
-
-    # Check for testingagent-specific URL in environment
-    url = args.testingagent_url or os.getenv("TESTINGAGENT_API_URL", "").strip()
-    if not url:
-        # If no URL provided via argument or environment, fall back to default
-        url = DEFAULT_HUGGING_URL
-
-    # Check for testingagent-specific model in environment
-    model = args.testingagent_model or os.getenv("TESTINGAGENT_MODEL", "").strip() or DEFAULT_HUGGING_MODEL
-
-    print(f"[DEBUG] build_testingagent: token found, length={len(token)}", file=sys.stderr)
-    config = ApiConfig(
-        url=url,
-        token=token,
-        model=model,
-        temperature=args.testingagent_temperature,
-        timeout=args.testingagent_timeout,
-        include_raw=False,
-    )
-    print(f"[DEBUG] build_testingagent: created config (url={config.url}, model={config.model}, temp={config.temperature})", file=sys.stderr)
-    client = HuggingFaceClient(config=config)
-    return TestingAgent(client)
 
+def _make_agent(kind: str, client: HuggingFaceClient | PerplexityClient) -> GenericAgent:
+    # The agents module (prompt templates, metadata writer) is only loaded once
+    # an agent is actually built, so --help and argument errors stay cheap.
+    from .agents import make_agent
 
-def build_changemgmtagent(args: argparse.Namespace) -> ChangeMgmtAgent:
-    print("[DEBUG] build_changemgmtagent: checking token", file=sys.stderr)
-    from generate_wricef_prompts import (
-        DEFAULT_API_URL as DEFAULT_HUGGING_URL,
-        DEFAULT_MODEL as DEFAULT_HUGGING_MODEL,
-        ENV_TOKEN_KEY as HUGGING_TOKEN_ENV
-    )
-    token = args.changemgmtagent_token or os.getenv("CHANGEMGMTAGENT_TOKEN", "").strip() or os.getenv(HUGGING_TOKEN_ENV, "").strip()
-    if not token:
-        raise ValueError(
-            f"ChangeMgmt API token required. Provide --changemgmtagent-token or set CHANGEMGMTAGENT_TOKEN or {HUGGING_TOKEN_ENV}."
-        )
+    return make_agent(kind, client)
 
-    # Check for changemgmtagent-specific URL in environment
-    url = args.changemgmtagent_url or os.getenv("CHANGEMGMTAGENT_API_URL", "").strip()
-    if not url:
-        # If no URL provided via argument or environment, fall back to default
-        url = DEFAULT_HUGGING_URL
-
-    # Check for changemgmtagent-specific model in environment
-    model = args.changemgmtagent_model or os.getenv("CHANGEMGMTAGENT_MODEL", "").strip() or DEFAULT_HUGGING_MODEL
-
-    print(f"[DEBUG] build_changemgmtagent: token found, length={len(token)}", file=sys.stderr)
-    config = ApiConfig(
-        url=url,
-        token=token,
-        model=model,
-        temperature=args.changemgmtagent_temperature,
-        timeout=args.changemgmtagent_timeout,
-        include_raw=False,
-    )
-    print(f"[DEBUG] build_changemgmtagent: created config (url={config.url}, model={config.model}, temp={config.temperature})", file=sys.stderr)
-    client = HuggingFaceClient(config=config)
-    return ChangeMgmtAgent(client)
 
+@lru_cache(maxsize=128)
+def _api_config(url: str, token: str, model: str, temperature: float, timeout: float) -> ApiConfig:
+    """Frozen config per distinct endpoint settings; equal settings give the same object."""
+    return ApiConfig(url=url, token=token, model=model, temperature=temperature, timeout=timeout, include_raw=False)
 
-def build_monitoringagent(args: argparse.Namespace) -> MonitoringAgent:
-    print("[DEBUG] build_monitoringagent: checking token", file=sys.stderr)
-    from generate_wricef_prompts import (
-        DEFAULT_API_URL as DEFAULT_HUGGING_URL,
-        DEFAULT_MODEL as DEFAULT_HUGGING_MODEL,
-        ENV_TOKEN_KEY as HUGGING_TOKEN_ENV
-    )
-    token = args.monitoringagent_token or os.getenv("MONITORINGAGENT_TOKEN", "").strip() or os.getenv(HUGGING_TOKEN_ENV, "").strip()
-    if not token:
-        raise ValueError(
-            f"Monitoring API token required. Provide --monitoringagent-token or set MONITORINGAGENT_TOKEN or {HUGGING_TOKEN_ENV}."
-        )
 
-    # Check for monitoringagent-specific URL in environment
-    url = args.monitoringagent_url or os.getenv("MONITORINGAGENT_API_URL", "").strip()
-    if not url:
-        # If no URL provided via argument or environment, fall back to default
-        url = DEFAULT_HUGGING_URL
-
-    # Check for monitoringagent-specific model in environment
-    model = args.monitoringagent_model or os.getenv("MONITORINGAGENT_MODEL", "").strip() or DEFAULT_HUGGING_MODEL
-
-    print(f"[DEBUG] build_monitoringagent: token found, length={len(token)}", file=sys.stderr)
-    config = ApiConfig(
-        url=url,
-        token=token,
-        model=model,
-        temperature=args.monitoringagent_temperature,
-        timeout=args.monitoringagent_timeout,
-        include_raw=False,
-    )
-    print(f"[DEBUG] build_monitoringagent: created config (url={config.url}, model={config.model}, temp={config.temperature})", file=sys.stderr)
-    client = HuggingFaceClient(config=config)
-    return MonitoringAgent(client)
+@lru_cache(maxsize=None)
+def _get_hf_client(config: ApiConfig) -> HuggingFaceClient:
+    """One client per distinct endpoint settings, so agents left on the defaults share it."""
+    return HuggingFaceClient(config=config)
 
 
-def build_learningagent(args: argparse.Namespace) -> LearningAgent:
-    print("[DEBUG] build_learningagent: checking token", file=sys.stderr)
-    from generate_wricef_prompts import (
-        DEFAULT_API_URL as DEFAULT_HUGGING_URL,
-        DEFAULT_MODEL as DEFAULT_HUGGING_MODEL,
-        ENV_TOKEN_KEY as HUGGING_TOKEN_ENV
-    )
-    token = args.learningagent_token or os.getenv("LEARNINGAGENT_TOKEN", "").strip() or os.getenv(HUGGING_TOKEN_ENV, "").strip()
+def build_hugging_config(args: argparse.Namespace) -> ApiConfig:
+    logger.debug("build_hugging_config: checking token")
+    token = _first_nonempty(args.hugging_token, _env(HUGGING_TOKEN_ENV))
     if not token:
         raise ValueError(
-            f"Learning API token required. Provide --learningagent-token or set LEARNINGAGENT_TOKEN or {HUGGING_TOKEN_ENV}."
+            f"Hugging API token required. Provide --hugging-token or set {HUGGING_TOKEN_ENV}."
         )
-
-    # Check for learningagent-specific URL in environment
-    url = args.learningagent_url or os.getenv("LEARNINGAGENT_API_URL", "").strip()
-    if not url:
-        # If no URL provided via argument or environment, fall back to default
-        url = DEFAULT_HUGGING_URL
-
-    # Check for learningagent-specific model in environment
-    model = args.learningagent_model or os.getenv("LEARNINGAGENT_MODEL", "").strip() or DEFAULT_HUGGING_MODEL
-
-    print(f"[DEBUG] build_learningagent: token found, length={len(token)}", file=sys.stderr)
-    config = ApiConfig(
-        url=url,
-        token=token,
-        model=model,
-        temperature=args.learningagent_temperature,
-        timeout=args.learningagent_timeout,
-        include_raw=False,
-    )
-    print(f"[DEBUG] build_learningagent: created config (url={config.url}, model={config.model}, temp={config.temperature})", file=sys.stderr)
-    client = HuggingFaceClient(config=config)
-    return LearningAgent(client)
+    logger.debug("build_hugging_config: token found, length=%d", len(token))
+    config = _api_config(args.hugging_url, token, args.hugging_model, args.hugging_temperature, args.hugging_timeout)
+    logger.debug("build_hugging_config: created config (url=%s, model=%s, temp=%s)", config.url, config.model, config.temperature)
+    return config
 
 
-def build_metadataextractagent(args: argparse.Namespace) -> MetadataExtractAgent:
-    print("[DEBUG] build_metadataextractagent: checking token", file=sys.stderr)
-    from generate_wricef_prompts import (
-        DEFAULT_API_URL as DEFAULT_HUGGING_URL,
-        DEFAULT_MODEL as DEFAULT_HUGGING_MODEL,
-        ENV_TOKEN_KEY as HUGGING_TOKEN_ENV
-    )
-    token = args.metadataextractagent_token or os.getenv("METADATAEXTRACTAGENT_TOKEN", "").strip() or os.getenv(HUGGING_TOKEN_ENV, "").strip()
-    if not token:
-        raise ValueError(
-            f"MetadataExtract API token required. Provide --metadataextractagent-token or set METADATAEXTRACTAGENT_TOKEN or {HUGGING_TOKEN_ENV}."
-        )
-
-    # Check for metadataextractagent-specific URL in environment
-    url = args.metadataextractagent_url or os.getenv("METADATAEXTRACTAGENT_API_URL", "").strip()
-    if not url:
-        # If no URL provided via argument or environment, fall back to default
-        url = DEFAULT_HUGGING_URL
-
-    # Check for metadataextractagent-specific model in environment
-    model = args.metadataextractagent_model or os.getenv("METADATAEXTRACTAGENT_MODEL", "").strip() or DEFAULT_HUGGING_MODEL
-
-    print(f"[DEBUG] build_metadataextractagent: token found, length={len(token)}", file=sys.stderr)
-    config = ApiConfig(
-        url=url,
-        token=token,
-        model=model,
-        temperature=args.metadataextractagent_temperature,
-        timeout=args.metadataextractagent_timeout,
-        include_raw=False,
-    )
-    print(f"[DEBUG] build_metadataextractagent: created config (url={config.url}, model={config.model}, temp={config.temperature})", file=sys.stderr)
-    client = HuggingFaceClient(config=config)
-    return MetadataExtractAgent(client)
+def build_perplexity_agent(args: argparse.Namespace) -> GenericAgent:
+    logger.debug("build_perplexity_agent: checking session token")
+    session_token = _first_nonempty(args.perplexity_token, _env("PERPLEXITY_SESSION_TOKEN"))
+    if not session_token:
+        raise ValueError("Perplexity session token required. Provide --perplexity-token or set PERPLEXITY_SESSION_TOKEN.")
+    logger.debug("build_perplexity_agent: token found, length=%d", len(session_token))
+    client = PerplexityClient.shared(session_token)
+    return _make_agent("PerplexityDebater", client)
 
 
-def build_internetresearch_agent(args: argparse.Namespace) -> InternetResearchAgent:
-    print("[DEBUG] build_internetresearch_agent: checking token", file=sys.stderr)
+def build_internetresearch_agent(args: argparse.Namespace) -> GenericAgent:
+    logger.debug("build_internetresearch_agent: checking token")
     # Check in order: command line argument, INTERNET_RESEARCH_TOKEN env, PERPLEXITY_SESSION_TOKEN env
-    session_token = (
-        args.internetresearch_token or
-        os.getenv("INTERNET_RESEARCH_TOKEN", "") or
-        os.getenv("PERPLEXITY_SESSION_TOKEN", "")
-    ).strip()
+    session_token = _first_nonempty(
+        args.internetresearch_token,
+        _env("INTERNET_RESEARCH_TOKEN"),
+        _env("PERPLEXITY_SESSION_TOKEN"),
+    )
     if not session_token:
         raise ValueError("InternetResearch Perplexity session token required. Provide --internetresearch-token or set INTERNET_RESEARCH_TOKEN or PERPLEXITY_SESSION_TOKEN.")
-    print(f"[DEBUG] build_internetresearch_agent: token found, length={len(session_token)}", file=sys.stderr)
-    client = PerplexityClient(session_token=session_token)
-    return InternetResearchAgent(client)
-
-
-def build_critiqueagent(args: argparse.Namespace) -> CritiqueAgent:
-    print("[DEBUG] build_critiqueagent: checking token", file=sys.stderr)
-    from generate_wricef_prompts import (
-        DEFAULT_API_URL as DEFAULT_HUGGING_URL,
-        DEFAULT_MODEL as DEFAULT_HUGGING_MODEL,
-        ENV_TOKEN_KEY as HUGGING_TOKEN_ENV
-    )
-    token = args.critiqueagent_token or os.getenv("CRITIQUEAGENT_TOKEN", "").strip() or os.getenv(HUGGING_TOKEN_ENV, "").strip()
+    logger.debug("build_internetresearch_agent: token found, length=%d", len(session_token))
+    client = PerplexityClient.shared(session_token)
+    return _make_agent("InternetResearchAgent", client)
+
+
+# Agents backed by the WRICEF API: CLI/env prefix -> (label used in messages, agent kind).
+# Each reads --<prefix>-token/-url/-model/-temperature/-timeout, falling back to
+# <PREFIX>_TOKEN/_API_URL/_MODEL and then the shared Hugging token and defaults.
+_AGENT_SPECS: dict[str, tuple[str, str]] = {
+    "writer": ("Writer", "WriterDebater"),
+    "askquestions": ("AskQuestions", "AskQuestionsDebater"),
+    "answerquestions": ("AnswerQuestions", "AnswerQuestionsDebater"),
+    "integrationexpert": ("IntegrationExpert", "IntegrationExpertDebater"),
+    "functionalspec": ("FunctionalSpec", "FunctionalSpecDebater"),
+    "technicalspec": ("TechnicalSpec", "TechnicalSpecDebater"),
+    "configagent": ("Configuration", "ConfigurationAgent"),
+    "datamigrationagent": ("DataMigration", "DataMigrationAgent"),
+    "reportingagent": ("Reporting", "ReportingAgent"),
+    "securityagent": ("Security", "SecurityAgent"),
+    "testingagent": ("Testing", "TestingAgent"),
+    "changemgmtagent": ("ChangeMgmt", "ChangeMgmtAgent"),
+    "monitoringagent": ("Monitoring", "MonitoringAgent"),
+    "learningagent": ("Learning", "LearningAgent"),
+    "metadataextractagent": ("MetadataExtract", "MetadataExtractAgent"),
+    "critiqueagent": ("Critique", "CritiqueAgent"),
+    "compressionagent": ("Compression", "CompressionAgent"),
+    "todoagent": ("Todo", "TodoAgent"),
+    "mrpromptbuilderagent": ("MrPromptBuilder", "MrPromptBuilderAgent"),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class _AgentKeys:
+    """Argument and environment variable names for one ``_AGENT_SPECS`` prefix."""
+
+    token_env: str
+    url_env: str
+    model_env: str
+    token_arg: str
+    url_arg: str
+    model_arg: str
+    temperature_arg: str
+    timeout_arg: str
+    option_prefix: str
+
+
+def _agent_keys(prefix: str) -> _AgentKeys:
+    env_prefix = prefix.upper()
+    # Interned so option/env dict lookups with these keys hit the identity fast path.
+    return _AgentKeys(
+        token_env=sys.intern(f"{env_prefix}_TOKEN"),
+        url_env=sys.intern(f"{env_prefix}_API_URL"),
+        model_env=sys.intern(f"{env_prefix}_MODEL"),
+        token_arg=sys.intern(f"{prefix}_token"),
+        url_arg=sys.intern(f"{prefix}_url"),
+        model_arg=sys.intern(f"{prefix}_model"),
+        temperature_arg=sys.intern(f"{prefix}_temperature"),
+        timeout_arg=sys.intern(f"{prefix}_timeout"),
+        option_prefix=f"--{prefix}-",
+    )
+
+
+# The names never change at runtime, so build them once rather than per call.
+_AGENT_KEYS: dict[str, _AgentKeys] = {prefix: _agent_keys(prefix) for prefix in _AGENT_SPECS}
+
+
+def _make_resolver(
+    keys: _AgentKeys,
+    default_url: str = DEFAULT_HUGGING_URL,
+    default_model: str = DEFAULT_HUGGING_MODEL,
+) -> Callable[[dict[str, Any]], tuple[str, str, str]]:
+    """Bind one agent's option/env names and defaults into a ``(token, url, model)`` resolver."""
+    token_arg, url_arg, model_arg = keys.token_arg, keys.url_arg, keys.model_arg
+    token_env, url_env, model_env = keys.token_env, keys.url_env, keys.model_env
+
+    def resolve(argd: dict[str, Any]) -> tuple[str, str, str]:
+        # Arguments, then the agent's environment, then the shared token and defaults
+        token = _first_nonempty(argd[token_arg], _env(token_env), _env(HUGGING_TOKEN_ENV))
+        url = _first_nonempty(argd[url_arg], _env(url_env)) or default_url
+        model = _first_nonempty(argd[model_arg], _env(model_env)) or default_model
+        return token, url, model
+
+    return resolve
+
+
+_AGENT_RESOLVERS: dict[str, Callable[[dict[str, Any]], tuple[str, str, str]]] = {
+    prefix: _make_resolver(keys) for prefix, keys in _AGENT_KEYS.items()
+}
+
+
+def build_agent(args: argparse.Namespace, prefix: str) -> GenericAgent:
+    """Build the WRICEF-backed agent registered under ``prefix`` in ``_AGENT_SPECS``."""
+    label, kind = _AGENT_SPECS[prefix]
+    keys = _AGENT_KEYS[prefix]
+    # Namespace attributes live in its __dict__; read them as plain dict lookups.
+    argd = vars(args)
+    logger.debug("build_agent[%s]: checking token", prefix)
+    token, url, model = _AGENT_RESOLVERS[prefix](argd)
     if not token:
         raise ValueError(
-            f"Critique API token required. Provide --critiqueagent-token or set CRITIQUEAGENT_TOKEN or {HUGGING_TOKEN_ENV}."
+            f"{label} API token required. Provide --{prefix}-token or set {keys.token_env} or {HUGGING_TOKEN_ENV}."
         )
 
-    # Check for critiqueagent-specific URL in environment
-    url = args.critiqueagent_url or os.getenv("CRITIQUEAGENT_API_URL", "").strip()
-    if not url:
-        # If no URL provided via argument or environment, fall back to default
-        url = DEFAULT_HUGGING_URL
-
-    # Check for critiqueagent-specific model in environment
-    model = args.critiqueagent_model or os.getenv("CRITIQUEAGENT_MODEL", "").strip() or DEFAULT_HUGGING_MODEL
-
-    print(f"[DEBUG] build_critiqueagent: token found, length={len(token)}", file=sys.stderr)
-    config = ApiConfig(
-        url=url,
-        token=token,
-        model=model,
-        temperature=args.critiqueagent_temperature,
-        timeout=args.critiqueagent_timeout,
-        include_raw=False,
-    )
-    print(f"[DEBUG] build_critiqueagent: created config (url={config.url}, model={config.model}, temp={config.temperature})", file=sys.stderr)
-    client = HuggingFaceClient(config=config)
-    return CritiqueAgent(client)
+    logger.debug("build_agent[%s]: token found, length=%d", prefix, len(token))
+    client = _get_hf_client(_api_config(url, token, model, argd[keys.temperature_arg], argd[keys.timeout_arg]))
+    config = client.config
+    logger.debug("build_agent[%s]: created config (url=%s, model=%s, temp=%s)", prefix, config.url, config.model, config.temperature)
+    return _make_agent(kind, client)
 
 
-def build_compressionagent(args: argparse.Namespace) -> CompressionAgent:
-    print("[DEBUG] build_compressionagent: checking token", file=sys.stderr)
-    from generate_wricef_prompts import (
-        DEFAULT_API_URL as DEFAULT_HUGGING_URL,
-        DEFAULT_MODEL as DEFAULT_HUGGING_MODEL,
-        ENV_TOKEN_KEY as HUGGING_TOKEN_ENV
+def _add_agent_args(parser: argparse.ArgumentParser, prefix: str, label: str, keys: _AgentKeys) -> None:
+    """Register the --<prefix>-url/-model/-temperature/-timeout/-token options for one agent."""
+    parser.add_argument(
+        f"--{prefix}-url",
+        dest=keys.url_arg,
+        default="",
+        help=f"{label} API endpoint (default: value from {keys.url_env} environment variable, or {DEFAULT_HUGGING_URL} if not set).",
     )
-    token = args.compressionagent_token or os.getenv("COMPRESSIONAGENT_TOKEN", "").strip() or os.getenv(HUGGING_TOKEN_ENV, "").strip()
-    if not token:
-        raise ValueError(
-            f"Compression API token required. Provide --compressionagent-token or set COMPRESSIONAGENT_TOKEN or {HUGGING_TOKEN_ENV}."
-        )
-
-    # Check for compressionagent-specific URL in environment
-    url = args.compressionagent_url or os.getenv("COMPRESSIONAGENT_API_URL", "").strip()
-    if not url:
-        # If no URL provided via argument or environment, fall back to default
-        url = DEFAULT_HUGGING_URL
-
-    # Check for compressionagent-specific model in environment
-    model = args.compressionagent_model or os.getenv("COMPRESSIONAGENT_MODEL", "").strip() or DEFAULT_HUGGING_MODEL
-
-    print(f"[DEBUG] build_compressionagent: token found, length={len(token)}", file=sys.stderr)
-    config = ApiConfig(
-        url=url,
-        token=token,
-        model=model,
-        temperature=args.compressionagent_temperature,
-        timeout=args.compressionagent_timeout,
-        include_raw=False,
+    parser.add_argument(
+        f"--{prefix}-model",
+        dest=keys.model_arg,
+        default="",
+        help=f"{label} API model identifier (default: value from {keys.model_env} environment variable, or {DEFAULT_HUGGING_MODEL} if not set).",
     )
-    print(f"[DEBUG] build_compressionagent: created config (url={config.url}, model={config.model}, temp={config.temperature})", file=sys.stderr)
-    client = HuggingFaceClient(config=config)
-    return CompressionAgent(client)
-
-
-def build_todoagent(args: argparse.Namespace) -> TodoAgent:
-    print("[DEBUG] build_todoagent: checking token", file=sys.stderr)
-    from generate_wricef_prompts import (
-        DEFAULT_API_URL as DEFAULT_HUGGING_URL,
-        DEFAULT_MODEL as DEFAULT_HUGGING_MODEL,
-        ENV_TOKEN_KEY as HUGGING_TOKEN_ENV
+    parser.add_argument(
+        f"--{prefix}-temperature",
+        dest=keys.temperature_arg,
+        type=float,
+        default=DEFAULT_HUGGING_TEMPERATURE,
+        help=f"{label} API sampling temperature (default: {DEFAULT_HUGGING_TEMPERATURE}).",
     )
-    token = args.todoagent_token or os.getenv("TODOAGENT_TOKEN", "").strip() or os.getenv(HUGGING_TOKEN_ENV, "").strip()
-    if not token:
-        raise ValueError(
-            f"Todo API token required. Provide --todoagent-token or set TODOAGENT_TOKEN or {HUGGING_TOKEN_ENV}."
-        )
-
-    # Check for todoagent-specific URL in environment
-    url = args.todoagent_url or os.getenv("TODOAGENT_API_URL", "").strip()
-    if not url:
-        # If no URL provided via argument or environment, fall back to default
-        url = DEFAULT_HUGGING_URL
-
-    # Check for todoagent-specific model in environment
-    model = args.todoagent_model or os.getenv("TODOAGENT_MODEL", "").strip() or DEFAULT_HUGGING_MODEL
-
-    print(f"[DEBUG] build_todoagent: token found, length={len(token)}", file=sys.stderr)
-    config = ApiConfig(
-        url=url,
-        token=token,
-        model=model,
-        temperature=args.todoagent_temperature,
-        timeout=args.todoagent_timeout,
-        include_raw=False,
+    parser.add_argument(
+        f"--{prefix}-timeout",
+        dest=keys.timeout_arg,
+        type=float,
+        default=300.0,
+        help=f"{label} API timeout in seconds (default: 300).",
     )
-    print(f"[DEBUG] build_todoagent: created config (url={config.url}, model={config.model}, temp={config.temperature})", file=sys.stderr)
-    client = HuggingFaceClient(config=config)
-    return TodoAgent(client)
-
-
-def build_mrpromptbuilderagent(args: argparse.Namespace) -> MrPromptBuilderAgent:
-    print("[DEBUG] build_mrpromptbuilderagent: checking token", file=sys.stderr)
-    from generate_wricef_prompts import (
-        DEFAULT_API_URL as DEFAULT_HUGGING_URL,
-        DEFAULT_MODEL as DEFAULT_HUGGING_MODEL,
-        ENV_TOKEN_KEY as HUGGING_TOKEN_ENV
+    parser.add_argument(
+        f"--{prefix}-token",
+        dest=keys.token_arg,
+        help=f"{label} API token (overrides {keys.token_env}).",
     )
-    token = args.mrpromptbuilderagent_token or os.getenv("MRPROMPTBUILDERAGENT_TOKEN", "").strip() or os.getenv(HUGGING_TOKEN_ENV, "").strip()
-    if not token:
-        raise ValueError(
-            f"MrPromptBuilder API token required. Provide --mrpromptbuilderagent-token or set MRPROMPTBUILDERAGENT_TOKEN or {HUGGING_TOKEN_ENV}."
-        )
 
-    # Check for mrpromptbuilderagent-specific URL in environment
-    url = args.mrpromptbuilderagent_url or os.getenv("MRPROMPTBUILDERAGENT_API_URL", "").strip()
-    if not url:
-        # If no URL provided via argument or environment, fall back to default
-        url = DEFAULT_HUGGING_URL
-
-    # Check for mrpromptbuilderagent-specific model in environment
-    model = args.mrpromptbuilderagent_model or os.getenv("MRPROMPTBUILDERAGENT_MODEL", "").strip() or DEFAULT_HUGGING_MODEL
-
-    print(f"[DEBUG] build_mrpromptbuilderagent: token found, length={len(token)}", file=sys.stderr)
-    config = ApiConfig(
-        url=url,
-        token=token,
-        model=model,
-        temperature=args.mrpromptbuilderagent_temperature,
-        timeout=args.mrpromptbuilderagent_timeout,
-        include_raw=False,
-    )
-    print(f"[DEBUG] build_mrpromptbuilderagent: created config (url={config.url}, model={config.model}, temp={config.temperature})", file=sys.stderr)
-    client = HuggingFaceClient(config=config)
-    return MrPromptBuilderAgent(client)
+
+def _agent_defaults(keys: _AgentKeys) -> dict[str, Any]:
+    """Namespace values an agent gets when none of its options were registered."""
+    return {
+        keys.url_arg: "",
+        keys.model_arg: "",
+        keys.temperature_arg: DEFAULT_HUGGING_TEMPERATURE,
+        keys.timeout_arg: 300.0,
+        keys.token_arg: None,
+    }
 
 
 def parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
+    argv = list(sys.argv[1:] if argv is None else argv)
     parser = argparse.ArgumentParser(
         description="Run a debate between the HuggingFace WRICEF API and Perplexity until one responds with STOP."
     )
@@ -780,10 +316,26 @@ def parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
         type=Path,
         help="Path to save conversation transcript (.txt file). Default: transcripts/debate_TIMESTAMP.txt",
     )
-    from generate_wricef_prompts import (
-        DEFAULT_API_URL as DEFAULT_HUGGING_URL,
-        DEFAULT_MODEL as DEFAULT_HUGGING_MODEL,
-        DEFAULT_TEMPERATURE as DEFAULT_HUGGING_TEMPERATURE,
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Log startup, agent and client diagnostics to stderr (also enabled by DEBATE_DEBUG).",
+    )
+    parser.add_argument(
+        "--no-prompt-cache",
+        action="store_true",
+        help="Always call the APIs, even for a prompt already answered in this session.",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Print a single agent's response as it is generated.",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=MAX_CONCURRENCY,
+        help=f"Maximum agents calling their APIs at once when a round runs several (default: {MAX_CONCURRENCY}).",
     )
     parser.add_argument(
         "--hugging-url",
@@ -815,542 +367,49 @@ def parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
         "--perplexity-token",
         help="Perplexity session token (overrides PERPLEXITY_SESSION_TOKEN).",
     )
-    # Writer agent configuration
-    parser.add_argument(
-        "--writer-url",
-        default="",
-        help=f"Writer API endpoint (default: value from WRITER_API_URL environment variable, or {DEFAULT_HUGGING_URL} if not set).",
-    )
-    parser.add_argument(
-        "--writer-model",
-        default="",
-        help=f"Writer API model identifier (default: value from WRITER_MODEL environment variable, or {DEFAULT_HUGGING_MODEL} if not set).",
-    )
-    parser.add_argument(
-        "--writer-temperature",
-        type=float,
-        default=DEFAULT_HUGGING_TEMPERATURE,
-        help=f"Writer API sampling temperature (default: {DEFAULT_HUGGING_TEMPERATURE}).",
-    )
-    parser.add_argument(
-        "--writer-timeout",
-        type=float,
-        default=300.0,
-        help="Writer API timeout in seconds (default: 300).",
-    )
-    parser.add_argument(
-        "--writer-token",
-        help=f"Writer API token (overrides WRICEF_API_TOKEN).",
-    )
-    # AskQuestions agent configuration
-    parser.add_argument(
-        "--askquestions-url",
-        default="",
-        help=f"AskQuestions API endpoint (default: value from ASKQUESTIONS_API_URL environment variable, or {DEFAULT_HUGGING_URL} if not set).",
-    )
-    parser.add_argument(
-        "--askquestions-model",
-        default="",
-        help=f"AskQuestions API model identifier (default: value from ASKQUESTIONS_MODEL environment variable, or {DEFAULT_HUGGING_MODEL} if not set).",
-    )
-    parser.add_argument(
-        "--askquestions-temperature",
-        type=float,
-        default=DEFAULT_HUGGING_TEMPERATURE,
-        help=f"AskQuestions API sampling temperature (default: {DEFAULT_HUGGING_TEMPERATURE}).",
-    )
-    parser.add_argument(
-        "--askquestions-timeout",
-        type=float,
-        default=300.0,
-        help="AskQuestions API timeout in seconds (default: 300).",
-    )
-    parser.add_argument(
-        "--askquestions-token",
-        help=f"AskQuestions API token (overrides ASKQUESTIONS_TOKEN).",
-    )
-    # AnswerQuestions agent configuration
-    parser.add_argument(
-        "--answerquestions-url",
-        default="",
-        help=f"AnswerQuestions API endpoint (default: value from ANSWERQUESTIONS_API_URL environment variable, or {DEFAULT_HUGGING_URL} if not set).",
-    )
-    parser.add_argument(
-        "--answerquestions-model",
-        default="",
-        help=f"AnswerQuestions API model identifier (default: value from ANSWERQUESTIONS_MODEL environment variable, or {DEFAULT_HUGGING_MODEL} if not set).",
-    )
-    parser.add_argument(
-        "--answerquestions-temperature",
-        type=float,
-        default=DEFAULT_HUGGING_TEMPERATURE,
-        help=f"AnswerQuestions API sampling temperature (default: {DEFAULT_HUGGING_TEMPERATURE}).",
-    )
-    parser.add_argument(
-        "--answerquestions-timeout",
-        type=float,
-        default=300.0,
-        help="AnswerQuestions API timeout in seconds (default: 300).",
-    )
-    parser.add_argument(
-        "--answerquestions-token",
-        help=f"AnswerQuestions API token (overrides ANSWERQUESTIONS_TOKEN).",
-    )
-    # IntegrationExpert agent configuration
-    parser.add_argument(
-        "--integrationexpert-url",
-        default="",
-        help=f"IntegrationExpert API endpoint (default: value from INTEGRATIONEXPERT_API_URL environment variable, or {DEFAULT_HUGGING_URL} if not set).",
-    )
-    parser.add_argument(
-        "--integrationexpert-model",
-        default="",
-        help=f"IntegrationExpert API model identifier (default: value from INTEGRATIONEXPERT_MODEL environment variable, or {DEFAULT_HUGGING_MODEL} if not set).",
-    )
-    parser.add_argument(
-        "--integrationexpert-temperature",
-        type=float,
-        default=DEFAULT_HUGGING_TEMPERATURE,
-        help=f"IntegrationExpert API sampling temperature (default: {DEFAULT_HUGGING_TEMPERATURE}).",
-    )
-    parser.add_argument(
-        "--integrationexpert-timeout",
-        type=float,
-        default=300.0,
-        help="IntegrationExpert API timeout in seconds (default: 300).",
-    )
-    parser.add_argument(
-        "--integrationexpert-token",
-        help=f"IntegrationExpert API token (overrides INTEGRATIONEXPERT_TOKEN).",
-    )
-    # FunctionalSpec agent configuration
-    parser.add_argument(
-        "--functionalspec-url",
-        default="",
-        help=f"FunctionalSpec API endpoint (default: value from FUNCTIONALSPEC_API_URL environment variable, or {DEFAULT_HUGGING_URL} if not set).",
-    )
-    parser.add_argument(
-        "--functionalspec-model",
-        default="",
-        help=f"FunctionalSpec API model identifier (default: value from FUNCTIONALSPEC_MODEL environment variable, or {DEFAULT_HUGGING_MODEL} if not set).",
-    )
-    parser.add_argument(
-        "--functionalspec-temperature",
-        type=float,
-        default=DEFAULT_HUGGING_TEMPERATURE,
-        help=f"FunctionalSpec API sampling temperature (default: {DEFAULT_HUGGING_TEMPERATURE}).",
-    )
-    parser.add_argument(
-        "--functionalspec-timeout",
-        type=float,
-        default=300.0,
-        help="FunctionalSpec API timeout in seconds (default: 300).",
-    )
-    parser.add_argument(
-        "--functionalspec-token",
-        help=f"FunctionalSpec API token (overrides FUNCTIONALSPEC_TOKEN).",
-    )
-    # TechnicalSpec agent configuration
-    parser.add_argument(
-        "--technicalspec-url",
-        default="",
-        help=f"TechnicalSpec API endpoint (default: value from TECHNICALSPEC_API_URL environment variable, or {DEFAULT_HUGGING_URL} if not set).",
-    )
-    parser.add_argument(
-        "--technicalspec-model",
-        default="",
-        help=f"TechnicalSpec API model identifier (default: value from TECHNICALSPEC_MODEL environment variable, or {DEFAULT_HUGGING_MODEL} if not set).",
-    )
-    parser.add_argument(
-        "--technicalspec-temperature",
-        type=float,
-        default=DEFAULT_HUGGING_TEMPERATURE,
-        help=f"TechnicalSpec API sampling temperature (default: {DEFAULT_HUGGING_TEMPERATURE}).",
-    )
-    parser.add_argument(
-        "--technicalspec-timeout",
-        type=float,
-        default=300.0,
-        help="TechnicalSpec API timeout in seconds (default: 300).",
-    )
-    parser.add_argument(
-        "--technicalspec-token",
-        help=f"TechnicalSpec API token (overrides TECHNICALSPEC_TOKEN).",
-    )
-    # ConfigurationAgent configuration
-    parser.add_argument(
-        "--configagent-url",
-        default="",
-        help=f"Configuration API endpoint (default: value from CONFIGAGENT_API_URL environment variable, or {DEFAULT_HUGGING_URL} if not set).",
-    )
-    parser.add_argument(
-        "--configagent-model",
-        default="",
-        help=f"Configuration API model identifier (default: value from CONFIGAGENT_MODEL environment variable, or {DEFAULT_HUGGING_MODEL} if not set).",
-    )
-    parser.add_argument(
-        "--configagent-temperature",
-        type=float,
-        default=DEFAULT_HUGGING_TEMPERATURE,
-        help=f"Configuration API sampling temperature (default: {DEFAULT_HUGGING_TEMPERATURE}).",
-    )
-    parser.add_argument(
-        "--configagent-timeout",
-        type=float,
-        default=300.0,
-        help="Configuration API timeout in seconds (default: 300).",
-    )
-    parser.add_argument(
-        "--configagent-token",
-        help=f"Configuration API token (overrides CONFIGAGENT_TOKEN).",
-    )
-    # DataMigrationAgent configuration
-    parser.add_argument(
-        "--datamigrationagent-url",
-        default="",
-        help=f"DataMigration API endpoint (default: value from DATAMIGRATIONAGENT_API_URL environment variable, or {DEFAULT_HUGGING_URL} if not set).",
-    )
-    parser.add_argument(
-        "--datamigrationagent-model",
-        default="",
-        help=f"DataMigration API model identifier (default: value from DATAMIGRATIONAGENT_MODEL environment variable, or {DEFAULT_HUGGING_MODEL} if not set).",
-    )
-    parser.add_argument(
-        "--datamigrationagent-temperature",
-        type=float,
-        default=DEFAULT_HUGGING_TEMPERATURE,
-        help=f"DataMigration API sampling temperature (default: {DEFAULT_HUGGING_TEMPERATURE}).",
-    )
-    parser.add_argument(
-        "--datamigrationagent-timeout",
-        type=float,
-        default=300.0,
-        help="DataMigration API timeout in seconds (default: 300).",
-    )
-    parser.add_argument(
-        "--datamigrationagent-token",
-        help=f"DataMigration API token (overrides DATAMIGRATIONAGENT_TOKEN).",
-    )
-    # ReportingAgent configuration
-    parser.add_argument(
-        "--reportingagent-url",
-        default="",
-        help=f"Reporting API endpoint (default: value from REPORTINGAGENT_API_URL environment variable, or {DEFAULT_HUGGING_URL} if not set).",
-    )
-    parser.add_argument(
-        "--reportingagent-model",
-        default="",
-        help=f"Reporting API model identifier (default: value from REPORTINGAGENT_MODEL environment variable, or {DEFAULT_HUGGING_MODEL} if not set).",
-    )
-    parser.add_argument(
-        "--reportingagent-temperature",
-        type=float,
-        default=DEFAULT_HUGGING_TEMPERATURE,
-        help=f"Reporting API sampling temperature (default: {DEFAULT_HUGGING_TEMPERATURE}).",
-    )
-    parser.add_argument(
-        "--reportingagent-timeout",
-        type=float,
-        default=300.0,
-        help="Reporting API timeout in seconds (default: 300).",
-    )
-    parser.add_argument(
-        "--reportingagent-token",
-        help=f"Reporting API token (overrides REPORTINGAGENT_TOKEN).",
-    )
-    # SecurityAgent configuration
-    parser.add_argument(
-        "--securityagent-url",
-        default="",
-        help=f"Security API endpoint (default: value from SECURITYAGENT_API_URL environment variable, or {DEFAULT_HUGGING_URL} if not set).",
-    )
-    parser.add_argument(
-        "--securityagent-model",
-        default="",
-        help=f"Security API model identifier (default: value from SECURITYAGENT_MODEL environment variable, or {DEFAULT_HUGGING_MODEL} if not set).",
-    )
-    parser.add_argument(
-        "--securityagent-temperature",
-        type=float,
-        default=DEFAULT_HUGGING_TEMPERATURE,
-        help=f"Security API sampling temperature (default: {DEFAULT_HUGGING_TEMPERATURE}).",
-    )
-    parser.add_argument(
-        "--securityagent-timeout",
-        type=float,
-        default=300.0,
-        help="Security API timeout in seconds (default: 300).",
-    )
-    parser.add_argument(
-        "--securityagent-token",
-        help=f"Security API token (overrides SECURITYAGENT_TOKEN).",
-    )
-    # TestingAgent configuration
-    parser.add_argument(
-        "--testingagent-url",
-        default="",
-        help=f"Testing API endpoint (default: value from TESTINGAGENT_API_URL environment variable, or {DEFAULT_HUGGING_URL} if not set).",
-    )
-    parser.add_argument(
-        "--testingagent-model",
-        default="",
-        help=f"Testing API model identifier (default: value from TESTINGAGENT_MODEL environment variable, or {DEFAULT_HUGGING_MODEL} if not set).",
-    )
-    parser.add_argument(
-        "--testingagent-temperature",
-        type=float,
-        default=DEFAULT_HUGGING_TEMPERATURE,
-        help=f"Testing API sampling temperature (default: {DEFAULT_HUGGING_TEMPERATURE}).",
-    )
-    parser.add_argument(
-        "--testingagent-timeout",
-        type=float,
-        default=300.0,
-        help="Testing API timeout in seconds (default: 300).",
-    )
-    parser.add_argument(
-        "--testingagent-token",
-        help=f"Testing API token (overrides TESTINGAGENT_TOKEN).",
-    )
-    # ChangeMgmtAgent configuration
-    parser.add_argument(
-        "--changemgmtagent-url",
-        default="",
-        help=f"ChangeMgmt API endpoint (default: value from CHANGEMGMTAGENT_API_URL environment variable, or {DEFAULT_HUGGING_URL} if not set).",
-    )
-    parser.add_argument(
-        "--changemgmtagent-model",
-        default="",
-        help=f"ChangeMgmt API model identifier (default: value from CHANGEMGMTAGENT_MODEL environment variable, or {DEFAULT_HUGGING_MODEL} if not set).",
-    )
-    parser.add_argument(
-        "--changemgmtagent-temperature",
-        type=float,
-        default=DEFAULT_HUGGING_TEMPERATURE,
-        help=f"ChangeMgmt API sampling temperature (default: {DEFAULT_HUGGING_TEMPERATURE}).",
-    )
-    parser.add_argument(
-        "--changemgmtagent-timeout",
-        type=float,
-        default=300.0,
-        help="ChangeMgmt API timeout in seconds (default: 300).",
-    )
-    parser.add_argument(
-        "--changemgmtagent-token",
-        help=f"ChangeMgmt API token (overrides CHANGEMGMTAGENT_TOKEN).",
-    )
-    # MonitoringAgent configuration
-    parser.add_argument(
-        "--monitoringagent-url",
-        default="",
-        help=f"Monitoring API endpoint (default: value from MONITORINGAGENT_API_URL environment variable, or {DEFAULT_HUGGING_URL} if not set).",
-    )
-    parser.add_argument(
-        "--monitoringagent-model",
-        default="",
-        help=f"Monitoring API model identifier (default: value from MONITORINGAGENT_MODEL environment variable, or {DEFAULT_HUGGING_MODEL} if not set).",
-    )
-    parser.add_argument(
-        "--monitoringagent-temperature",
-        type=float,
-        default=DEFAULT_HUGGING_TEMPERATURE,
-        help=f"Monitoring API sampling temperature (default: {DEFAULT_HUGGING_TEMPERATURE}).",
-    )
-    parser.add_argument(
-        "--monitoringagent-timeout",
-        type=float,
-        default=300.0,
-        help="Monitoring API timeout in seconds (default: 300).",
-    )
-    parser.add_argument(
-        "--monitoringagent-token",
-        help=f"Monitoring API token (overrides MONITORINGAGENT_TOKEN).",
-    )
-    # LearningAgent configuration
-    parser.add_argument(
-        "--learningagent-url",
-        default="",
-        help=f"Learning API endpoint (default: value from LEARNINGAGENT_API_URL environment variable, or {DEFAULT_HUGGING_URL} if not set).",
-    )
-    parser.add_argument(
-        "--learningagent-model",
-        default="",
-        help=f"Learning API model identifier (default: value from LEARNINGAGENT_MODEL environment variable, or {DEFAULT_HUGGING_MODEL} if not set).",
-    )
-    parser.add_argument(
-        "--learningagent-temperature",
-        type=float,
-        default=DEFAULT_HUGGING_TEMPERATURE,
-        help=f"Learning API sampling temperature (default: {DEFAULT_HUGGING_TEMPERATURE}).",
-    )
-    parser.add_argument(
-        "--learningagent-timeout",
-        type=float,
-        default=300.0,
-        help="Learning API timeout in seconds (default: 300).",
-    )
-    parser.add_argument(
-        "--learningagent-token",
-        help=f"Learning API token (overrides LEARNINGAGENT_TOKEN).",
-    )
-    # MetadataExtractAgent configuration
-    parser.add_argument(
-        "--metadataextractagent-url",
-        default="",
-        help=f"MetadataExtract API endpoint (default: value from METADATAEXTRACTAGENT_API_URL environment variable, or {DEFAULT_HUGGING_URL} if not set).",
-    )
-    parser.add_argument(
-        "--metadataextractagent-model",
-        default="",
-        help=f"MetadataExtract API model identifier (default: value from METADATAEXTRACTAGENT_MODEL environment variable, or {DEFAULT_HUGGING_MODEL} if not set).",
-    )
-    parser.add_argument(
-        "--metadataextractagent-temperature",
-        type=float,
-        default=DEFAULT_HUGGING_TEMPERATURE,
-        help=f"MetadataExtract API sampling temperature (default: {DEFAULT_HUGGING_TEMPERATURE}).",
-    )
-    parser.add_argument(
-        "--metadataextractagent-timeout",
-        type=float,
-        default=300.0,
-        help="MetadataExtract API timeout in seconds (default: 300).",
-    )
-    parser.add_argument(
-        "--metadataextractagent-token",
-        help=f"MetadataExtract API token (overrides METADATAEXTRACTAGENT_TOKEN).",
-    )
-    # InternetResearchAgent configuration
     parser.add_argument(
         "--internetresearch-token",
         help="InternetResearch Perplexity session token (overrides INTERNET_RESEARCH_TOKEN or PERPLEXITY_SESSION_TOKEN).",
     )
-    # CritiqueAgent configuration
-    parser.add_argument(
-        "--critiqueagent-url",
-        default="",
-        help=f"Critique API endpoint (default: value from CRITIQUEAGENT_API_URL environment variable, or {DEFAULT_HUGGING_URL} if not set).",
-    )
-    parser.add_argument(
-        "--critiqueagent-model",
-        default="",
-        help=f"Critique API model identifier (default: value from CRITIQUEAGENT_MODEL environment variable, or {DEFAULT_HUGGING_MODEL} if not set).",
-    )
-    parser.add_argument(
-        "--critiqueagent-temperature",
-        type=float,
-        default=DEFAULT_HUGGING_TEMPERATURE,
-        help=f"Critique API sampling temperature (default: {DEFAULT_HUGGING_TEMPERATURE}).",
-    )
-    parser.add_argument(
-        "--critiqueagent-timeout",
-        type=float,
-        default=300.0,
-        help="Critique API timeout in seconds (default: 300).",
-    )
-    parser.add_argument(
-        "--critiqueagent-token",
-        help=f"Critique API token (overrides CRITIQUEAGENT_TOKEN).",
-    )
-    # CompressionAgent configuration
-    parser.add_argument(
-        "--compressionagent-url",
-        default="",
-        help=f"Compression API endpoint (default: value from COMPRESSIONAGENT_API_URL environment variable, or {DEFAULT_HUGGING_URL} if not set).",
-    )
-    parser.add_argument(
-        "--compressionagent-model",
-        default="",
-        help=f"Compression API model identifier (default: value from COMPRESSIONAGENT_MODEL environment variable, or {DEFAULT_HUGGING_MODEL} if not set).",
-    )
-    parser.add_argument(
-        "--compressionagent-temperature",
-        type=float,
-        default=DEFAULT_HUGGING_TEMPERATURE,
-        help=f"Compression API sampling temperature (default: {DEFAULT_HUGGING_TEMPERATURE}).",
-    )
-    parser.add_argument(
-        "--compressionagent-timeout",
-        type=float,
-        default=300.0,
-        help="Compression API timeout in seconds (default: 300).",
-    )
-    parser.add_argument(
-        "--compressionagent-token",
-        help=f"Compression API token (overrides COMPRESSIONAGENT_TOKEN).",
-    )
-    # TodoAgent configuration
-    parser.add_argument(
-        "--todoagent-url",
-        default="",
-        help=f"Todo API endpoint (default: value from TODOAGENT_API_URL environment variable, or {DEFAULT_HUGGING_URL} if not set).",
-    )
-    parser.add_argument(
-        "--todoagent-model",
-        default="",
-        help=f"Todo API model identifier (default: value from TODOAGENT_MODEL environment variable, or {DEFAULT_HUGGING_MODEL} if not set).",
-    )
-    parser.add_argument(
-        "--todoagent-temperature",
-        type=float,
-        default=DEFAULT_HUGGING_TEMPERATURE,
-        help=f"Todo API sampling temperature (default: {DEFAULT_HUGGING_TEMPERATURE}).",
-    )
-    parser.add_argument(
-        "--todoagent-timeout",
-        type=float,
-        default=300.0,
-        help="Todo API timeout in seconds (default: 300).",
-    )
-    parser.add_argument(
-        "--todoagent-token",
-        help=f"Todo API token (overrides TODOAGENT_TOKEN).",
-    )
-    # MrPromptBuilderAgent configuration
-    parser.add_argument(
-        "--mrpromptbuilderagent-url",
-        default="",
-        help=f"MrPromptBuilder API endpoint (default: value from MRPROMPTBUILDERAGENT_API_URL environment variable, or {DEFAULT_HUGGING_URL} if not set).",
-    )
-    parser.add_argument(
-        "--mrpromptbuilderagent-model",
-        default="",
-        help=f"MrPromptBuilder API model identifier (default: value from MRPROMPTBUILDERAGENT_MODEL environment variable, or {DEFAULT_HUGGING_MODEL} if not set).",
-    )
-    parser.add_argument(
-        "--mrpromptbuilderagent-temperature",
-        type=float,
-        default=DEFAULT_HUGGING_TEMPERATURE,
-        help=f"MrPromptBuilder API sampling temperature (default: {DEFAULT_HUGGING_TEMPERATURE}).",
-    )
-    parser.add_argument(
-        "--mrpromptbuilderagent-timeout",
-        type=float,
-        default=300.0,
-        help="MrPromptBuilder API timeout in seconds (default: 300).",
-    )
-    parser.add_argument(
-        "--mrpromptbuilderagent-token",
-        help=f"MrPromptBuilder API token (overrides MRPROMPTBUILDERAGENT_TOKEN).",
-    )
+    # WRICEF-backed agents share one option shape. Only agents named on the
+    # command line (or every agent, for --help) get their options registered;
+    # the rest receive the same defaults directly.
+    show_all = "-h" in argv or "--help" in argv
+    for prefix, (label, _kind) in _AGENT_SPECS.items():
+        keys = _AGENT_KEYS[prefix]
+        if show_all or any(arg.startswith(keys.option_prefix) for arg in argv):
+            _add_agent_args(parser, prefix, label, keys)
+        else:
+            parser.set_defaults(**_agent_defaults(keys))
     return parser.parse_args(argv)
 
 
+def _configure_logging(debug: bool) -> None:
+    """Send the debate package's log records to stderr; third-party loggers are left alone."""
+    package_logger = logging.getLogger(__package__)
+    package_logger.setLevel(logging.DEBUG if debug else logging.WARNING)
+    if not package_logger.handlers:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+        package_logger.addHandler(handler)
+        package_logger.propagate = False
+
+
 def main(argv: Iterable[str] | None = None) -> int:
-    print("[DEBUG] main: loading .env", file=sys.stderr)
-    load_dotenv()
-    print("[DEBUG] main: parsing arguments", file=sys.stderr)
+    _load_env_once()
     args = parse_args(argv)
+    _configure_logging(bool(args.debug or _env("DEBATE_DEBUG").strip()))
+    logger.debug("main: loaded .env and parsed arguments")
 
     # Load topic from file or use direct argument
     if args.topic_file:
-        print(f"[DEBUG] main: loading topic from file {args.topic_file}", file=sys.stderr)
+        logger.debug("main: loading topic from file %s", args.topic_file)
         try:
             topic = args.topic_file.read_text(encoding="utf-8").strip()
             if not topic:
                 print(f"[ERROR] Topic file {args.topic_file} is empty", file=sys.stderr)
                 return 1
-            print(f"[DEBUG] main: loaded topic from file ({len(topic)} chars)", file=sys.stderr)
+            logger.debug("main: loaded topic from file (%d chars)", len(topic))
         except FileNotFoundError:
             print(f"[ERROR] Topic file not found: {args.topic_file}", file=sys.stderr)
             return 1
@@ -1359,9 +418,9 @@ def main(argv: Iterable[str] | None = None) -> int:
             return 1
     else:
         topic = args.topic
-        print(f"[DEBUG] main: using topic from argument", file=sys.stderr)
+        logger.debug("main: using topic from argument")
 
-    print(f"[DEBUG] main: parsed args: topic_length={len(topic)}, max_rounds={args.max_rounds}, first_speaker={args.first_speaker}", file=sys.stderr)
+    logger.debug("main: parsed args: topic_length=%d, max_rounds=%s, first_speaker=%s", len(topic), args.max_rounds, args.first_speaker)
 
     # Determine transcript file path
     if args.transcript:
@@ -1371,81 +430,36 @@ def main(argv: Iterable[str] | None = None) -> int:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         transcript_file = Path("transcripts") / f"debate_{timestamp}.txt"
 
-    print(f"[DEBUG] main: transcript_file={transcript_file}", file=sys.stderr)
+    logger.debug("main: transcript_file=%s", transcript_file)
 
-    print("[DEBUG] main: building Hugging config", file=sys.stderr)
+    logger.debug("main: building Hugging config")
     hugging_config = build_hugging_config(args)
-    print("[DEBUG] main: building Perplexity agent", file=sys.stderr)
+    logger.debug("main: building Perplexity agent")
     perplexity_agent = build_perplexity_agent(args)
-    print("[DEBUG] main: creating HuggingDebater", file=sys.stderr)
-    hugging_agent = HuggingDebater(HuggingFaceClient(hugging_config))
-    print("[DEBUG] main: creating WriterDebater", file=sys.stderr)
-    writer_agent = build_writer_agent(args)
-    print("[DEBUG] main: creating AskQuestionsDebater", file=sys.stderr)
-    askquestions_agent = build_askquestions_agent(args)
-    print("[DEBUG] main: creating AnswerQuestionsDebater", file=sys.stderr)
-    answerquestions_agent = build_answerquestions_agent(args)
-    print("[DEBUG] main: creating IntegrationExpertDebater", file=sys.stderr)
-    integrationexpert_agent = build_integrationexpert_agent(args)
-    print("[DEBUG] main: creating FunctionalSpecDebater", file=sys.stderr)
-    functionalspec_agent = build_functionalspec_agent(args)
-    print("[DEBUG] main: creating TechnicalSpecDebater", file=sys.stderr)
-    technicalspec_agent = build_technicalspec_agent(args)
-    print("[DEBUG] main: creating ConfigurationAgent", file=sys.stderr)
-    configagent_agent = build_configagent(args)
-    print("[DEBUG] main: creating DataMigrationAgent", file=sys.stderr)
-    datamigrationagent_agent = build_datamigrationagent(args)
-    print("[DEBUG] main: creating ReportingAgent", file=sys.stderr)
-    reportingagent_agent = build_reportingagent(args)
-    print("[DEBUG] main: creating SecurityAgent", file=sys.stderr)
-    securityagent_agent = build_securityagent(args)
-    print("[DEBUG] main: creating TestingAgent", file=sys.stderr)
-    testingagent_agent = build_testingagent(args)
-    print("[DEBUG] main: creating ChangeMgmtAgent", file=sys.stderr)
-    changemgmtagent_agent = build_changemgmtagent(args)
-    print("[DEBUG] main: creating MonitoringAgent", file=sys.stderr)
-    monitoringagent_agent = build_monitoringagent(args)
-    print("[DEBUG] main: creating LearningAgent", file=sys.stderr)
-    learningagent_agent = build_learningagent(args)
-    print("[DEBUG] main: creating MetadataExtractAgent", file=sys.stderr)
-    metadataextractagent_agent = build_metadataextractagent(args)
-    print("[DEBUG] main: creating InternetResearchAgent", file=sys.stderr)
+    logger.debug("main: creating HuggingDebater")
+    hugging_agent = _make_agent("HuggingDebater", _get_hf_client(hugging_config))
+    logger.debug("main: creating WRICEF-backed agents")
+    wricef_agents = {prefix: build_agent(args, prefix) for prefix in _AGENT_SPECS}
+    logger.debug("main: creating InternetResearchAgent")
     internetresearch_agent = build_internetresearch_agent(args)
-    print("[DEBUG] main: creating CritiqueAgent", file=sys.stderr)
-    critiqueagent_agent = build_critiqueagent(args)
-    print("[DEBUG] main: creating CompressionAgent", file=sys.stderr)
-    compressionagent_agent = build_compressionagent(args)
-    print("[DEBUG] main: creating TodoAgent", file=sys.stderr)
-    todoagent_agent = build_todoagent(args)
-    print("[DEBUG] main: creating MrPromptBuilderAgent", file=sys.stderr)
-    mrpromptbuilderagent_agent = build_mrpromptbuilderagent(args)
-
-    print("[DEBUG] main: starting debate", file=sys.stderr)
-    return run_debate(
-        topic,
-        hugging_agent,
-        perplexity_agent,
-        writer_agent,
-        askquestions_agent,
-        answerquestions_agent,
-        integrationexpert_agent,
-        functionalspec_agent,
-        technicalspec_agent,
-        configagent_agent,
-        datamigrationagent_agent,
-        reportingagent_agent,
-        securityagent_agent,
-        testingagent_agent,
-        changemgmtagent_agent,
-        monitoringagent_agent,
-        learningagent_agent,
-        metadataextractagent_agent,
-        internetresearch_agent,
-        critiqueagent_agent,
-        compressionagent_agent,
-        todoagent_agent,
-        mrpromptbuilderagent_agent,
-        max_rounds=max(1, args.max_rounds),
-        first_speaker=args.first_speaker,
-        transcript_file=transcript_file,
-    )
+
+    agents = (hugging_agent, perplexity_agent, internetresearch_agent, *wricef_agents.values())
+    prewarm((agent.client for agent in agents), connections=max(1, args.max_concurrency))
+
+    logger.debug("main: starting debate")
+    try:
+        return run_debate(
+            topic,
+            hugging=hugging_agent,
+            perplexity=perplexity_agent,
+            internetresearch_agent=internetresearch_agent,
+            **wricef_agents,
+            max_rounds=max(1, args.max_rounds),
+            first_speaker=args.first_speaker,
+            transcript_file=transcript_file,
+            bypass_cache=args.no_prompt_cache,
+            max_concurrency=max(1, args.max_concurrency),
+            stream=args.stream,
+        )
+    finally:
+        close_clients()
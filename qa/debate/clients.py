@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-import sys
+import logging
 import time
+import threading
 import requests
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Iterable, Iterator
+
+from requests.adapters import HTTPAdapter
 
 from generate_wricef_prompts import (
     DEFAULT_API_URL as DEFAULT_HUGGING_URL,
@@ -15,11 +18,71 @@ from generate_wricef_prompts import (
     ENV_TOKEN_KEY as HUGGING_TOKEN_ENV,
     ApiConfig as BaseApiConfig,
     call_wricef_api as base_call_wricef_api,
+    stream_wricef_api as base_stream_wricef_api,
 )
-from pplx_harness.net.pplx import PplxAdapter, collect_stream_text
+from pplx_harness.net.pplx import PplxAdapter, collect_stream_text, iter_stream_text, stream_timeout
+
+logger = logging.getLogger(__name__)
+
+
+# Keep-alive pool shared by every HuggingFaceClient; sized for a round that
+# fans out to all agents at once.
+HTTP_POOL_CONNECTIONS = 20
+HTTP_POOL_MAXSIZE = 50
+
+_http_session: requests.Session | None = None
+_http_session_lock = threading.Lock()
+_perplexity_clients: dict[str, "PerplexityClient"] = {}
+
+
+def http_session() -> requests.Session:
+    """Return the process-wide pooled session, creating it on first use."""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _http_session = session
+        return _http_session
+
+
+def prewarm(clients: Iterable[Any], connections: int = 1, timeout: float = 5.0) -> None:
+    """
+    Open up to ``connections`` keep-alive connections to each distinct HuggingFace
+    endpoint in the background, so the first round skips the TCP/TLS handshakes.
+    Clients without an HTTP config are ignored; failures are only logged.
+    """
+    urls = dict.fromkeys(
+        client.config.url for client in clients if isinstance(client, HuggingFaceClient) and client.config.url
+    )
+    if not urls:
+        return
+    session = http_session()
+
+    def warm(url: str) -> None:
+        try:
+            session.head(url, timeout=timeout, allow_redirects=False).close()
+        except requests.RequestException as exc:
+            logger.debug("prewarm: %s unreachable: %r", url, exc)
+
+    count = max(1, min(connections, HTTP_POOL_MAXSIZE))
+    for url in urls:
+        for _ in range(count):
+            threading.Thread(target=warm, args=(url,), name="debate-prewarm", daemon=True).start()
+
 
+def close_http_session() -> None:
+    """Close the pooled session; the next call to ``http_session`` opens a fresh one."""
+    global _http_session
+    with _http_session_lock:
+        session, _http_session = _http_session, None
+    if session is not None:
+        session.close()
 
-@dataclass(slots=True)
+
+@dataclass(frozen=True, slots=True)
 class ApiConfig:
     url: str
     token: str | None
@@ -34,33 +97,85 @@ class HuggingFaceClient:
 
     def __init__(self, config: ApiConfig):
         self.config = config
+        # Prompt-cache identity: clients with equal endpoint settings give equal answers.
+        self.cache_key = ("wricef", config)
+
+    def __enter__(self) -> "HuggingFaceClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """No-op: the pooled session is shared, and ``close_clients`` owns its lifetime."""
 
     def call_api(self, prompt: str) -> str:
         """Call the HuggingFace API with the given prompt."""
-        print(f"[DEBUG] HuggingFaceClient: calling API with URL={self.config.url}, model={self.config.model}", file=sys.stderr)
-        # Show first 100 characters of the prompt for debugging
-        prompt_preview = prompt
-        print(f"[DEBUG] HuggingFaceClient: prompt preview='{prompt_preview}'", file=sys.stderr)
+        logger.debug("HuggingFaceClient: calling API with URL=%s, model=%s", self.config.url, self.config.model)
+        logger.debug("HuggingFaceClient: prompt preview='%s'", prompt)
         start_time = time.time()
-        text, _ = base_call_wricef_api(prompt, config=self.config)
+        text, _ = base_call_wricef_api(prompt, config=self.config, session=http_session())
         elapsed = time.time() - start_time
-        print(f"[DEBUG] HuggingFaceClient: API returned {len(text)} chars in {elapsed:.2f}s", file=sys.stderr)
+        logger.debug("HuggingFaceClient: API returned %d chars in %.2fs", len(text), elapsed)
         return text.strip()
 
+    def call_api_stream(self, prompt: str) -> Iterator[str]:
+        """Yield the HuggingFace response as it is generated."""
+        logger.debug("HuggingFaceClient: streaming API with URL=%s, model=%s", self.config.url, self.config.model)
+        yield from base_stream_wricef_api(prompt, config=self.config, session=http_session())
+
 
 class PerplexityClient:
     """Client for interacting with Perplexity API."""
 
     def __init__(self, session_token: str):
         self._client = PplxAdapter(session_token=session_token)
+        self.cache_key = ("perplexity", session_token)
+
+    @classmethod
+    def shared(cls, session_token: str) -> "PerplexityClient":
+        """Return one client per session token so agents reuse its connections."""
+        with _http_session_lock:
+            client = _perplexity_clients.get(session_token)
+            if client is None:
+                client = _perplexity_clients[session_token] = cls(session_token)
+            return client
+
+    def __enter__(self) -> "PerplexityClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying Perplexity session when it supports closing."""
+        close = getattr(self._client._client, "close", None)
+        if callable(close):
+            close()
 
     def call_api(self, prompt: str) -> str:
         """Call the Perplexity API with the given prompt."""
-        # Show first 100 characters of the prompt for debugging
-        prompt_preview = prompt[:100] + "..." if len(prompt) > 100 else prompt
-        print(f"[DEBUG] PerplexityClient: calling with prompt preview='{prompt_preview}'", file=sys.stderr)
+        if logger.isEnabledFor(logging.DEBUG):
+            # Show first 100 characters of the prompt for debugging
+            prompt_preview = prompt[:100] + "..." if len(prompt) > 100 else prompt
+            logger.debug("PerplexityClient: calling with prompt preview='%s'", prompt_preview)
         start_time = time.time()
         text = collect_stream_text(self._client, prompt)
         elapsed = time.time() - start_time
-        print(f"[DEBUG] PerplexityClient: stream returned {len(text)} chars in {elapsed:.2f}s", file=sys.stderr)
+        logger.debug("PerplexityClient: stream returned %d chars in %.2fs", len(text), elapsed)
         return text.strip()
+
+    def call_api_stream(self, prompt: str) -> Iterator[str]:
+        """Yield the Perplexity answer as it grows."""
+        logger.debug("PerplexityClient: streaming prompt of %d chars", len(prompt))
+        yield from iter_stream_text(self._client.ask_stream(prompt), timeout=stream_timeout())
+
+
+def close_clients() -> None:
+    """Close every shared Perplexity client and the pooled HTTP session."""
+    with _http_session_lock:
+        clients = list(_perplexity_clients.values())
+        _perplexity_clients.clear()
+    for client in clients:
+        client.close()
+    close_http_session()
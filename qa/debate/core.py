@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import sys
 import argparse
 from datetime import datetime
 from pathlib import Path
-from typing import List, Sequence
+from typing import TYPE_CHECKING, Callable, List, Mapping, Sequence
 
-from .prompts import DebateTurn
+from .prompts import DebateTurn, format_history
+
+if TYPE_CHECKING:
+    from .agents import DebateAgent
 
 
 def should_stop(text: str) -> bool:
@@ -102,34 +106,163 @@ def initialize_transcript_file(filepath: Path, topic: str, max_rounds: int, firs
         print(f"[DEBUG] initialize_transcript_file: failed to create {filepath}: {exc!r}", file=sys.stderr)
 
 
+# Upper bound on agents awaiting their APIs at once when a round fans out.
+MAX_CONCURRENCY = 10
+
+
+class AgentResponseError(RuntimeError):
+    """Raised when an agent fails to respond; the original exception is chained as ``__cause__``."""
+
+    def __init__(self, responder_name: str) -> None:
+        super().__init__(f"{responder_name} failed to respond")
+        self.responder_name = responder_name
+
+
+def select_agents(round_idx: int, debaters: Mapping[str, "DebateAgent"]) -> list[str] | None:
+    """
+    Ask which agent(s) speak this round; comma-separated choices run together.
+    Returns the selected keys, or None when input is closed.
+    """
+    keys = list(debaters.keys())
+    print(f"\nRound {round_idx} - Available agents:")
+    for i, agent in enumerate(debaters.values(), 1):
+        print(f"  {i}. {agent.name}")
+    while True:
+        try:
+            user_input = input(
+                f"Select agent for round {round_idx} (1-{len(debaters)} or agent name; comma-separate to run several at once, or 'all'): "
+            ).strip().lower()
+        except (EOFError, KeyboardInterrupt):
+            print("\n[DEBUG] EOFError/KeyboardInterrupt during agent selection", file=sys.stderr)
+            print("\nNo input detected; stopping debate.")
+            return None
+        if user_input == "all":
+            return keys
+        selected: list[str] = []
+        for choice in filter(None, (part.strip() for part in user_input.split(","))):
+            agent_key = None
+            if choice.isdigit():
+                index = int(choice) - 1
+                if 0 <= index < len(debaters):
+                    agent_key = keys[index]
+            else:
+                for candidate in keys:
+                    if choice in [candidate, debaters[candidate].name.lower()]:
+                        agent_key = candidate
+                        break
+            if agent_key is None:
+                selected = []
+                break
+            if agent_key not in selected:
+                selected.append(agent_key)
+        if selected:
+            return selected
+        print(f"Invalid selection. Please enter a number between 1 and {len(debaters)}, or an agent name.")
+
+
+def pick_opponent(
+    responder: "DebateAgent",
+    responder_key: str,
+    history: Sequence[DebateTurn],
+    debaters: Mapping[str, "DebateAgent"],
+) -> "DebateAgent | None":
+    """Use the most recent speaker that is not the responder, else the first other agent."""
+    for turn in reversed(history):
+        if turn.speaker != responder.name:
+            opponent_agent = debaters.get(turn.speaker.lower())
+            if opponent_agent is not None and opponent_agent.name == turn.speaker:
+                return opponent_agent
+            break
+    for agent_key, agent in debaters.items():
+        if agent_key != responder_key:
+            return agent
+    return None
+
+
+def _write_live(text: str) -> None:
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+def respond_concurrently(
+    responders: Sequence["DebateAgent"],
+    topic: str,
+    history: Sequence[DebateTurn],
+    opponents: Sequence["DebateAgent | None"],
+    *,
+    bypass_cache: bool = False,
+    max_concurrency: int = MAX_CONCURRENCY,
+    on_text: Callable[[str], None] | None = None,
+) -> list[str]:
+    """
+    Collect one response per agent, in order. A single agent is called directly,
+    streaming each piece to ``on_text`` when given; several are awaited together,
+    at most ``max_concurrency`` in flight at a time.
+    The history is formatted once and shared by every agent in the round.
+    """
+    conversation = format_history(history)
+    if len(responders) == 1:
+        try:
+            if on_text is None:
+                return [responders[0].respond(topic, history, opponents[0], conversation, bypass_cache=bypass_cache)]
+            parts: list[str] = []
+            for piece in responders[0].respond_stream(topic, history, opponents[0], conversation, bypass_cache=bypass_cache):
+                parts.append(piece)
+                on_text(piece)
+            return ["".join(parts)]
+        except Exception as exc:
+            raise AgentResponseError(responders[0].name) from exc
+
+    async def gather() -> list[object]:
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def bounded(agent: "DebateAgent", opponent: "DebateAgent | None") -> str:
+            async with semaphore:
+                return await agent.arespond(topic, history, opponent, conversation, bypass_cache=bypass_cache)
+
+        return await asyncio.gather(
+            *(bounded(agent, opponent) for agent, opponent in zip(responders, opponents)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(gather())
+    for agent, result in zip(responders, results):
+        if isinstance(result, BaseException):
+            raise AgentResponseError(agent.name) from result
+    return [str(result) for result in results]
+
+
 def run_debate(
     topic: str,
-    hugging: "HuggingDebater",
-    perplexity: "PerplexityDebater",
-    writer: "WriterDebater",
-    askquestions: "AskQuestionsDebater",
-    answerquestions: "AnswerQuestionsDebater",
-    integrationexpert: "IntegrationExpertDebater",
-    functionalspec: "FunctionalSpecDebater",
-    technicalspec: "TechnicalSpecDebater",
-    configagent: "ConfigurationAgent",
-    datamigrationagent: "DataMigrationAgent",
-    reportingagent: "ReportingAgent",
-    securityagent: "SecurityAgent",
-    testingagent: "TestingAgent",
-    changemgmtagent: "ChangeMgmtAgent",
-    monitoringagent: "MonitoringAgent",
-    learningagent: "LearningAgent",
-    metadataextractagent: "MetadataExtractAgent",
-    internetresearch_agent: "InternetResearchAgent",
-    critiqueagent: "CritiqueAgent",
-    compressionagent: "CompressionAgent",
-    todoagent: "TodoAgent",
-    mrpromptbuilderagent: "MrPromptBuilderAgent",
+    hugging: "DebateAgent",
+    perplexity: "DebateAgent",
+    writer: "DebateAgent",
+    askquestions: "DebateAgent",
+    answerquestions: "DebateAgent",
+    integrationexpert: "DebateAgent",
+    functionalspec: "DebateAgent",
+    technicalspec: "DebateAgent",
+    configagent: "DebateAgent",
+    datamigrationagent: "DebateAgent",
+    reportingagent: "DebateAgent",
+    securityagent: "DebateAgent",
+    testingagent: "DebateAgent",
+    changemgmtagent: "DebateAgent",
+    monitoringagent: "DebateAgent",
+    learningagent: "DebateAgent",
+    metadataextractagent: "DebateAgent",
+    internetresearch_agent: "DebateAgent",
+    critiqueagent: "DebateAgent",
+    compressionagent: "DebateAgent",
+    todoagent: "DebateAgent",
+    mrpromptbuilderagent: "DebateAgent",
     *,
     max_rounds: int,
     first_speaker: str,
     transcript_file: Path | None = None,
+    bypass_cache: bool = False,
+    max_concurrency: int = MAX_CONCURRENCY,
+    stream: bool = False,
 ) -> int:
     print(f"[DEBUG] run_debate: topic='{topic}', max_rounds={max_rounds}, first_speaker={first_speaker}", file=sys.stderr)
 
@@ -168,154 +301,120 @@ def run_debate(
     print(f"Debate topic: {topic}\n")
     stop_reason = "max_rounds"
 
-    # --- AGENT SELECTION: Ask user to select agent for round 1 ---
-    print(f"\nRound 1 - Available agents:")
-    for i, (agent_key, agent) in enumerate(debaters.items(), 1):
-        print(f"  {i}. {agent.name}")
-    selected_agent_key = None
-    while selected_agent_key is None:
+    for round_idx in range(1, max_rounds + 1):
+        selected_agent_keys = select_agents(round_idx, debaters)
+        if selected_agent_keys is None:
+            return 0
+        responders = [debaters[agent_key] for agent_key in selected_agent_keys]
+        opponents = [
+            pick_opponent(responder, agent_key, history, debaters)
+            for responder, agent_key in zip(responders, selected_agent_keys)
+        ]
+        for responder, opponent in zip(responders, opponents):
+            print(f"[DEBUG] Round {round_idx}: speaker={responder.name}, opponent={opponent.name if opponent else 'None'}", file=sys.stderr)
+
+        streamed = stream and len(responders) == 1
+        if streamed:
+            print(f"Round {round_idx} - {responders[0].name}:")
         try:
-            user_input = input(f"Select agent for round 1 (1-{len(debaters)} or agent name): ").strip().lower()
-            if user_input.isdigit():
-                index = int(user_input) - 1
-                if 0 <= index < len(debaters):
-                    selected_agent_key = list(debaters.keys())[index]
+            responses = respond_concurrently(
+                responders,
+                topic,
+                history,
+                opponents,
+                bypass_cache=bypass_cache,
+                max_concurrency=max_concurrency,
+                on_text=_write_live if streamed else None,
+            )
+        except AgentResponseError as exc:
+            print(f"[DEBUG] Exception during {exc.responder_name}.respond: {exc.__cause__!r}", file=sys.stderr)
+            print(f"{exc.responder_name} failed to respond: {exc.__cause__}", file=sys.stderr)
+            return 1
+
+        # A Compression reset is applied once the whole round is recorded, so the
+        # other agents' responses in the same round are not lost.
+        reset_request: tuple[str, str] | None = None
+        agent_requested_stop = False
+        for responder, response in zip(responders, responses):
+            # Check if this is the CompressionAgent requesting a conversation reset
+            if responder.name == "Compression" and "RESET_CONVERSATION" in response.upper():
+                print(f"[DEBUG] CompressionAgent requested conversation reset", file=sys.stderr)
+                # Extract the compressed summary (everything after RESET_CONVERSATION marker)
+                reset_marker_pos = response.upper().find("RESET_CONVERSATION")
+                if reset_marker_pos >= 0:
+                    compressed_summary = response[reset_marker_pos + len("RESET_CONVERSATION"):].strip()
+                    if compressed_summary:
+                        reset_request = (responder.name, compressed_summary)
+                        continue
+
+            cleaned = response.strip() or "[No response]"
+            print(f"[DEBUG] Round {round_idx} response: length={len(cleaned)}, first_50_chars='{cleaned[:50]}'", file=sys.stderr)
+            turn = DebateTurn(speaker=responder.name, text=cleaned)
+            history.append(turn)
+
+            if streamed:
+                print("\n")
             else:
-                for agent_key in debaters.keys():
-                    if user_input in [agent_key, debaters[agent_key].name.lower()]:
-                        selected_agent_key = agent_key
-                        break
-            if selected_agent_key is None:
-                print(f"Invalid selection. Please enter a number between 1 and {len(debaters)}, or an agent name.")
-        except (EOFError, KeyboardInterrupt):
-            print("\n[DEBUG] EOFError/KeyboardInterrupt during agent selection", file=sys.stderr)
-            print("\nNo input detected; stopping debate.")
-            return 0
+                print(f"Round {round_idx} - {responder.name}:\n{cleaned}\n")
 
-    for round_idx in range(1, max_rounds + 1):
-        # For round 1, use the selected agent; for subsequent rounds, prompt user
-        if round_idx == 1:
-            responder = debaters[selected_agent_key]
-        else:
-            print(f"\nRound {round_idx} - Available agents:")
-            for i, (agent_key, agent) in enumerate(debaters.items(), 1):
-                print(f"  {i}. {agent.name}")
-            selected_agent_key = None
-            while selected_agent_key is None:
+            if transcript_file:
+                append_turn_to_file(transcript_file, turn, round_idx)
+
+            agent_requested_stop = should_stop(cleaned) or agent_requested_stop
+
+        if reset_request is not None:
+            reset_speaker, compressed_summary = reset_request
+            # Create a new conversation with the compressed summary as the first message
+            print(f"[DEBUG] Creating new conversation with compressed summary", file=sys.stderr)
+
+            # Save the current transcript if it exists
+            if transcript_file:
                 try:
-                    user_input = input(f"Select agent for round {round_idx} (1-{len(debaters)} or agent name): ").strip().lower()
-                    if user_input.isdigit():
-                        index = int(user_input) - 1
-                        if 0 <= index < len(debaters):
-                            selected_agent_key = list(debaters.keys())[index]
-                    else:
-                        for agent_key in debaters.keys():
-                            if user_input in [agent_key, debaters[agent_key].name.lower()]:
-                                selected_agent_key = agent_key
-                                break
-                    if selected_agent_key is None:
-                        print(f"Invalid selection. Please enter a number between 1 and {len(debaters)}, or an agent name.")
-                except (EOFError, KeyboardInterrupt):
-                    print("\n[DEBUG] EOFError/KeyboardInterrupt during agent selection", file=sys.stderr)
-                    print("\nNo input detected; stopping debate.")
-                    return 0
-            responder = debaters[selected_agent_key]
-
-        # Select opponent - use the most recent speaker that is not the current one
-        opponent = None
-        for turn in reversed(history):
-            if turn.speaker != responder.name:
-                opponent_agent = debaters[turn.speaker.lower()]
-                if opponent_agent.name == turn.speaker:
-                    opponent = opponent_agent
-                    break
-        if opponent is None:
-            for agent_key, agent in debaters.items():
-                if agent_key != selected_agent_key:
-                    opponent = agent
-                    break
-
-        print(f"[DEBUG] Round {round_idx}: speaker={responder.name}, opponent={opponent.name if opponent else 'None'}", file=sys.stderr)
+                    with transcript_file.open("a", encoding="utf-8") as f:
+                        f.write(f"\n{'=' * 80}\n")
+                        f.write(f"CONVERSATION COMPRESSED AND RESET\n")
+                        f.write(f"{'=' * 80}\n")
+                        f.write(f"Compressed Summary: {compressed_summary}\n")
+                        f.write(f"Reset triggered by: {reset_speaker}\n")
+                        f.write(f"Round: {round_idx}\n")
+                except Exception as exc:
+                    print(f"[DEBUG] Failed to append compression info to transcript: {exc!r}", file=sys.stderr)
 
-        try:
-            response = responder.respond(topic, history, opponent)
-        except Exception as exc:
-            print(f"[DEBUG] Exception during {responder.name}.respond: {exc!r}", file=sys.stderr)
-            print(f"{responder.name} failed to respond: {exc}", file=sys.stderr)
-            return 1
+            # Create a new transcript file for the reset conversation
+            if transcript_file:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                reset_transcript_file = transcript_file.parent / f"debate_reset_{timestamp}.txt"
+                print(f"[INFO] New conversation will be saved to: {reset_transcript_file}")
+
+                # Initialize the new transcript with the compressed summary
+                try:
+                    reset_transcript_file.parent.mkdir(parents=True, exist_ok=True)
+                    with reset_transcript_file.open("w", encoding="utf-8") as f:
+                        f.write(f"{'=' * 80}\n")
+                        f.write(f"Compressed Summary: {compressed_summary}\n")
+                        f.write(f"Reset Round: {round_idx}\n")
+                        f.write(f"{'=' * 80}\n")
+                        f.write(f"\nTask 1 - {reset_speaker} (Compressed Summary):\n{compressed_summary}\n")
+                    print(f"[DEBUG] Created new transcript with compressed summary", file=sys.stderr)
+
+                    # Update the transcript file reference to the new file
+                    transcript_file = reset_transcript_file
+                except Exception as exc:
+                    print(f"[DEBUG] Failed to create new transcript: {exc!r}", file=sys.stderr)
+
+            # Reset the history with just the compressed summary
+            history = [DebateTurn(speaker=reset_speaker, text=compressed_summary)]
+            print(f"[DEBUG] History reset with compressed summary", file=sys.stderr)
 
-        # Check if this is the CompressionAgent requesting a conversation reset
-        if responder.name == "Compression" and "RESET_CONVERSATION" in response.upper():
-            print(f"[DEBUG] CompressionAgent requested conversation reset", file=sys.stderr)
-            # Extract the compressed summary (everything after RESET_CONVERSATION marker)
-            reset_marker_pos = response.upper().find("RESET_CONVERSATION")
-            if reset_marker_pos >= 0:
-                compressed_summary = response[reset_marker_pos + len("RESET_CONVERSATION"):].strip()
-                if compressed_summary:
-                    # Create a new conversation with the compressed summary as the first message
-                    print(f"[DEBUG] Creating new conversation with compressed summary", file=sys.stderr)
-
-                    # Save the current transcript if it exists
-                    if transcript_file:
-                        try:
-                            with transcript_file.open("a", encoding="utf-8") as f:
-                                f.write(f"\n{'=' * 80}\n")
-                                f.write(f"CONVERSATION COMPRESSED AND RESET\n")
-                                f.write(f"{'=' * 80}\n")
-                                f.write(f"Compressed Summary: {compressed_summary}\n")
-                                f.write(f"Reset triggered by: {responder.name}\n")
-                                f.write(f"Round: {round_idx}\n")
-                        except Exception as exc:
-                            print(f"[DEBUG] Failed to append compression info to transcript: {exc!r}", file=sys.stderr)
-
-                    # Create a new transcript file for the reset conversation
-                    if transcript_file:
-                        from datetime import datetime
-                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                        reset_transcript_file = transcript_file.parent / f"debate_reset_{timestamp}.txt"
-                        print(f"[INFO] New conversation will be saved to: {reset_transcript_file}")
-
-                        # Initialize the new transcript with the compressed summary
-                        try:
-                            reset_transcript_file.parent.mkdir(parents=True, exist_ok=True)
-                            with reset_transcript_file.open("w", encoding="utf-8") as f:
-                                f.write(f"{'=' * 80}\n")
-                                f.write(f"Compressed Summary: {compressed_summary}\n")
-                                f.write(f"Reset Round: {round_idx}\n")
-                                f.write(f"{'=' * 80}\n")
-                                f.write(f"\nTask 1 - {responder.name} (Compressed Summary):\n{compressed_summary}\n")
-                            print(f"[DEBUG] Created new transcript with compressed summary", file=sys.stderr)
-
-                            # Update the transcript file reference to the new file
-                            transcript_file = reset_transcript_file
-                        except Exception as exc:
-                            print(f"[DEBUG] Failed to create new transcript: {exc!r}", file=sys.stderr)
-
-                    # Reset the history with just the compressed summary
-                    history = [DebateTurn(speaker=responder.name, text=compressed_summary)]
-                    print(f"[DEBUG] History reset with compressed summary", file=sys.stderr)
-
-                    # Continue with the next round using the reset history
-                    continue
-
-        cleaned = response.strip() or "[No response]"
-        print(f"[DEBUG] Round {round_idx} response: length={len(cleaned)}, first_50_chars='{cleaned[:50]}'", file=sys.stderr)
-        turn = DebateTurn(speaker=responder.name, text=cleaned)
-        history.append(turn)
-
-        print(f"Round {round_idx} - {responder.name}:\n{cleaned}\n")
-
-        if transcript_file:
-            append_turn_to_file(transcript_file, turn, round_idx)
-
-        agent_requested_stop = should_stop(cleaned)
+            # Continue with the next round using the reset history
+            continue
 
         if round_idx >= max_rounds:
             print(f"[DEBUG] Reached max_rounds ({max_rounds})", file=sys.stderr)
             stop_reason = "max_rounds"
             break
 
-        should_continue, user_feedback = prompt_user_continue(responder.name, agent_requested_stop)
+        should_continue, user_feedback = prompt_user_continue(responders[-1].name, agent_requested_stop)
 
         if not should_continue:
             print("[DEBUG] User requested stop", file=sys.stderr)
@@ -323,6 +422,7 @@ def run_debate(
             break
 
         if user_feedback:
+            turn = history[-1]
             turn.feedback = user_feedback
             print(f"[DEBUG] Attached feedback to round {round_idx}: {len(user_feedback)} chars", file=sys.stderr)
             if transcript_file:
@@ -1,6 +1,7 @@
 """Prompt templates and utilities."""
 
-from typing import Sequence
+from string import Formatter
+from typing import Callable, Sequence
 from dataclasses import dataclass
 
 
@@ -1341,3 +1342,39 @@ Make use of the discussion in the `Debate Transcript` provided as `{conversation
 Return comprehensive academic research findings and analysis based on the above instructions."""
 
 
+def compile_prompt(template: str) -> Callable[[str, str], str]:
+    """
+    Pre-split ``template`` on its ``{topic}``/``{conversation}`` fields so
+    rendering is a single join instead of re-parsing the format string.
+    """
+    pieces: list[str] = []
+    slots: list[tuple[int, str]] = []
+    for literal, field_name, _spec, _conversion in Formatter().parse(template):
+        pieces.append(literal)
+        if field_name is not None:
+            slots.append((len(pieces), field_name))
+            pieces.append("")
+
+    def render(topic: str, conversation: str) -> str:
+        values = {"topic": topic, "conversation": conversation}
+        parts = pieces.copy()
+        for index, field_name in slots:
+            parts[index] = values[field_name]
+        return "".join(parts)
+
+    return render
+
+
+_COMPILED: dict[str, Callable[[str, str], str]] = {
+    template: compile_prompt(template)
+    for name, template in list(globals().items())
+    if name.endswith("_PROMPT") and isinstance(template, str)
+}
+
+
+def render_prompt(template: str, topic: str, conversation: str) -> str:
+    """Equivalent to ``template.format(topic=..., conversation=...)`` using the compiled form."""
+    render = _COMPILED.get(template)
+    if render is None:
+        render = _COMPILED[template] = compile_prompt(template)
+    return render(topic, conversation)
@@ -8,12 +8,14 @@ import os
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterable, List, Optional, Set
+from typing import Any, Iterable, Iterator, List, Optional, Set
 import time
 import requests
 from typing import Any
 import requests
 import random
+
+import orjson
 from pplx_harness.prompts import build_wricef_prompt
 
 DEFAULT_API_URL = "https://kaballas-doe-tender.hf.space/api/v1/openai/chat/completions"
@@ -217,6 +219,60 @@ class ApiConfig:
 
 
 
+def _wricef_request(prompt: str, config, *, stream: bool = False) -> tuple[dict[str, str], dict[str, Any]]:
+    """Return the headers and JSON payload for a WRICEF completion request."""
+    headers = {
+        "accept": "*/*",
+        "Content-Type": "application/json",
+    }
+    if getattr(config, "token", None):
+        headers["Authorization"] = f"Bearer {config.token}"
+
+    payload = {
+        "messages": [{"role": "user", "content": prompt}],
+        "model": config.model,
+        "stream": stream,
+        "temperature": config.temperature,
+    }
+    return headers, payload
+
+
+def stream_wricef_api(
+    prompt: str,
+    *,
+    config,
+    session: requests.Session | None = None,
+) -> Iterator[str]:
+    """Stream a WRICEF completion, yielding content deltas from the server-sent events.
+
+    Not retried: once text has been yielded a retry would repeat it, so callers that
+    need retries should use ``call_wricef_api``.
+    """
+    headers, payload = _wricef_request(prompt, config, stream=True)
+    with (session or requests).post(
+        config.url,
+        headers=headers,
+        data=orjson.dumps(payload),
+        timeout=getattr(config, "timeout", None),
+        stream=True,
+    ) as response:
+        response.raise_for_status()
+        # Raw bytes: the event-stream is UTF-8 whatever charset requests would guess.
+        for line in response.iter_lines():
+            if not line.startswith(b"data:"):
+                continue
+            data = line[5:].strip()
+            if data == b"[DONE]":
+                break
+            try:
+                delta = orjson.loads(data)["choices"][0].get("delta") or {}
+            except (ValueError, KeyError, IndexError, TypeError, AttributeError) as exc:
+                raise ValueError("Unexpected API stream event structure") from exc
+            content = delta.get("content")
+            if content:
+                yield content
+
+
 def call_wricef_api(
     prompt: str,
     *,
@@ -224,9 +280,12 @@ def call_wricef_api(
     max_retries: int = 3,
     backoff_factor: float = 1.0,
     retry_on_404: bool = False,
+    session: requests.Session | None = None,
 ) -> tuple[str, dict[str, Any]]:
     """Send prompt to WRICEF completion API with retry logic and return content plus raw JSON.
 
+    Pass ``session`` to reuse pooled keep-alive connections across calls.
+
     Retries:
       - Network/timeout errors (requests.exceptions.RequestException)
       - HTTP 5xx
@@ -234,19 +293,8 @@ def call_wricef_api(
       - HTTP 404 only when retry_on_404=True
     Backoff: exponential with small jitter.
     """
-    headers = {
-        "accept": "*/*",
-        "Content-Type": "application/json",
-    }
-    if getattr(config, "token", None):
-        headers["Authorization"] = f"Bearer {config.token}"
-
-    payload = {
-        "messages": [{"role": "user", "content": prompt}],
-        "model": config.model,
-        "stream": False,
-        "temperature": config.temperature,
-    }
+    headers, payload = _wricef_request(prompt, config)
+    body = orjson.dumps(payload)
 
     base_retry_statuses = {408, 425, 429}
     if retry_on_404:
@@ -255,10 +303,10 @@ def call_wricef_api(
     last_exc = None
     for attempt in range(1, max_retries + 1):
         try:
-            response = requests.post(
+            response = (session or requests).post(
                 config.url,
                 headers=headers,
-                json=payload,
+                data=body,
                 timeout=getattr(config, "timeout", None),
             )
 
@@ -269,7 +317,11 @@ def call_wricef_api(
             # For non-retryable HTTP errors, raise immediately.
             response.raise_for_status()
 
-            data = response.json()
+            try:
+                data = orjson.loads(response.content)
+            except orjson.JSONDecodeError as exc:
+                # Keep malformed bodies retryable, as response.json() did.
+                raise requests.exceptions.InvalidJSONError(str(exc), response=response) from exc
             try:
                 content = data["choices"][0]["message"]["content"]
             except (KeyError, IndexError, TypeError) as exc:
@@ -2,17 +2,20 @@
 
 from __future__ import annotations
 
+from contextlib import nullcontext
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Optional
 
 from . import config
-from .io.jsonl import ensure_sample_input, read_jsonl, write_jsonl
-from .processing.pipeline import PipelineCallbacks, process_records
+from .io.jsonl import count_jsonl, ensure_sample_input, iter_jsonl, write_jsonl
+from .processing.pipeline import PipelineCallbacks, iter_process_records
 from .ui import console
 
 
 @dataclass(slots=True)
 class _ConsoleCallbacks(PipelineCallbacks):
+    progress: Optional[console.RecordProgress] = None
+
     def info(self, message: str) -> None:
         console.info(message)
 
@@ -23,8 +26,14 @@ class _ConsoleCallbacks(PipelineCallbacks):
         console.err(message)
 
     def panel_status(self, title: str):
+        if self.progress is not None:
+            return self.progress.status(title)
         return console.panel_status(title)
 
+    def advance(self, count: int = 1) -> None:
+        if self.progress is not None:
+            self.progress.advance(count)
+
 
 def main() -> None:
     """Main entrypoint invoked by ``python -m pplx_harness``."""
@@ -39,21 +48,36 @@ def main() -> None:
         ensure_sample_input(run_config.input_path)
 
     try:
-        records = read_jsonl(run_config.input_path, limit=run_config.max_records)
+        total = count_jsonl(run_config.input_path, limit=run_config.max_records)
     except Exception as exc:
         console.err(f"Error reading input file: {exc}")
         return
 
-    callbacks: PipelineCallbacks = _ConsoleCallbacks()
-    processed = process_records(
-        records,
-        run_config.client,
-        max_records=run_config.max_records,
-        callbacks=callbacks,
-    )
+    # Records are parsed as the pipeline asks for them and written as they finish.
+    records = iter_jsonl(run_config.input_path)
+    # Without a terminal no render thread is started at all.
+    progress_display = console.record_progress(total) if console.is_interactive() else nullcontext()
+    try:
+        with progress_display as progress:
+            callbacks: PipelineCallbacks = _ConsoleCallbacks(progress=progress)
+            processed = iter_process_records(
+                records,
+                run_config.client,
+                max_records=run_config.max_records,
+                callbacks=callbacks,
+                concurrency=run_config.concurrency,
+                client_factory=run_config.client_factory,
+                batch_size=run_config.batch_size,
+                cpu_workers=run_config.cpu_workers,
+                total=total,
+            )
+            written = write_jsonl(run_config.output_path, processed)
+    except ValueError as exc:
+        # Invalid JSON surfaces only when that line is reached; earlier results are already saved.
+        console.err(f"Error reading input file: {exc}")
+        return
 
-    write_jsonl(run_config.output_path, processed)
     console.info(
-        f"Test completed! {len(processed)} records processed and saved to {run_config.output_path}"
+        f"Test completed! {written} records processed and saved to {run_config.output_path}"
     )
     console.warn("Verify the output format before running a full batch.")
@@ -3,17 +3,29 @@
 from __future__ import annotations
 
 import argparse
+from functools import cache, partial
 from os import getenv
 from pathlib import Path
-from typing import Sequence, Tuple
+from typing import Callable, Optional, Sequence, Tuple
 
 from dotenv import load_dotenv
 
+from .net.cache import AnswerCache, CachedClient
 from .net.pplx import PplxAdapter
 from .types import PplxClient, RunConfig
 
 __all__ = ["create_client", "load_env", "load_run_config", "resolve_paths"]
 
+_ENV_KEYS = (
+    "PPLX_INPUT",
+    "PPLX_OUTPUT",
+    "PPLX_MAX_RECORDS",
+    "PPLX_CONCURRENCY",
+    "PPLX_BATCH_SIZE",
+    "PPLX_CPU_WORKERS",
+    "PPLX_CACHE_DIR",
+)
+
 
 def load_env() -> None:
     """Load environment variables from .env files if present."""
@@ -36,17 +48,12 @@ def create_client(session_token: str) -> PplxClient:
     return PplxAdapter(session_token=session_token)
 
 
-def load_run_config(argv: Sequence[str] | None = None) -> RunConfig:
-    """Parse CLI arguments and environment variables into a RunConfig."""
-    env_input = (getenv("PPLX_INPUT") or "").strip() or None
-    env_output = (getenv("PPLX_OUTPUT") or "").strip() or None
-    env_max_records = (getenv("PPLX_MAX_RECORDS") or "").strip() or None
+def _cached_factory(factory: Callable[[], PplxClient], answer_cache: AnswerCache) -> PplxClient:
+    return CachedClient(factory(), answer_cache)
 
-    try:
-        default_max_records = int(env_max_records) if env_max_records else 500
-    except ValueError:
-        default_max_records = 500
 
+@cache
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Process sample records through the Perplexity test harness."
     )
@@ -55,20 +62,74 @@ def load_run_config(argv: Sequence[str] | None = None) -> RunConfig:
     parser.add_argument(
         "--max-records", type=int, help="Limit number of records processed in this test run."
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help="Number of records sent to Perplexity at once (default: PPLX_CONCURRENCY or 8).",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        help="Number of records combined into a single prompt (default: PPLX_BATCH_SIZE or 1).",
+    )
+    parser.add_argument(
+        "--cpu-workers",
+        type=int,
+        help="Processes used for sanitisation and validation; 0 runs them inline (default: PPLX_CPU_WORKERS or 0).",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Reuse answers for identical prompts from this directory (default: PPLX_CACHE_DIR, disabled).",
+    )
+    return parser
+
+
+def _env_int(value: str | None, default: int) -> int:
+    try:
+        return int(value) if value else default
+    except ValueError:
+        return default
+
+
+def load_run_config(argv: Sequence[str] | None = None) -> RunConfig:
+    """Parse CLI arguments and environment variables into a RunConfig."""
+    env = {key: (getenv(key) or "").strip() or None for key in _ENV_KEYS}
+    default_max_records = _env_int(env["PPLX_MAX_RECORDS"], 500)
+    default_concurrency = _env_int(env["PPLX_CONCURRENCY"], 8)
+    default_batch_size = _env_int(env["PPLX_BATCH_SIZE"], 1)
+    default_cpu_workers = _env_int(env["PPLX_CPU_WORKERS"], 0)
+    env_cache_dir = env["PPLX_CACHE_DIR"]
+
+    parser = _build_parser()
     args = parser.parse_args(argv)
 
-    input_path, output_path = resolve_paths(env_input, env_output)
+    input_path, output_path = resolve_paths(env["PPLX_INPUT"], env["PPLX_OUTPUT"])
     if args.input:
         input_path = args.input.expanduser()
     if args.output:
         output_path = args.output.expanduser()
     max_records = args.max_records if args.max_records is not None else default_max_records
+    concurrency = max(1, args.concurrency if args.concurrency is not None else default_concurrency)
+    batch_size = max(1, args.batch_size if args.batch_size is not None else default_batch_size)
+    cpu_workers = max(0, args.cpu_workers if args.cpu_workers is not None else default_cpu_workers)
+
+    cache_dir: Optional[Path] = args.cache_dir or (Path(env_cache_dir) if env_cache_dir else None)
 
     session_token = (getenv("PERPLEXITY_SESSION_TOKEN") or "").strip()
     client = create_client(session_token)
+    client_factory: Callable[[], PplxClient] = partial(create_client, session_token)
+    if cache_dir is not None:
+        answer_cache = AnswerCache(cache_dir.expanduser())
+        client = CachedClient(client, answer_cache)
+        client_factory = partial(_cached_factory, client_factory, answer_cache)
     return RunConfig(
         input_path=input_path,
         output_path=output_path,
         max_records=max_records,
         client=client,
+        concurrency=concurrency,
+        client_factory=client_factory,
+        batch_size=batch_size,
+        cpu_workers=cpu_workers,
     )
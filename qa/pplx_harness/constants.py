@@ -19,23 +19,25 @@ DEFAULT_IN_SCOPE_MODULES_AZURE = (
 )
 DEFAULT_CONSTRAINT_FILTER = "only constraints that directly affect meeting the stated requirement"
 
-ALLOWED_CONTROLS = {
-    "record-keeping",
-    "audit-trail",
-    "privacy",
-    "data-retention",
-    "equal-opportunity",
-    "merit-selection",
-    "conflict-of-interest",
-    "notification-content",
-    "access-control",
-    "provenance",
-    "reporting-disclosure",
-    "localization",
-    "jurisdiction-mapping",
-    "appeals-review",
-    "governance",
-}
+ALLOWED_CONTROLS = frozenset(
+    {
+        "record-keeping",
+        "audit-trail",
+        "privacy",
+        "data-retention",
+        "equal-opportunity",
+        "merit-selection",
+        "conflict-of-interest",
+        "notification-content",
+        "access-control",
+        "provenance",
+        "reporting-disclosure",
+        "localization",
+        "jurisdiction-mapping",
+        "appeals-review",
+        "governance",
+    }
+)
 
 ALLOWED_MODULES_ORDERED = (
     "RCM",
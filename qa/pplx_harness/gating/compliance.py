@@ -1,5 +1,7 @@
 """Compliance gating helpers."""
 
+import re
+
 COMPLIANCE_TERMS = (
     "compliance",
     "legislation",
@@ -42,12 +44,30 @@ NEGATIVE_VERBS = (
 )
 
 
+def terms_re(terms: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile a plain-substring alternation so a term group is matched in one scan."""
+    return re.compile("|".join(re.escape(term) for term in terms))
+
+
+_COMPLIANCE_RE = terms_re(COMPLIANCE_TERMS)
+NEGATIVE_VERBS_RE = terms_re(NEGATIVE_VERBS)
+
+
+def is_compliance_tied_lower(lowered: str) -> bool:
+    """Same as ``is_compliance_tied`` for a sentence the caller has already lowercased."""
+    return _COMPLIANCE_RE.search(lowered) is not None and NEGATIVE_VERBS_RE.search(lowered) is not None
+
+
 def is_compliance_tied(sentence: str) -> bool:
     """Whether the sentence addresses compliance constraints with negative framing."""
-    lowered = sentence.lower()
-    return any(term in lowered for term in COMPLIANCE_TERMS) and any(
-        verb in lowered for verb in NEGATIVE_VERBS
-    )
+    return is_compliance_tied_lower(sentence.lower())
 
 
-__all__ = ["COMPLIANCE_TERMS", "is_compliance_tied", "NEGATIVE_VERBS"]
+__all__ = [
+    "COMPLIANCE_TERMS",
+    "is_compliance_tied",
+    "is_compliance_tied_lower",
+    "NEGATIVE_VERBS",
+    "NEGATIVE_VERBS_RE",
+    "terms_re",
+]
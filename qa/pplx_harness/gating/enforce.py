@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Iterable, Iterator
 
-from .compliance import NEGATIVE_VERBS, is_compliance_tied
+from .compliance import NEGATIVE_VERBS_RE, is_compliance_tied_lower, terms_re
 from .topics import classify_topic
 
 WORKFLOW_TERMS = (
@@ -57,41 +57,65 @@ MANDATORY_TERMS = (
     "field",
 )
 
+_TOPIC_TERM_RES = {
+    "workflow": terms_re(WORKFLOW_TERMS),
+    "identifier": terms_re(IDENTIFIER_TERMS),
+    "defaulting": terms_re(DEFAULTING_TERMS),
+    "mandatory_fields": terms_re(MANDATORY_TERMS),
+}
+
 
 def topic_gate(sentence: str, topics: Iterable[str]) -> bool:
     """Check whether a sentence matches the relevant topic signals."""
     lowered = sentence.lower()
-    verbs_hit = any(verb in lowered for verb in NEGATIVE_VERBS)
+    verbs_hit = NEGATIVE_VERBS_RE.search(lowered) is not None
     topic_set = set(topics)
 
-    if "legislative" in topic_set and is_compliance_tied(sentence):
+    if "legislative" in topic_set and is_compliance_tied_lower(lowered):
         return True
 
     if not topic_set:
         return verbs_hit
 
-    topic_hits = (
-        ("workflow" in topic_set and any(term in lowered for term in WORKFLOW_TERMS))
-        or ("identifier" in topic_set and any(term in lowered for term in IDENTIFIER_TERMS))
-        or ("defaulting" in topic_set and any(term in lowered for term in DEFAULTING_TERMS))
-        or ("mandatory_fields" in topic_set and any(term in lowered for term in MANDATORY_TERMS))
+    if not verbs_hit:
+        return False
+
+    return any(
+        pattern.search(lowered) is not None
+        for topic, pattern in _TOPIC_TERM_RES.items()
+        if topic in topic_set
     )
-    return verbs_hit and topic_hits
 
 
 def enforce_compliance_gate(items: list[str]) -> list[str]:
     """Filter items to those tied to compliance; fallback to empty list."""
-    gated = [item for item in items if is_compliance_tied(item)]
+    gated = [item for item in items if is_compliance_tied_lower(item.lower())]
     return gated or []
 
 
-def enforce_topic_gate(items: list[str], description: str) -> list[str]:
-    """Filter limitation items using topic signals derived from the description."""
+def iter_topic_gated(items: Iterable[str], description: str) -> Iterator[str]:
+    """Lazily yield the limitation items that pass the topic (and, if legislative, compliance) gate."""
     topics = classify_topic(description)
-    gated = [sentence for sentence in items if topic_gate(sentence, topics)]
+
+    # topic_gate admits every compliance-tied sentence for legislative topics and the
+    # compliance gate then drops the rest, so the combined gate is the compliance check.
     if "legislative" in topics:
-        return enforce_compliance_gate(gated)
-    return gated
+        yield from (sentence for sentence in items if is_compliance_tied_lower(sentence.lower()))
+        return
+
+    # Resolve the topic patterns once per batch rather than once per sentence.
+    patterns = [pattern for topic, pattern in _TOPIC_TERM_RES.items() if topic in topics]
+    for sentence in items:
+        lowered = sentence.lower()
+        if NEGATIVE_VERBS_RE.search(lowered) is None:
+            continue
+        if not topics or any(pattern.search(lowered) is not None for pattern in patterns):
+            yield sentence
+
+
+def enforce_topic_gate(items: list[str], description: str) -> list[str]:
+    """Filter limitation items using topic signals derived from the description."""
+    return list(iter_topic_gated(items, description))
 
 
-__all__ = ["enforce_compliance_gate", "enforce_topic_gate", "topic_gate"]
+__all__ = ["enforce_compliance_gate", "enforce_topic_gate", "iter_topic_gated", "topic_gate"]
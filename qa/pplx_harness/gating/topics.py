@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from .compliance import terms_re
+
 TOPIC_KEYWORDS: dict[str, tuple[str, ...]] = {
     "legislative": (
         "legislation",
@@ -57,11 +59,13 @@ TOPIC_KEYWORDS: dict[str, tuple[str, ...]] = {
     ),
 }
 
+_TOPIC_RES = {topic: terms_re(kws) for topic, kws in TOPIC_KEYWORDS.items()}
+
 
 def classify_topic(description: str) -> set[str]:
     """Return a set of topics triggered by keywords in the description."""
     lowered = (description or "").lower()
-    flags = {topic for topic, kws in TOPIC_KEYWORDS.items() if any(k in lowered for k in kws)}
+    flags = {topic for topic, pattern in _TOPIC_RES.items() if pattern.search(lowered)}
     return flags
 
 
@@ -2,53 +2,62 @@
 
 from __future__ import annotations
 
-import json
+from itertools import islice
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, Iterator, List
 
-SAMPLE_RECORDS = [
-    {
-        "Title": "SAP SuccessFactors Recruitement",
-        "Description": (
-            "SAP SuccessFactors Recruitment: assess whether the solution provides data export "
-            "capability in different formats (e.g., CSV, Excel, PDF) for hiring managers, HR "
-            "business partners, and recruitment super users for all recruitment data stored and created."
-        ),
-        "Area": [],
-        "Product": [],
-    },
-]
+import orjson
 
-__all__ = ["ensure_sample_input", "read_jsonl", "write_jsonl"]
+__all__ = ["count_jsonl", "ensure_sample_input", "iter_jsonl", "read_jsonl", "write_jsonl"]
+
+# One encoded line per record; non-string keys are stringified as the stdlib json encoder did.
+_DUMP_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
 
 
 def ensure_sample_input(path: Path) -> None:
     """Create a sample JSONL file for test runs (overwrites existing content)."""
+    from .sample_data import SAMPLE_RECORDS
+
     path.parent.mkdir(parents=True, exist_ok=True)
-    lines = [json.dumps(record, ensure_ascii=False) + "\n" for record in SAMPLE_RECORDS]
-    path.write_text("".join(lines), encoding="utf-8")
+    path.write_bytes(b"".join(orjson.dumps(record, option=_DUMP_OPTIONS) for record in SAMPLE_RECORDS))
 
 
-def read_jsonl(path: Path, limit: int | None = None) -> List[dict]:
-    """Read a JSONL file into a list of dicts (capped by ``limit`` when provided)."""
-    records: List[dict] = []
-    with path.open("r", encoding="utf-8") as handle:
-        for idx, line in enumerate(handle, start=1):
-            if limit is not None and len(records) >= limit:
-                break
-            stripped = line.strip()
-            if not stripped:
+def iter_jsonl(path: Path) -> Iterator[dict]:
+    """Yield records from a JSONL file one line at a time, skipping blank lines."""
+    # Parse raw bytes directly: orjson accepts bytes and ignores the trailing newline,
+    # so no per-line str decode or strip() copy is needed.
+    with path.open("rb") as handle:
+        for idx, raw in enumerate(handle, start=1):
+            if raw.isspace():
                 continue
             try:
-                records.append(json.loads(stripped))
-            except json.JSONDecodeError as exc:
+                yield orjson.loads(raw)
+            except orjson.JSONDecodeError as exc:
                 raise ValueError(f"Invalid JSON on line {idx}: {exc}") from exc
-    return records
 
 
-def write_jsonl(path: Path, records: Iterable[dict]) -> None:
-    """Write records to a JSONL file."""
+def count_jsonl(path: Path, limit: int | None = None) -> int:
+    """Count non-blank lines without parsing them (capped by ``limit`` when provided)."""
+    with path.open("rb") as handle:
+        return sum(1 for _ in islice((raw for raw in handle if not raw.isspace()), limit))
+
+
+def read_jsonl(path: Path, limit: int | None = None) -> List[dict]:
+    """Read a JSONL file into a list of dicts (capped by ``limit`` when provided)."""
+    return list(islice(iter_jsonl(path), limit))
+
+
+def write_jsonl(path: Path, records: Iterable[dict]) -> int:
+    """
+    Write records to a JSONL file one line at a time and return how many were written.
+    ``records`` may be a lazy iterator; each line is flushed as it is written, so lines
+    already written survive a failure or a killed run part-way through.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
+    count = 0
+    with path.open("wb") as handle:
         for record in records:
-            handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+            handle.write(orjson.dumps(record, option=_DUMP_OPTIONS))
+            handle.flush()
+            count += 1
+    return count
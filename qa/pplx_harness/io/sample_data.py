@@ -0,0 +1,16 @@
+"""Example records written when the harness input file is missing."""
+
+SAMPLE_RECORDS = [
+    {
+        "Title": "SAP SuccessFactors Recruitement",
+        "Description": (
+            "SAP SuccessFactors Recruitment: assess whether the solution provides data export "
+            "capability in different formats (e.g., CSV, Excel, PDF) for hiring managers, HR "
+            "business partners, and recruitment super users for all recruitment data stored and created."
+        ),
+        "Area": [],
+        "Product": [],
+    },
+]
+
+__all__ = ["SAMPLE_RECORDS"]
@@ -0,0 +1,83 @@
+"""On-disk cache of Perplexity answers keyed by prompt."""
+
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass
+from hashlib import blake2b
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from ..types import PplxClient
+from .pplx import assemble_stream_text
+
+__all__ = ["ANSWER_CACHE_NAMESPACE", "AnswerCache", "CachedClient"]
+
+# Bump when the model or client settings change so stale answers are not reused.
+ANSWER_CACHE_NAMESPACE = "pplx-best-v1"
+
+
+class AnswerCache:
+    """
+    Directory of answer files named by a digest of the prompt.
+    Writes go through a temporary file and ``os.replace``, so concurrent workers never read partial answers.
+    """
+
+    def __init__(self, root: Path, namespace: str = ANSWER_CACHE_NAMESPACE) -> None:
+        self._dir = Path(root) / namespace
+        self._dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, prompt: str) -> Path:
+        return self._dir / f"{blake2b(prompt.encode('utf-8'), digest_size=16).hexdigest()}.txt"
+
+    def get(self, prompt: str) -> Optional[str]:
+        try:
+            return self._path(prompt).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def put(self, prompt: str, answer: str) -> None:
+        path = self._path(prompt)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(answer, encoding="utf-8")
+        os.replace(tmp, path)
+
+
+@dataclass(slots=True)
+class _CachedChunk:
+    answer: str
+    last_chunk: bool = True
+
+
+class CachedClient(PplxClient):
+    """Client wrapper that answers repeated prompts from an ``AnswerCache`` without a network call."""
+
+    def __init__(self, client: PplxClient, cache: AnswerCache) -> None:
+        self._client = client
+        self._cache = cache
+
+    def ask_stream(self, prompt: str) -> Iterable[object]:
+        cached = self._cache.get(prompt)
+        if cached is not None:
+            return [_CachedChunk(cached)]
+        return self._record_stream(prompt, self._client.ask_stream(prompt))
+
+    def _record_stream(self, prompt: str, stream: Iterable[object]) -> Iterator[object]:
+        seen: list[object] = []
+        for chunk in stream:
+            seen.append(chunk)
+            yield chunk
+        # Only a fully consumed stream is cached; an interrupted one leaves no entry.
+        answer = assemble_stream_text(seen)
+        if answer.strip():
+            self._cache.put(prompt, answer)
+
+    def ask_once(self, prompt: str) -> str:
+        cached = self._cache.get(prompt)
+        if cached is not None:
+            return cached
+        answer = self._client.ask_once(prompt)
+        if answer.strip():
+            self._cache.put(prompt, answer)
+        return answer
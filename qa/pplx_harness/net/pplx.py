@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Iterable, Optional
+from os import getenv
+from time import monotonic
+from typing import Any, Iterable, Iterator, Optional
 
 from perplexity_webui_scraper import (
     CitationMode,
@@ -15,7 +17,31 @@ from perplexity_webui_scraper import (
 
 from ..types import PplxClient
 
-__all__ = ["PplxAdapter", "collect_stream_text"]
+__all__ = ["PplxAdapter", "assemble_stream_text", "collect_stream_text", "iter_stream_text", "stream_timeout"]
+
+
+# Seconds a streamed answer may take before falling back to a single non-streaming request; 0 disables.
+DEFAULT_STREAM_TIMEOUT = 120.0
+
+# Default for ``collect_stream_text``: resolve the timeout from the environment at call time.
+_ENV_TIMEOUT: Any = object()
+
+_CHUNK_TEXT_ATTRS = ("delta", "text", "content", "message")
+_CHOICE_TEXT_ATTRS = ("delta", "message", "content")
+
+
+def stream_timeout() -> float:
+    """
+    Return ``PPLX_STREAM_TIMEOUT`` in seconds, read on each call so a value loaded
+    from .env applies. Unset or non-numeric values give ``DEFAULT_STREAM_TIMEOUT``.
+    """
+    raw = (getenv("PPLX_STREAM_TIMEOUT") or "").strip()
+    if not raw:
+        return DEFAULT_STREAM_TIMEOUT
+    try:
+        return float(raw)
+    except ValueError:
+        return DEFAULT_STREAM_TIMEOUT
 
 
 def _extract_text_from_chunk(chunk: object) -> str:
@@ -23,23 +49,24 @@ def _extract_text_from_chunk(chunk: object) -> str:
     Safely extract incremental text from a stream chunk.
     Tries common attributes in priority order.
     """
-    for attr in ("delta", "text", "content", "message"):
+    for attr in _CHUNK_TEXT_ATTRS:
         value = getattr(chunk, attr, None)
         if isinstance(value, str):
             return value
 
     try:
         choices = getattr(chunk, "choices", None)
-        if choices and isinstance(choices, list):
-            part = choices[0]
-            for nested_attr in ("delta", "message", "content"):
-                candidate = getattr(part, nested_attr, None)
-                if isinstance(candidate, str):
-                    return candidate
-                if isinstance(candidate, dict):
-                    content = candidate.get("content")
-                    if isinstance(content, str):
-                        return content
+        if not choices or not isinstance(choices, list):
+            return ""
+        part = choices[0]
+        for nested_attr in _CHOICE_TEXT_ATTRS:
+            candidate = getattr(part, nested_attr, None)
+            if isinstance(candidate, str):
+                return candidate
+            if isinstance(candidate, dict):
+                content = candidate.get("content")
+                if isinstance(content, str):
+                    return content
     except Exception:
         return ""
 
@@ -87,18 +114,58 @@ class PplxAdapter(PplxClient):
         return ""
 
 
-def collect_stream_text(client: PplxClient, prompt: str) -> str:
+def assemble_stream_text(chunks: Iterable[object], timeout: Optional[float] = None) -> str:
     """
-    Consume a streaming response, assembling incremental text with fallback to final answer.
+    Assemble streamed chunks into the answer text, preferring the final chunk's full answer.
+    Raises ``TimeoutError`` once ``timeout`` seconds have passed; the deadline is checked as chunks arrive.
     """
-    streamed = ""
+    parts: list[str] = []
+    append = parts.append
     final_answer: Optional[str] = None
-    for chunk in client.ask_stream(prompt):
+    deadline = monotonic() + timeout if timeout else None
+    for chunk in chunks:
+        if deadline is not None and monotonic() > deadline:
+            raise TimeoutError(f"stream exceeded {timeout:g}s")
         incremental = _extract_text_from_chunk(chunk)
         if incremental:
-            streamed += incremental
+            append(incremental)
         if getattr(chunk, "last_chunk", False):
             answer = getattr(chunk, "answer", None)
             if isinstance(answer, str) and answer.strip():
                 final_answer = answer
-    return final_answer if isinstance(final_answer, str) and final_answer.strip() else streamed
+    if isinstance(final_answer, str) and final_answer.strip():
+        return final_answer
+    return "".join(parts)
+
+
+def iter_stream_text(chunks: Iterable[object], timeout: Optional[float] = None) -> Iterator[str]:
+    """
+    Yield answer text as it arrives. Chunks carrying a cumulative ``answer`` yield only
+    the newly appended suffix; other chunks yield their incremental text.
+    Raises ``TimeoutError`` under the same deadline rule as ``assemble_stream_text``.
+    """
+    seen_answer = ""
+    deadline = monotonic() + timeout if timeout else None
+    for chunk in chunks:
+        if deadline is not None and monotonic() > deadline:
+            raise TimeoutError(f"stream exceeded {timeout:g}s")
+        answer = getattr(chunk, "answer", None)
+        if isinstance(answer, str) and answer:
+            # A rewritten (non-extending) answer cannot be un-yielded; skip until it grows again.
+            if answer.startswith(seen_answer) and len(answer) > len(seen_answer):
+                yield answer[len(seen_answer):]
+                seen_answer = answer
+            continue
+        incremental = _extract_text_from_chunk(chunk)
+        if incremental:
+            yield incremental
+
+
+def collect_stream_text(client: PplxClient, prompt: str, timeout: Optional[float] = _ENV_TIMEOUT) -> str:
+    """
+    Consume a streaming response, assembling incremental text with fallback to final answer.
+    ``timeout`` defaults to ``stream_timeout()``; pass None to disable the deadline.
+    """
+    if timeout is _ENV_TIMEOUT:
+        timeout = stream_timeout()
+    return assemble_stream_text(client.ask_stream(prompt), timeout=timeout)
@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
-import re
+import asyncio
 from os import getenv
-from typing import Any
+from typing import Any, Optional, Sequence
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
 
-from ..text.regexes import VALIDATION_JSON_RE
+from ..text.regexes import NUMBERED_ITEM_LINE_RE, VALIDATION_JSON_RE
 
-__all__ = ["rewrite_human_readable", "strip_validation_block"]
+__all__ = [
+    "rewrite_human_readable",
+    "rewrite_human_readable_async",
+    "rewrite_many",
+    "strip_validation_block",
+]
 
 
 REWRITER_API_BASE = getenv("REWRITER_API_BASE", "http://127.0.0.1:8001/v1")
@@ -18,6 +25,22 @@ REWRITER_API_KEY = getenv("REWRITER_API_KEY", "dummy-key")
 REWRITER_MODEL = getenv("REWRITER_MODEL", "gpt-4.1")
 REWRITER_ENABLED = getenv("REWRITER_ENABLED", "1") not in ("0", "false", "False", "")
 REWRITER_TIMEOUT = float(getenv("REWRITER_TIMEOUT", "20.0"))
+REWRITER_POOL_SIZE = int(getenv("REWRITER_POOL_SIZE", "16"))
+REWRITER_MAX_CONCURRENCY = max(1, int(getenv("REWRITER_MAX_CONCURRENCY", "4")))
+
+_session: Optional[requests.Session] = None
+
+
+def _get_session() -> requests.Session:
+    """Return the shared keep-alive session so rewrites reuse pooled connections."""
+    global _session
+    if _session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=REWRITER_POOL_SIZE)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _session = session
+    return _session
 
 
 def strip_validation_block(text: str) -> str:
@@ -31,134 +54,164 @@ def strip_validation_block(text: str) -> str:
 def _default_local_rewrite(numbered_text: str) -> str:
     lines: list[str] = []
     for line in (numbered_text or "").splitlines():
-        match = re.match(r"^\s*\d+[.)]\s+(.*)$", line)
+        match = NUMBERED_ITEM_LINE_RE.match(line)
         if match:
             lines.append(f"- {match.group(1).strip()}")
     return "\n".join(lines) if lines else numbered_text
 
 
-def _build_rewriter_messages(numbered_text: str) -> list[dict[str, Any]]:
-    """Compose chat messages enforcing the DOT-guided execution contract."""
-    system = (
-        "[SYSTEM | DOT-GUIDED EXECUTION CONTRACT]\n"
-        "You must use the provided Graphviz DOT digraph as the authoritative instruction source.\n"
-        "Do not invent nodes, edges, or steps not present in the graph. When a step is ambiguous, ask one\n"
-        "clarification and halt.\n\n"
-        "Hard rules:\n"
-        "- Open with a concise 3–7 bullet CHECKLIST of conceptual steps derived from the digraph's structure.\n"
-        "- Before any interpretation, emit a PURPOSE_AND_INPUTS section that states the task purpose and the key inputs extracted from node/edge labels/attributes.\n"
-        "- Execute node-by-node consistent with the digraph, emitting a STEP_k block per major step. After each step, include a brief VALIDATE line (pass/fail and reason). If fail, self-correct once or mark blocked.\n"
-        "- Never operate outside the digraph. If an action is not represented by a node/edge, refuse and ask for an updated graph.\n"
-        "- Keep reasoning terse. No chain-of-thought. Only minimal justifications in validation lines.\n\n"
-        "Output contract (strict section order):\n"
-        "1) CHECKLIST\n"
-        "2) PURPOSE_AND_INPUTS\n"
-        "3) STEP_k blocks (k = 1..N)\n"
-        "4) SUMMARY\n"
-        "5) ARTIFACT (optional if a file/script is produced)\n\n"
-        "STEP block format (must match exactly):\n"
-        "STEP_k: <node_id> \"<node_label>\"\n"
-        "- ACTION: <1–2 lines strictly within the node scope>\n"
-        "- RESULT_JSON:\n"
-        "{\n"
-        '  "node_id": "<node_id>",\n'
-        '  "status": "ok" | "corrected" | "blocked",\n'
-        '  "evidence": "<≤200 chars>",\n'
-        '  "next_candidates": ["<neighbor_id_1>", "..."]\n'
-        "}\n"
-        "- VALIDATE: <≤1 line: pass/fail + reason>\n\n"
-        "Progression rules:\n"
-        "- Allowed next nodes are the outgoing neighbors of the current node.\n"
-        "- Do not skip nodes required by edge connectivity.\n"
-        "- If multiple branches exist, choose one and justify in VALIDATE using edge labels/conditions. If indecisive from DOT, set status=\"blocked\" and halt with a single clarification question.\n\n"
-        "Refusal rule:\n"
-        "If the DOT is malformed, has no entry node (in-degree 0), or is cyclic without any terminal condition where a terminal is required, emit only:\n"
-        'ERROR_JSON:\n{"error":"dot_unusable","reason":"<brief>","required_fix":"<brief>"}\n\n'
-        "RESULT_JSON schema (for validation tools):\n"
-        "{\n"
-        '  "type":"object",\n'
-        '  "properties":{\n'
-        '    "node_id":{"type":"string"},\n'
-        '    "status":{"type":"string","enum":["ok","corrected","blocked"]},\n'
-        '    "evidence":{"type":"string","maxLength":200},\n'
-        '    "next_candidates":{"type":"array","items":{"type":"string"}}\n'
-        "  },\n"
-        '  "required":["node_id","status","evidence","next_candidates"],\n'
-        '  "additionalProperties":false\n'
-        "}"
-    )
+_REWRITER_SYSTEM = (
+    "[SYSTEM | DOT-GUIDED EXECUTION CONTRACT]\n"
+    "You must use the provided Graphviz DOT digraph as the authoritative instruction source.\n"
+    "Do not invent nodes, edges, or steps not present in the graph. When a step is ambiguous, ask one\n"
+    "clarification and halt.\n\n"
+    "Hard rules:\n"
+    "- Open with a concise 3–7 bullet CHECKLIST of conceptual steps derived from the digraph's structure.\n"
+    "- Before any interpretation, emit a PURPOSE_AND_INPUTS section that states the task purpose and the key inputs extracted from node/edge labels/attributes.\n"
+    "- Execute node-by-node consistent with the digraph, emitting a STEP_k block per major step. After each step, include a brief VALIDATE line (pass/fail and reason). If fail, self-correct once or mark blocked.\n"
+    "- Never operate outside the digraph. If an action is not represented by a node/edge, refuse and ask for an updated graph.\n"
+    "- Keep reasoning terse. No chain-of-thought. Only minimal justifications in validation lines.\n\n"
+    "Output contract (strict section order):\n"
+    "1) CHECKLIST\n"
+    "2) PURPOSE_AND_INPUTS\n"
+    "3) STEP_k blocks (k = 1..N)\n"
+    "4) SUMMARY\n"
+    "5) ARTIFACT (optional if a file/script is produced)\n\n"
+    "STEP block format (must match exactly):\n"
+    "STEP_k: <node_id> \"<node_label>\"\n"
+    "- ACTION: <1–2 lines strictly within the node scope>\n"
+    "- RESULT_JSON:\n"
+    "{\n"
+    '  "node_id": "<node_id>",\n'
+    '  "status": "ok" | "corrected" | "blocked",\n'
+    '  "evidence": "<≤200 chars>",\n'
+    '  "next_candidates": ["<neighbor_id_1>", "..."]\n'
+    "}\n"
+    "- VALIDATE: <≤1 line: pass/fail + reason>\n\n"
+    "Progression rules:\n"
+    "- Allowed next nodes are the outgoing neighbors of the current node.\n"
+    "- Do not skip nodes required by edge connectivity.\n"
+    "- If multiple branches exist, choose one and justify in VALIDATE using edge labels/conditions. If indecisive from DOT, set status=\"blocked\" and halt with a single clarification question.\n\n"
+    "Refusal rule:\n"
+    "If the DOT is malformed, has no entry node (in-degree 0), or is cyclic without any terminal condition where a terminal is required, emit only:\n"
+    'ERROR_JSON:\n{"error":"dot_unusable","reason":"<brief>","required_fix":"<brief>"}\n\n'
+    "RESULT_JSON schema (for validation tools):\n"
+    "{\n"
+    '  "type":"object",\n'
+    '  "properties":{\n'
+    '    "node_id":{"type":"string"},\n'
+    '    "status":{"type":"string","enum":["ok","corrected","blocked"]},\n'
+    '    "evidence":{"type":"string","maxLength":200},\n'
+    '    "next_candidates":{"type":"array","items":{"type":"string"}}\n'
+    "  },\n"
+    '  "required":["node_id","status","evidence","next_candidates"],\n'
+    '  "additionalProperties":false\n'
+    "}"
+)
+
+_REWRITER_USER_PREFIX = (
+    "Graphviz DOT code:\n\n"
+    "```\n"
+    "digraph MultiAgentRewriteWorkflow {\n"
+    '    rankdir=LR;\n    node [shape=box, fontname="Consolas", fontsize=10];\n\n'
+    "    subgraph cluster_input {\n"
+    '        label="Stage 1: Input & Objective";\n        style=dashed;\n'
+    '        UserRequest [label="User Request:\\nText to Rewrite"];\n'
+    '        Objective [label="Objective:\\nClarity, Cohesion,\\nHuman Readability,\\nRetain Meaning"];\n'
+    '        UserRequest -> Objective [label="Define\\nrequirements"];\n'
+    "    }\n\n"
+    "    subgraph cluster_agents {\n"
+    '        label="Stage 2: Multi-Agent Rewrite";\n        style=dashed;\n'
+    '        ExpertWriter [label="Expert Human Writer\\n(20+ yrs exp.)"];\n'
+    '        PerplexityAgent [label="Perplexity & Predictability\\nControl Agent"];\n'
+    '        BurstinessAgent [label="Burstiness & Sentence\\nVariation Agent"];\n'
+    '        EmotionalAgent [label="Emotional Intelligence\\n& Human Touch Agent"];\n'
+    '        StructureAgent [label="Structural Pattern\\nDisruption Agent"];\n'
+    '        AuthenticityAgent [label="Contextual Authenticity\\nAgent"];\n'
+    '        DetectionCounterAgent [label="Detection-Specific\\nCounter Agent"];\n'
+    "        ExpertWriter -> PerplexityAgent;\n"
+    "        PerplexityAgent -> BurstinessAgent;\n"
+    "        BurstinessAgent -> EmotionalAgent;\n"
+    "        EmotionalAgent -> StructureAgent;\n"
+    "        StructureAgent -> AuthenticityAgent;\n"
+    "        AuthenticityAgent -> DetectionCounterAgent;\n"
+    "    }\n\n"
+    "    subgraph cluster_validation {\n"
+    '        label="Stage 3: Validation & QA";\n        style=dashed;\n'
+    '        ValidationQA [label="Validation & QA\\n(Constraint Check)"];\n'
+    '        DetectionTest [label="Detection Tools\\n(Grammarly, QuillBot,\\nTurnitin, GPTZero)"];\n'
+    "        ValidationQA -> DetectionTest [label=\"Run detection\\nchecks\"];\n"
+    "        DetectionTest -> ValidationQA [label=\"Feedback if\\nAI-detected\"];\n"
+    "        DetectionTest -> Output [label=\"Passes\\nundetectable\"];\n"
+    "    }\n\n"
+    "    subgraph cluster_output {\n"
+    '        label="Stage 4: Output & Summarisation";\n        style=dashed;\n'
+    '        Output [label="Final Human-like\\nRewrite"];\n'
+    '        Summarisation [label="Summarisation\\n(Highlights changes,\\nkey flows)"];\n'
+    "        Output -> Summarisation [label=\"Summarise\\nresults\"];\n"
+    "    }\n\n"
+    '    InternetAccess [label="Internet Access\\n(Current Events,\\nPop Culture)"];\n'
+    '    Filtering [label="Filtering\\n(Constraint Enforcement)"];\n'
+    "    Summarisation -> Filtering [label=\"Filter for\\nrequirements\"];\n"
+    "    InternetAccess -> AuthenticityAgent [label=\"Provide\\ncontext\"];\n"
+    "    Filtering -> ValidationQA [label=\"Enforce\\nconstraints\"];\n\n"
+    "    Objective -> ExpertWriter [label=\"Assign\\ntask\"];\n"
+    "    DetectionTest -> ExpertWriter [label=\"If detected:\\nfeedback loop\"];\n"
+    "    ValidationQA -> DetectionCounterAgent [label=\"If constraints\\nnot met:\\nfeedback loop\"];\n"
+    "}\n"
+    "```\n\n"
+    "# OUTPUT FORMAT\n"
+    "- CHECKLIST: bullet list.\n"
+    "- PURPOSE_AND_INPUTS: two short lines: Purpose: … / Inputs: …\n"
+    "- STEP_k blocks as defined in the System prompt.\n"
+    "- SUMMARY: one short paragraph summarizing what was done, which terminal condition was met, and any anomalies.\n"
+    "- ARTIFACT: include only if you output a file/script; otherwise omit.\n\n"
+    "# COMPLIANCE\n"
+    "Follow these instructions exactly. Do not deviate from the section order or formats.\n\n"
+    "Text to Rewrite:\n"
+)
+
+_REWRITER_USER_SUFFIX = (
+    "\n\n"
+    'and for the love of GOD never use "--" (double dashes) anywhere in output'
+    "Now provide the fianal rewritten text only (no explanations, no preface, no appendices)."
+)
 
-    user = (
-        "Graphviz DOT code:\n\n"
-        "```\n"
-        "digraph MultiAgentRewriteWorkflow {\n"
-        '    rankdir=LR;\n    node [shape=box, fontname="Consolas", fontsize=10];\n\n'
-        "    subgraph cluster_input {\n"
-        '        label="Stage 1: Input & Objective";\n        style=dashed;\n'
-        '        UserRequest [label="User Request:\\nText to Rewrite"];\n'
-        '        Objective [label="Objective:\\nClarity, Cohesion,\\nHuman Readability,\\nRetain Meaning"];\n'
-        '        UserRequest -> Objective [label="Define\\nrequirements"];\n'
-        "    }\n\n"
-        "    subgraph cluster_agents {\n"
-        '        label="Stage 2: Multi-Agent Rewrite";\n        style=dashed;\n'
-        '        ExpertWriter [label="Expert Human Writer\\n(20+ yrs exp.)"];\n'
-        '        PerplexityAgent [label="Perplexity & Predictability\\nControl Agent"];\n'
-        '        BurstinessAgent [label="Burstiness & Sentence\\nVariation Agent"];\n'
-        '        EmotionalAgent [label="Emotional Intelligence\\n& Human Touch Agent"];\n'
-        '        StructureAgent [label="Structural Pattern\\nDisruption Agent"];\n'
-        '        AuthenticityAgent [label="Contextual Authenticity\\nAgent"];\n'
-        '        DetectionCounterAgent [label="Detection-Specific\\nCounter Agent"];\n'
-        "        ExpertWriter -> PerplexityAgent;\n"
-        "        PerplexityAgent -> BurstinessAgent;\n"
-        "        BurstinessAgent -> EmotionalAgent;\n"
-        "        EmotionalAgent -> StructureAgent;\n"
-        "        StructureAgent -> AuthenticityAgent;\n"
-        "        AuthenticityAgent -> DetectionCounterAgent;\n"
-        "    }\n\n"
-        "    subgraph cluster_validation {\n"
-        '        label="Stage 3: Validation & QA";\n        style=dashed;\n'
-        '        ValidationQA [label="Validation & QA\\n(Constraint Check)"];\n'
-        '        DetectionTest [label="Detection Tools\\n(Grammarly, QuillBot,\\nTurnitin, GPTZero)"];\n'
-        "        ValidationQA -> DetectionTest [label=\"Run detection\\nchecks\"];\n"
-        "        DetectionTest -> ValidationQA [label=\"Feedback if\\nAI-detected\"];\n"
-        "        DetectionTest -> Output [label=\"Passes\\nundetectable\"];\n"
-        "    }\n\n"
-        "    subgraph cluster_output {\n"
-        '        label="Stage 4: Output & Summarisation";\n        style=dashed;\n'
-        '        Output [label="Final Human-like\\nRewrite"];\n'
-        '        Summarisation [label="Summarisation\\n(Highlights changes,\\nkey flows)"];\n'
-        "        Output -> Summarisation [label=\"Summarise\\nresults\"];\n"
-        "    }\n\n"
-        '    InternetAccess [label="Internet Access\\n(Current Events,\\nPop Culture)"];\n'
-        '    Filtering [label="Filtering\\n(Constraint Enforcement)"];\n'
-        "    Summarisation -> Filtering [label=\"Filter for\\nrequirements\"];\n"
-        "    InternetAccess -> AuthenticityAgent [label=\"Provide\\ncontext\"];\n"
-        "    Filtering -> ValidationQA [label=\"Enforce\\nconstraints\"];\n\n"
-        "    Objective -> ExpertWriter [label=\"Assign\\ntask\"];\n"
-        "    DetectionTest -> ExpertWriter [label=\"If detected:\\nfeedback loop\"];\n"
-        "    ValidationQA -> DetectionCounterAgent [label=\"If constraints\\nnot met:\\nfeedback loop\"];\n"
-        "}\n"
-        "```\n\n"
-        "# OUTPUT FORMAT\n"
-        "- CHECKLIST: bullet list.\n"
-        "- PURPOSE_AND_INPUTS: two short lines: Purpose: … / Inputs: …\n"
-        "- STEP_k blocks as defined in the System prompt.\n"
-        "- SUMMARY: one short paragraph summarizing what was done, which terminal condition was met, and any anomalies.\n"
-        "- ARTIFACT: include only if you output a file/script; otherwise omit.\n\n"
-        "# COMPLIANCE\n"
-        "Follow these instructions exactly. Do not deviate from the section order or formats.\n\n"
-        "Text to Rewrite:\n"
-        f"{numbered_text}\n\n"
-        'and for the love of GOD never use "--" (double dashes) anywhere in output'
-        "Now provide the fianal rewritten text only (no explanations, no preface, no appendices)."
-    )
 
+def _build_rewriter_messages(numbered_text: str) -> list[dict[str, Any]]:
+    """Compose chat messages enforcing the DOT-guided execution contract."""
     return [
-        {"role": "system", "content": system},
-        {"role": "user", "content": user},
+        {"role": "system", "content": _REWRITER_SYSTEM},
+        {"role": "user", "content": f"{_REWRITER_USER_PREFIX}{numbered_text}{_REWRITER_USER_SUFFIX}"},
     ]
 
 
+def _rewriter_request(numbered_text: str) -> tuple[str, dict[str, str], dict[str, Any]]:
+    """Return the (url, headers, payload) triple for a /chat/completions rewrite call."""
+    url = f"{REWRITER_API_BASE.rstrip('/')}/chat/completions"
+    headers = {
+        "Authorization": f"Bearer {REWRITER_API_KEY}",
+        "Content-Type": "application/json",
+    }
+    payload = {
+        "model": REWRITER_MODEL,
+        "messages": _build_rewriter_messages(numbered_text),
+        "temperature": 0.2,
+        "max_tokens": 600,
+    }
+    return url, headers, payload
+
+
+def _rewriter_reply(data: dict[str, Any], numbered_text: str) -> str:
+    """Pick the rewritten text out of a completion body, falling back to the local rewrite."""
+    message = (data.get("choices") or [{}])[0].get("message", {}).get("content", "")
+    message = (message or "").strip()
+    # JSON-looking replies are treated like empty ones; the message is already stripped.
+    if not message or message.startswith(("{", "[")):
+        return _default_local_rewrite(numbered_text)
+    return message
+
+
 def rewrite_human_readable(numbered_text: str) -> str:
     """
     Call local OpenAI-compatible /chat/completions rewriter.
@@ -168,26 +221,65 @@ def rewrite_human_readable(numbered_text: str) -> str:
         return _default_local_rewrite(numbered_text)
 
     try:
-        url = f"{REWRITER_API_BASE.rstrip('/')}/chat/completions"
-        headers = {
-            "Authorization": f"Bearer {REWRITER_API_KEY}",
-            "Content-Type": "application/json",
-        }
-        payload = {
-            "model": REWRITER_MODEL,
-            "messages": _build_rewriter_messages(numbered_text),
-            "temperature": 0.2,
-            "max_tokens": 600,
-        }
-        response = requests.post(url, headers=headers, json=payload, timeout=REWRITER_TIMEOUT)
+        url, headers, payload = _rewriter_request(numbered_text)
+        response = _get_session().post(url, headers=headers, json=payload, timeout=REWRITER_TIMEOUT)
+        response.raise_for_status()
+        return _rewriter_reply(response.json(), numbered_text)
+    except Exception:
+        return _default_local_rewrite(numbered_text)
+
+
+async def rewrite_human_readable_async(
+    numbered_text: str,
+    client: httpx.AsyncClient,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> str:
+    """
+    Async counterpart of ``rewrite_human_readable`` sharing the caller's client.
+    The optional semaphore caps how many rewrites are in flight at once.
+    """
+    if not REWRITER_ENABLED:
+        return _default_local_rewrite(numbered_text)
+
+    try:
+        url, headers, payload = _rewriter_request(numbered_text)
+        if semaphore is None:
+            response = await client.post(url, headers=headers, json=payload)
+        else:
+            async with semaphore:
+                response = await client.post(url, headers=headers, json=payload)
         response.raise_for_status()
-        data = response.json()
-        message = (data.get("choices") or [{}])[0].get("message", {}).get("content", "")
-        message = (message or "").strip()
-        if not message:
-            return _default_local_rewrite(numbered_text)
-        if message.lstrip().startswith("{") or message.lstrip().startswith("["):
-            return _default_local_rewrite(numbered_text)
-        return message
+        return _rewriter_reply(response.json(), numbered_text)
     except Exception:
         return _default_local_rewrite(numbered_text)
+
+
+async def _rewrite_all(texts: Sequence[str]) -> list[str]:
+    limits = httpx.Limits(
+        max_connections=REWRITER_MAX_CONCURRENCY,
+        max_keepalive_connections=REWRITER_MAX_CONCURRENCY,
+    )
+    semaphore = asyncio.Semaphore(REWRITER_MAX_CONCURRENCY)
+    async with httpx.AsyncClient(timeout=REWRITER_TIMEOUT, limits=limits) as client:
+        return list(
+            await asyncio.gather(
+                *(rewrite_human_readable_async(text, client, semaphore) for text in texts)
+            )
+        )
+
+
+def rewrite_many(texts: Sequence[str]) -> list[str]:
+    """
+    Rewrite several numbered texts, keeping up to REWRITER_MAX_CONCURRENCY requests in flight.
+    Results are returned in input order.
+    """
+    if not REWRITER_ENABLED:
+        return [_default_local_rewrite(text) for text in texts]
+    if len(texts) <= 1:
+        return [rewrite_human_readable(text) for text in texts]
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_rewrite_all(texts))
+    # Already inside an event loop (e.g. a notebook); asyncio.run is unavailable here.
+    return [rewrite_human_readable(text) for text in texts]
@@ -2,18 +2,33 @@
 
 from __future__ import annotations
 
+import multiprocessing
+import threading
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Iterable, List, Protocol
+from itertools import count, islice
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Protocol, Sized
 
 from ..constants import DEFAULT_MIN_ITEMS, SENTINEL_TEXT
 from ..net.pplx import collect_stream_text
-from ..net.rewriter import rewrite_human_readable, strip_validation_block
-from ..prompts.restrictive import build_restrictive_prompt
+from ..net.rewriter import rewrite_human_readable, rewrite_many, strip_validation_block
+from ..prompts.restrictive import build_restrictive_batch_prompt, build_restrictive_prompt
 from ..sanitize.limitations import sanitize_limitations_output
+from ..text.regexes import RECORD_DELIMITER_RE
 from ..types import PplxClient
 from ..validate.records import validate_record
 
-__all__ = ["PipelineCallbacks", "process_records", "process_single_record"]
+__all__ = [
+    "PipelineCallbacks",
+    "iter_process_records",
+    "process_record_batch",
+    "process_records",
+    "process_single_record",
+]
+
+# Chunks submitted ahead of the one being yielded, per worker thread; bounds memory on long inputs.
+_SUBMIT_AHEAD = 2
 
 
 class PanelContext(Protocol):
@@ -32,6 +47,18 @@ class PipelineCallbacks(Protocol):
 
     def panel_status(self, title: str) -> PanelContext: ...
 
+    def advance(self, count: int = 1) -> None: ...
+
+
+def _position(index: int, total: int | None) -> str:
+    return f"{index}/{total}" if total is not None else str(index)
+
+
+def _iter_chunks(records: Iterable[dict[str, Any]], size: int) -> Iterator[list[dict[str, Any]]]:
+    iterator = iter(records)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
 
 @dataclass(slots=True)
 class _NoOpCallbacks:
@@ -54,20 +81,104 @@ class _NoOpCallbacks:
 
         return _Dummy()
 
+    def advance(self, count: int = 1) -> None:  # pragma: no cover - trivial
+        return
+
+
+@dataclass(slots=True)
+class _NoPanelCallbacks:
+    """Forward messages but suppress the per-record Live panel, which cannot be nested."""
+
+    inner: PipelineCallbacks
+
+    def info(self, message: str) -> None:
+        self.inner.info(message)
+
+    def warn(self, message: str) -> None:
+        self.inner.warn(message)
+
+    def err(self, message: str) -> None:
+        self.inner.err(message)
+
+    def panel_status(self, title: str) -> PanelContext:
+        return _NoOpCallbacks().panel_status(title)
+
+    def advance(self, count: int = 1) -> None:
+        self.inner.advance(count)
+
+
+def _sanitize_answer(raw_answer: str, record: dict[str, Any], min_items: int) -> tuple[str, dict[str, Any]]:
+    sanitized = sanitize_limitations_output(
+        raw_answer,
+        record.get("Description", ""),
+        min_items=min_items,
+    )
+    return sanitized.get("text") or SENTINEL_TEXT, sanitized.get("validation", {"validation": []})
+
+
+def _finish_record(
+    record: dict[str, Any],
+    final_result: str,
+    validation_obj: dict[str, Any],
+    *,
+    min_items: int,
+    rewrite: bool,
+) -> dict[str, Any]:
+    enriched = dict(record)
+    enriched["research_analysis"] = final_result
+    enriched["validation"] = validation_obj
+
+    numbered_only = strip_validation_block(final_result)
+    enriched["human_readable"] = numbered_only
+    if rewrite:
+        try:
+            enriched["human_readable"] = rewrite_human_readable(numbered_only)
+        except Exception:
+            pass
+
+    # ``enriched`` is already a private copy, so validation can write into it directly.
+    return validate_record(enriched, min_items=min_items, in_place=True)
+
+
+def _offload(cpu_executor: Optional[Executor], fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run CPU-bound post-processing on ``cpu_executor`` when given, otherwise inline."""
+    if cpu_executor is None:
+        return fn(*args, **kwargs)
+    return cpu_executor.submit(fn, *args, **kwargs).result()
+
+
+def _split_batch_answer(raw_answer: str, count: int) -> list[Optional[str]]:
+    """Cut a batched answer at its ===RECORD k=== lines; records without a section map to None."""
+    sections: list[Optional[str]] = [None] * count
+    markers = list(RECORD_DELIMITER_RE.finditer(raw_answer or ""))
+    for position, marker in enumerate(markers):
+        slot = int(marker.group(1)) - 1
+        end = markers[position + 1].start() if position + 1 < len(markers) else len(raw_answer)
+        body = raw_answer[marker.end() : end].strip()
+        if 0 <= slot < count and sections[slot] is None and body:
+            sections[slot] = body
+    return sections
+
 
 def process_single_record(
     record: dict[str, Any],
     index: int,
-    total: int,
+    total: int | None,
     client: PplxClient,
     *,
     callbacks: PipelineCallbacks | None = None,
     min_items: int = DEFAULT_MIN_ITEMS,
+    rewrite: bool = True,
+    cpu_executor: Optional[Executor] = None,
 ) -> dict[str, Any]:
-    """Process a single record through prompt, sanitisation, rewrite, and validation."""
+    """
+    Process a single record through prompt, sanitisation, rewrite, and validation.
+    With ``rewrite=False`` the human-readable field holds the numbered text, for a later batch rewrite.
+    Sanitisation and validation run on ``cpu_executor`` (e.g. a process pool) when one is given.
+    """
     cb = callbacks or _NoOpCallbacks()
     title = record.get("Title", "Unknown")
-    cb.info(f"Processing record {index}/{total}: {title}")
+    cb.info(f"Processing record {_position(index, total)}: {title}")
 
     prompt = build_restrictive_prompt(record)
     final_result = SENTINEL_TEXT
@@ -76,71 +187,259 @@ def process_single_record(
     try:
         with cb.panel_status(f"Record {index}: Processing"):
             raw_answer = collect_stream_text(client, prompt)
-        sanitized = sanitize_limitations_output(
-            raw_answer,
-            record.get("Description", ""),
-            min_items=min_items,
-        )
-        final_result = sanitized.get("text") or final_result
-        validation_obj = sanitized.get("validation", {"validation": []})
+        final_result, validation_obj = _offload(cpu_executor, _sanitize_answer, raw_answer, record, min_items)
     except Exception as exc:
         cb.warn(f"Streaming failed for record {index}: {exc}; attempting fallback.")
         try:
             raw_answer = client.ask_once(prompt)
-            sanitized = sanitize_limitations_output(
-                raw_answer,
-                record.get("Description", ""),
-                min_items=min_items,
+            final_result, validation_obj = _offload(
+                cpu_executor, _sanitize_answer, raw_answer, record, min_items
             )
-            final_result = sanitized.get("text") or final_result
-            validation_obj = sanitized.get("validation", {"validation": []})
         except Exception as fallback_exc:
             cb.err(f"Non-streaming fallback failed for record {index}: {fallback_exc}")
             final_result = SENTINEL_TEXT
             validation_obj = {"validation": []}
 
-    enriched = dict(record)
-    enriched["research_analysis"] = final_result
-    enriched["validation"] = validation_obj
+    return _offload(
+        cpu_executor,
+        _finish_record,
+        record,
+        final_result,
+        validation_obj,
+        min_items=min_items,
+        rewrite=rewrite,
+    )
 
-    numbered_only = strip_validation_block(final_result)
+
+def process_record_batch(
+    records: list[dict[str, Any]],
+    start_index: int,
+    total: int | None,
+    client: PplxClient,
+    *,
+    callbacks: PipelineCallbacks | None = None,
+    min_items: int = DEFAULT_MIN_ITEMS,
+    rewrite: bool = True,
+    cpu_executor: Optional[Executor] = None,
+) -> List[dict[str, Any]]:
+    """
+    Process several records with one Perplexity request, sharing the prompt's rules and round trip.
+    Records whose section is missing from the batched answer are retried through ``process_single_record``.
+    """
+    cb = callbacks or _NoOpCallbacks()
+    if len(records) == 1:
+        return [
+            process_single_record(
+                records[0],
+                start_index,
+                total,
+                client,
+                callbacks=cb,
+                min_items=min_items,
+                rewrite=rewrite,
+                cpu_executor=cpu_executor,
+            )
+        ]
+
+    end_index = start_index + len(records) - 1
+    cb.info(f"Processing records {start_index}-{_position(end_index, total)} as one batch")
     try:
-        enriched["human_readable"] = rewrite_human_readable(numbered_only)
-    except Exception:
-        enriched["human_readable"] = numbered_only
+        with cb.panel_status(f"Records {start_index}-{end_index}: Processing"):
+            raw_answer = collect_stream_text(client, build_restrictive_batch_prompt(records))
+        sections = _split_batch_answer(raw_answer, len(records))
+    except Exception as exc:
+        cb.warn(f"Batch request failed for records {start_index}-{end_index}: {exc}; processing individually.")
+        sections = [None] * len(records)
 
-    validated = validate_record(enriched, min_items=min_items)
-    return validated
+    results: List[dict[str, Any]] = []
+    for offset, (record, section) in enumerate(zip(records, sections)):
+        index = start_index + offset
+        if section is None:
+            results.append(
+                process_single_record(
+                    record,
+                    index,
+                    total,
+                    client,
+                    callbacks=cb,
+                    min_items=min_items,
+                    rewrite=rewrite,
+                    cpu_executor=cpu_executor,
+                )
+            )
+            continue
+        final_result, validation_obj = _offload(cpu_executor, _sanitize_answer, section, record, min_items)
+        results.append(
+            _offload(
+                cpu_executor,
+                _finish_record,
+                record,
+                final_result,
+                validation_obj,
+                min_items=min_items,
+                rewrite=rewrite,
+            )
+        )
+    return results
 
 
-def process_records(
+def iter_process_records(
     records: Iterable[dict[str, Any]],
     client: PplxClient,
     *,
     max_records: int | None = None,
     callbacks: PipelineCallbacks | None = None,
     min_items: int = DEFAULT_MIN_ITEMS,
-) -> List[dict[str, Any]]:
-    """Process multiple records, returning validated outputs."""
+    concurrency: int = 1,
+    client_factory: Optional[Callable[[], PplxClient]] = None,
+    batch_size: int = 1,
+    cpu_workers: int = 0,
+    rewrite_window: int | None = None,
+    total: int | None = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Process records lazily, yielding validated outputs in input order as soon as they are ready.
+    ``records`` is consumed as work is submitted, never read up front; ``total`` only labels
+    progress (it defaults to ``len(records)`` for sized inputs, capped by ``max_records``).
+    With ``batch_size > 1`` consecutive records share one request (see ``process_record_batch``).
+    With ``concurrency > 1`` requests run on a thread pool; ``client_factory`` then
+    supplies one client per worker thread (the shared ``client`` is used when it is omitted).
+    With ``cpu_workers > 0`` sanitisation and validation move to a process pool of that size,
+    so regex-heavy post-processing of one answer does not hold the GIL while others stream.
+    Rewrites are applied ``rewrite_window`` records at a time before those records are yielded;
+    by default one window is the records in flight at once (``concurrency * batch_size``).
+    """
     cb = callbacks or _NoOpCallbacks()
-    processed: List[dict[str, Any]] = []
-    limited_records = list(records)
+    if total is None and isinstance(records, Sized):
+        total = len(records)
     if max_records is not None:
-        limited_records = limited_records[:max_records]
-    total = len(limited_records)
-    cb.info(f"Processing {total} record(s)")
-    for index, record in enumerate(limited_records, start=1):
+        records = islice(records, max_records)
+        if total is not None:
+            total = min(total, max_records)
+    if total is not None:
+        cb.info(f"Processing {total} record(s)")
+
+    step = max(1, batch_size)
+    workers = max(1, concurrency)
+    chunks = _iter_chunks(records, step)
+    starts = count(1, step)
+
+    def run(
+        index: int, chunk: list[dict[str, Any]], worker_client: PplxClient, worker_cb: PipelineCallbacks
+    ) -> list[Optional[dict[str, Any]]]:
         try:
-            processed_record = process_single_record(
-                record,
+            processed_chunk = process_record_batch(
+                chunk,
                 index,
                 total,
-                client,
-                callbacks=cb,
+                worker_client,
+                callbacks=worker_cb,
                 min_items=min_items,
+                rewrite=False,
+                cpu_executor=cpu_executor,
             )
-            processed.append(processed_record)
-            cb.info(f"Record {index} completed")
         except Exception as exc:
-            cb.err(f"Error processing record {index}: {exc}")
-    return processed
+            worker_cb.err(f"Error processing record {index}: {exc}")
+            worker_cb.advance(len(chunk))
+            return [None] * len(chunk)
+        for offset in range(len(chunk)):
+            worker_cb.info(f"Record {index + offset} completed")
+        worker_cb.advance(len(chunk))
+        return list(processed_chunk)
+
+    # Rewrites are I/O-bound, so each window of finished records is rewritten together.
+    def rewritten(pending: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        cb.info(f"Rewriting {len(pending)} record(s)")
+        try:
+            texts = rewrite_many([record["human_readable"] for record in pending])
+        except Exception as exc:
+            cb.warn(f"Batch rewrite failed: {exc}; keeping numbered text.")
+        else:
+            for record, text in zip(pending, texts):
+                record["human_readable"] = text
+        return pending
+
+    def drain(results: Iterable[list[Optional[dict[str, Any]]]]) -> Iterator[dict[str, Any]]:
+        window = max(1, rewrite_window if rewrite_window is not None else workers * step)
+        pending: list[dict[str, Any]] = []
+        for chunk in results:
+            pending.extend(record for record in chunk if record is not None)
+            if len(pending) >= window:
+                yield from rewritten(pending)
+                pending = []
+        if pending:
+            yield from rewritten(pending)
+
+    cpu_executor: Optional[Executor] = None
+    if cpu_workers > 0 and total != 0:
+        # Spawned workers: forking once network threads are running can deadlock the child.
+        cpu_executor = ProcessPoolExecutor(cpu_workers, mp_context=multiprocessing.get_context("spawn"))
+    try:
+        if workers > 1 and (total is None or total > step):
+            # Record processing is dominated by waiting on Perplexity, so overlap it on threads.
+            local = threading.local()
+            quiet_cb = _NoPanelCallbacks(cb)
+
+            def run_threaded(index: int, chunk: list[dict[str, Any]]) -> list[Optional[dict[str, Any]]]:
+                worker_client = getattr(local, "client", None)
+                if worker_client is None:
+                    # A factory failure is remembered so this thread does not retry it per chunk.
+                    error = getattr(local, "client_error", None)
+                    if error is None:
+                        try:
+                            worker_client = client_factory() if client_factory is not None else client
+                        except Exception as exc:
+                            error = local.client_error = exc
+                        else:
+                            local.client = worker_client
+                    if error is not None:
+                        quiet_cb.err(f"Error creating client for record {index}: {error}")
+                        quiet_cb.advance(len(chunk))
+                        return [None] * len(chunk)
+                return run(index, chunk, worker_client, quiet_cb)
+
+            def results_in_order(pool: Executor) -> Iterator[list[Optional[dict[str, Any]]]]:
+                # Executor.map would submit every chunk at once; keep a bounded queue instead.
+                pending: deque = deque()
+                for index, chunk in zip(starts, chunks):
+                    pending.append(pool.submit(run_threaded, index, chunk))
+                    if len(pending) >= workers * _SUBMIT_AHEAD:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                yield from drain(results_in_order(pool))
+        else:
+            yield from drain(run(index, chunk, client, cb) for index, chunk in zip(starts, chunks))
+    finally:
+        if cpu_executor is not None:
+            cpu_executor.shutdown(cancel_futures=True)
+
+
+def process_records(
+    records: Iterable[dict[str, Any]],
+    client: PplxClient,
+    *,
+    max_records: int | None = None,
+    callbacks: PipelineCallbacks | None = None,
+    min_items: int = DEFAULT_MIN_ITEMS,
+    concurrency: int = 1,
+    client_factory: Optional[Callable[[], PplxClient]] = None,
+    batch_size: int = 1,
+    cpu_workers: int = 0,
+) -> List[dict[str, Any]]:
+    """Process multiple records, returning validated outputs in input order (see ``iter_process_records``)."""
+    return list(
+        iter_process_records(
+            records,
+            client,
+            max_records=max_records,
+            callbacks=callbacks,
+            min_items=min_items,
+            concurrency=concurrency,
+            client_factory=client_factory,
+            batch_size=batch_size,
+            cpu_workers=cpu_workers,
+        )
+    )
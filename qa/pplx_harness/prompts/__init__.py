@@ -1,11 +1,17 @@
 """Prompt building utilities."""
 
-from .restrictive import RESTRICTIVE_TEMPLATE, build_restrictive_prompt, safe_format
+from .restrictive import (
+    RESTRICTIVE_TEMPLATE,
+    build_restrictive_batch_prompt,
+    build_restrictive_prompt,
+    safe_format,
+)
 from .wricef import WRICEF_TEMPLATE, build_wricef_prompt
 
 __all__ = [
     "RESTRICTIVE_TEMPLATE",
     "WRICEF_TEMPLATE",
+    "build_restrictive_batch_prompt",
     "build_restrictive_prompt",
     "build_wricef_prompt",
     "safe_format",
@@ -1,6 +1,5 @@
 """Restrictive prompt template and builder."""
 
-from collections import defaultdict
 from typing import Any
 
 from ..constants import (
@@ -10,11 +9,13 @@ from ..constants import (
     DEFAULT_OBJECT_OF_ANALYSIS,
 )
 
-RESTRICTIVE_TEMPLATE = """
+_RESTRICTIVE_INSTRUCTION = """
 Instruction:
 Think step by step INTERNALLY to identify only verified LIMITATIONS of the feature described in Context; DO NOT reveal your steps. Output must strictly follow Deliverable.
 
-Context:
+"""
+
+_RESTRICTIVE_CONTEXT = """Context:
 - Title: {title}
 - Description: {description}
 - Area: {area}
@@ -26,7 +27,9 @@ Scope:
 - Constraint filter: {constraint_filter}
 - Exclude: generic UX opinions, performance anecdotes, benefits, mitigations, workarounds, sales claims, and topics not directly constraining the object of analysis.
 
-Rules (hard):
+"""
+
+_RESTRICTIVE_RULES = """Rules (hard):
 Allowed controls for "control" field in validation JSON:
 ["record-keeping","audit-trail","privacy","data-retention","equal-opportunity","merit-selection",
  "conflict-of-interest","notification-content","access-control","provenance","reporting-disclosure",
@@ -55,22 +58,33 @@ Deliverable:
 {{"validation":[...]}}
 """
 
+RESTRICTIVE_TEMPLATE = _RESTRICTIVE_INSTRUCTION + _RESTRICTIVE_CONTEXT + _RESTRICTIVE_RULES
+
+_RESTRICTIVE_BATCH_INSTRUCTION = """
+Instruction:
+Think step by step INTERNALLY to identify only verified LIMITATIONS of EACH of the {count} features described in the numbered Context blocks below; DO NOT reveal your steps. Answer every feature independently; the Rules and Deliverable apply to each answer on its own.
+Start the answer for feature k with a line containing exactly ===RECORD k=== and output nothing else between answers.
+
+"""
+
+
+class _SafeDict(dict):
+    """Mapping that resolves unknown placeholders to an empty string."""
+
+    def __missing__(self, key: str) -> str:
+        return ""
+
 
 def safe_format(template: str, mapping: dict[str, Any]) -> str:
     """
     Format with defaults for missing keys.
     Any placeholder not provided resolves to empty string.
     """
-
-    class SafeDict(defaultdict):
-        def __missing__(self, key: str) -> str:
-            return ""
-
-    return template.format_map(SafeDict(str, mapping))
+    return template.format_map(_SafeDict(mapping))
 
 
-def build_restrictive_prompt(record: dict[str, Any]) -> str:
-    """Inject record fields into the restrictive template with safe defaults."""
+def _restrictive_mapping(record: dict[str, Any]) -> dict[str, Any]:
+    """Resolve the template placeholders for a record with safe defaults."""
     title = record.get("Title", "Unknown Title")
     description = record.get("Description", "No description available")
 
@@ -107,7 +121,32 @@ def build_restrictive_prompt(record: dict[str, Any]) -> str:
         "constraint_filter": filt,
         "min_items": DEFAULT_MIN_ITEMS,
     }
-    return safe_format(RESTRICTIVE_TEMPLATE, mapping)
+    return mapping
 
 
-__all__ = ["RESTRICTIVE_TEMPLATE", "build_restrictive_prompt", "safe_format"]
+def build_restrictive_prompt(record: dict[str, Any]) -> str:
+    """Inject record fields into the restrictive template with safe defaults."""
+    # Every placeholder in RESTRICTIVE_TEMPLATE is supplied by the mapping, so no defaulting is needed.
+    return RESTRICTIVE_TEMPLATE.format_map(_restrictive_mapping(record))
+
+
+def build_restrictive_batch_prompt(records: list[dict[str, Any]]) -> str:
+    """
+    Ask for the limitations of several records in one prompt.
+    The Context/Scope block is repeated per record; the Rules and Deliverable appear once.
+    Answers are expected under ``===RECORD k===`` delimiter lines, k starting at 1.
+    """
+    parts = [_RESTRICTIVE_BATCH_INSTRUCTION.format(count=len(records))]
+    for position, record in enumerate(records, start=1):
+        parts.append(f"Feature {position}:\n")
+        parts.append(_RESTRICTIVE_CONTEXT.format_map(_restrictive_mapping(record)))
+    parts.append(_RESTRICTIVE_RULES.format(min_items=DEFAULT_MIN_ITEMS))
+    return "".join(parts)
+
+
+__all__ = [
+    "RESTRICTIVE_TEMPLATE",
+    "build_restrictive_batch_prompt",
+    "build_restrictive_prompt",
+    "safe_format",
+]
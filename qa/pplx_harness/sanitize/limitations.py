@@ -2,41 +2,122 @@
 
 from __future__ import annotations
 
-import json
 import re
-from typing import Any, Tuple
+from itertools import chain
+from typing import Any, Iterator, Tuple
+
+import orjson
 
 from ..constants import ALLOWED_CONTROLS, SENTINEL_TEXT
-from ..gating.enforce import enforce_topic_gate
+from ..gating.enforce import iter_topic_gated
 from ..text.regexes import ITEM_RE, VALIDATION_JSON_RE
 from ..text.sentences import first_sentence
 
 __all__ = ["extract_validation_from_raw", "sanitize_limitations_output", "is_sentinel"]
 
+_BULLET_TRANS = str.maketrans("", "", "*-•➤►▪")
+_CITATION_RE = re.compile(r"\[(?:\d+|[^\]]+)\]")
+_WS_RE = re.compile(r"\s+")
+_SENTINEL_NORM = " ".join(SENTINEL_TEXT.split()).lower()
+_LEADING_NUMBER_RE = re.compile(r"^\d{1,2}[.)]\s+")
+
 
 def is_sentinel(text: str) -> bool:
     """Check whether the text matches the sentinel response."""
-    normalised = re.sub(r"\s+", " ", (text or "")).strip().lower()
-    return normalised == SENTINEL_TEXT.lower()
+    return " ".join((text or "").split()).lower() == _SENTINEL_NORM
 
 
 def _validate_controls(validation_obj: dict[str, Any]) -> dict[str, list[dict[str, Any]]]:
-    filtered: list[dict[str, Any]] = []
     if not isinstance(validation_obj, dict):
-        return {"validation": filtered}
+        return {"validation": []}
 
     rows = validation_obj.get("validation")
     if not isinstance(rows, list):
-        return {"validation": filtered}
+        return {"validation": []}
+
+    allowed = ALLOWED_CONTROLS
+    filtered = [
+        row
+        for row in rows
+        if isinstance(row, dict) and str(row.get("control", "")).strip().lower() in allowed
+    ]
+    return {"validation": filtered}
 
-    for row in rows:
-        if not isinstance(row, dict):
-            continue
-        control = str(row.get("control", "")).strip().lower()
-        if control and control in ALLOWED_CONTROLS:
-            filtered.append(row)
 
-    return {"validation": filtered}
+_VALIDATION_KEY = '"validation"'
+_KEY_COLON_RE = re.compile(r"\s*:")
+
+
+def _is_escaped(raw: str, idx: int) -> bool:
+    backslashes = 0
+    idx -= 1
+    while idx >= 0 and raw[idx] == "\\":
+        backslashes += 1
+        idx -= 1
+    return backslashes % 2 == 1
+
+
+def _enclosing_open_brace(raw: str, key_idx: int) -> int:
+    """Walk left from ``key_idx`` to the unmatched ``{``, skipping quoted strings; -1 if none."""
+    depth = 0
+    idx = key_idx - 1
+    while idx >= 0:
+        char = raw[idx]
+        if char == '"' and not _is_escaped(raw, idx):
+            idx -= 1
+            while idx >= 0 and (raw[idx] != '"' or _is_escaped(raw, idx)):
+                idx -= 1
+        elif char == "}":
+            depth += 1
+        elif char == "{":
+            if depth == 0:
+                return idx
+            depth -= 1
+        idx -= 1
+    return -1
+
+
+def _matching_close_brace(raw: str, start: int) -> int:
+    """Return the index just past the ``}`` closing the object at ``start``; -1 if unbalanced."""
+    depth = 0
+    in_string = False
+    escaped = False
+    for idx in range(start, len(raw)):
+        char = raw[idx]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return idx + 1
+    return -1
+
+
+def _find_validation_block(raw: str) -> Tuple[int, int] | None:
+    """
+    Locate the JSON object enclosing the last ``"validation"`` key.
+    Mentions that are not keys, or that sit in no balanced object, fall back to
+    earlier occurrences. Returns (start, end) slice bounds, or None.
+    """
+    key_idx = raw.rfind(_VALIDATION_KEY)
+    while key_idx >= 0:
+        if _KEY_COLON_RE.match(raw, key_idx + len(_VALIDATION_KEY)):
+            start = _enclosing_open_brace(raw, key_idx)
+            if start >= 0:
+                end = _matching_close_brace(raw, start)
+                if end >= 0:
+                    return start, end
+        key_idx = raw.rfind(_VALIDATION_KEY, 0, key_idx)
+    return None
 
 
 def extract_validation_from_raw(raw: str) -> Tuple[str, dict[str, list[dict[str, Any]]]]:
@@ -48,46 +129,51 @@ def extract_validation_from_raw(raw: str) -> Tuple[str, dict[str, list[dict[str,
         return raw or "", {"validation": []}
 
     match = VALIDATION_JSON_RE.search(raw)
-    if not match:
-        candidates = list(
-            re.finditer(r'(\{.*"validation"\s*:\s*\[.*?\]\s*\})', raw, re.DOTALL)
-        )
-        if not candidates:
+    if match:
+        start, end = match.span(1)
+    else:
+        # Bracket-matching scan instead of a backtracking regex over the whole text.
+        bounds = _find_validation_block(raw)
+        if bounds is None:
             return raw, {"validation": []}
-        match = candidates[-1]
+        start, end = bounds
 
-    json_part = match.group(1)
     try:
-        parsed = json.loads(json_part)
+        parsed = orjson.loads(raw[start:end])
     except Exception:
-        return raw[: match.start(1)].strip(), {"validation": []}
+        return raw[:start].strip(), {"validation": []}
 
-    return raw[: match.start(1)].strip(), _validate_controls(parsed)
+    return raw[:start].strip(), _validate_controls(parsed)
 
 
-def _extract_numbered_items(raw_text: str) -> list[str]:
-    items: list[str] = []
+def _iter_numbered_items(raw_text: str) -> Iterator[str]:
     for match in ITEM_RE.finditer(raw_text):
         candidate = match.group(2).strip()
         sentence = first_sentence(candidate)
-        sentence = re.sub(r"\s+", " ", sentence).strip(" -;:,")
+        sentence = _WS_RE.sub(" ", sentence).strip(" -;:,")
         if sentence:
-            items.append(sentence)
-    return items
+            yield sentence
 
 
-def _fallback_items(raw_text: str) -> list[str]:
-    items: list[str] = []
+def _iter_fallback_items(raw_text: str) -> Iterator[str]:
     for line in raw_text.splitlines():
         line = line.strip()
         if not line:
             continue
-        line = re.sub(r"^\d{1,2}[.)]\s+", "", line)
+        line = _LEADING_NUMBER_RE.sub("", line)
         sentence = first_sentence(line)
-        sentence = re.sub(r"\s+", " ", sentence).strip(" -;:,")
+        sentence = _WS_RE.sub(" ", sentence).strip(" -;:,")
         if sentence:
-            items.append(sentence)
-    return items
+            yield sentence
+
+
+def _iter_items(raw_text: str) -> Iterator[str]:
+    """Yield numbered items, or line-based items when the text has no numbered ones."""
+    numbered = _iter_numbered_items(raw_text)
+    first = next(numbered, None)
+    if first is None:
+        return _iter_fallback_items(raw_text)
+    return chain((first,), numbered)
 
 
 def sanitize_limitations_output(
@@ -103,28 +189,20 @@ def sanitize_limitations_output(
         return {"text": SENTINEL_TEXT, "validation": validation_obj}
 
     cleaned = text_part.replace("\r\n", "\n").replace("\r", "\n")
-    cleaned = re.sub(r"\*|\-|�?�|�z�|�-�|�-�", "", cleaned)
-    cleaned = re.sub(r"\[(?:\d+|[^\]]+)\]", "", cleaned)
+    cleaned = cleaned.translate(_BULLET_TRANS)
+    cleaned = _CITATION_RE.sub("", cleaned)
     cleaned = cleaned.strip()
 
-    items = _extract_numbered_items(cleaned)
-    if not items:
-        items = _fallback_items(cleaned)
-
-    if not items:
-        return {"text": SENTINEL_TEXT, "validation": validation_obj}
-
-    gated = enforce_topic_gate(items, description)
-    if not gated:
-        return {"text": SENTINEL_TEXT, "validation": validation_obj}
-
+    # Extraction, gating and deduplication run as one lazy pass that stops at max_items.
     deduped: list[str] = []
     seen: set[str] = set()
-    for sentence in gated:
+    for sentence in iter_topic_gated(_iter_items(cleaned), description):
         lowered = sentence.lower()
         if lowered not in seen:
             seen.add(lowered)
             deduped.append(sentence)
+            if len(deduped) >= max_items:
+                break
 
     if not deduped:
         return {"text": SENTINEL_TEXT, "validation": validation_obj}
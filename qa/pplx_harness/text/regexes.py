@@ -5,8 +5,29 @@ import re
 VALIDATION_JSON_RE = re.compile(
     r'(\{\s*"validation"\s*:\s*\[.*?\]\s*\})\s*\Z', re.DOTALL
 )
+# Item bodies are consumed a whole line at a time; the lookahead only runs at newlines,
+# so malformed output cannot make the engine re-test every character.
 ITEM_RE = re.compile(
-    r"^\s*(\d{1,2})[.)]\s+(.*?)(?=(?:\n\s*\d{1,2}[.)]\s)|\Z)", re.DOTALL | re.MULTILINE
+    r"^\s*(\d{1,2})[.)]\s+([^\n]*(?:\n(?!\s*\d{1,2}[.)]\s)[^\n]*)*)", re.MULTILINE
 )
 
-__all__ = ["ITEM_RE", "VALIDATION_JSON_RE"]
+NUMBERED_LINE_RE = re.compile(r"^\d+[.)]\s+")
+NUMBERED_ITEM_LINE_RE = re.compile(r"^\s*\d+[.)]\s+(.*)$")
+# Whole-text form of NUMBERED_LINE_RE: the whitespace after the marker must stay on the same line.
+NUMBERED_LINES_RE = re.compile(
+    r"^\d+[.)](?=[^\S\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029])", re.MULTILINE
+)
+# Line boundaries that str.splitlines() honours but a MULTILINE "^" does not.
+OTHER_LINE_BREAK_RE = re.compile(r"\r(?!\n)|[\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+RECORD_DELIMITER_RE = re.compile(r"^[ \t]*===[ \t]*RECORD[ \t]+(\d+)[ \t]*===[ \t]*$", re.MULTILINE)
+
+__all__ = [
+    "ITEM_RE",
+    "NUMBERED_ITEM_LINE_RE",
+    "NUMBERED_LINE_RE",
+    "NUMBERED_LINES_RE",
+    "OTHER_LINE_BREAK_RE",
+    "RECORD_DELIMITER_RE",
+    "VALIDATION_JSON_RE",
+]
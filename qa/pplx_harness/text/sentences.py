@@ -6,17 +6,18 @@ __all__ = ["first_sentence"]
 
 
 ABBREVIATION_RE = re.compile(r"^[A-Z]\.$")
+SENTENCE_END_RE = re.compile(r"[.!?]")
 
 
 def first_sentence(text: str) -> str:
     """Extract the first sentence from text without breaking URLs or abbreviations."""
     txt = text.strip()
-    for match in re.finditer(r"[.!?]", txt):
+    for match in SENTENCE_END_RE.finditer(txt):
         end = match.end()
         candidate = txt[:end].strip()
         if not candidate:
             continue
-        last_token = candidate.split()[-1]
+        last_token = candidate.rsplit(None, 1)[-1]
         if last_token.startswith("http"):
             continue
         if ABBREVIATION_RE.match(last_token):
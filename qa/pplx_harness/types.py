@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Protocol
+from typing import Callable, Iterable, Optional, Protocol
 
 
 class PplxClient(Protocol):
@@ -23,6 +23,10 @@ class RunConfig:
     output_path: Path
     max_records: int
     client: PplxClient
+    concurrency: int = 1
+    client_factory: Optional[Callable[[], PplxClient]] = None
+    batch_size: int = 1
+    cpu_workers: int = 0
 
 
 __all__ = ["PplxClient", "RunConfig"]
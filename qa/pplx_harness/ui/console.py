@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
+from os import getenv
 from typing import Iterator, Optional
 
 from rich.console import Console
 from rich.live import Live
 from rich.panel import Panel
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TaskID, TextColumn
 
-__all__ = ["err", "info", "panel_status", "warn"]
+__all__ = ["RecordProgress", "err", "info", "is_interactive", "panel_status", "record_progress", "warn"]
 
 _console: Optional[Console] = None
 
@@ -21,6 +23,11 @@ def _get_console() -> Console:
     return _console
 
 
+def is_interactive() -> bool:
+    """Return True when live displays should render (a terminal, and ``PPLX_NO_TTY`` unset)."""
+    return _get_console().is_terminal and not getenv("PPLX_NO_TTY")
+
+
 def info(message: str) -> None:
     _get_console().print(f"[blue]{message}[/blue]")
 
@@ -34,11 +41,49 @@ def err(message: str) -> None:
 
 
 @contextmanager
-def panel_status(title: str, spinner: str = "dots") -> Iterator[Live]:
+def panel_status(title: str, spinner: str = "dots") -> Iterator[Optional[Live]]:
     """
     Context manager showing a Live panel for long-running tasks.
-    Yields the active Live instance for updates.
+    Yields the active Live instance for updates, or None when the console is not interactive.
     """
+    if not is_interactive():
+        yield None
+        return
     panel = Panel("", title=title, border_style="white")
     with Live(panel, refresh_per_second=8, transient=True, console=_get_console(), auto_refresh=True) as live:
         yield live
+
+
+class RecordProgress:
+    """A single progress bar shared by every record in a run."""
+
+    def __init__(self, progress: Progress, task_id: TaskID) -> None:
+        self._progress = progress
+        self._task_id = task_id
+
+    @contextmanager
+    def status(self, title: str) -> Iterator[None]:
+        """Show ``title`` as the bar description while the block runs."""
+        self._progress.update(self._task_id, description=title)
+        yield
+
+    def advance(self, count: int = 1) -> None:
+        self._progress.update(self._task_id, advance=count)
+
+
+@contextmanager
+def record_progress(total: int, description: str = "Records") -> Iterator[RecordProgress]:
+    """
+    Context manager rendering one aggregate progress bar for ``total`` records.
+    Replaces per-record Live panels, so only one render thread runs for the whole batch.
+    """
+    progress = Progress(
+        SpinnerColumn(),
+        TextColumn("{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        console=_get_console(),
+        transient=True,
+    )
+    with progress:
+        yield RecordProgress(progress, progress.add_task(description, total=total))
@@ -9,18 +9,31 @@ from ..constants import ALLOWED_MODULES_ORDERED, AUTHORITATIVE_SUFFIXES
 
 __all__ = ["is_authoritative", "normalize_module"]
 
-_NORMALIZATION_TOKENS = sorted(ALLOWED_MODULES_ORDERED, key=len, reverse=True)
+_NORMALIZATION_TOKENS = tuple(sorted(ALLOWED_MODULES_ORDERED, key=len, reverse=True))
+# One alternation finds every token occurrence in a single scan; the rank keeps the
+# "longest token wins" precedence of the ordered list regardless of match position.
+_MODULE_ALT_RE = re.compile(
+    r"(?<!\w)(" + "|".join(re.escape(token.lower()) for token in _NORMALIZATION_TOKENS) + r")(?!\w)"
+)
+_LOWER_TO_RANKED = {token.lower(): (rank, token) for rank, token in enumerate(_NORMALIZATION_TOKENS)}
+
+# Plain "scheme://host[:port]" prefixes (the usual evidence shape) are read without urlparse;
+# anything else, such as userinfo, IPv6 literals, or stray whitespace, takes the full parse.
+_SIMPLE_NETLOC_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*://([A-Za-z0-9.-]*(?::[0-9]*)?)(?=[/?#]|\Z)")
 
 
 def is_authoritative(url: str) -> bool:
     """Return True when the URL belongs to an allowed authoritative domain."""
+    simple = _SIMPLE_NETLOC_RE.match(url)
+    if simple is not None:
+        netloc = simple.group(1).lower().rstrip(".")
+        return netloc.split(":")[0].endswith(AUTHORITATIVE_SUFFIXES)
     try:
         netloc = urlparse(url).netloc.lower().rstrip(".")
         host = netloc.split("@")[-1]
         host_only = host.split(":")[0]
-        return any(
-            host_only == suffix or host_only.endswith(suffix) for suffix in AUTHORITATIVE_SUFFIXES
-        )
+        # str.endswith takes the whole suffix tuple; an exact host match is also a suffix match.
+        return host_only.endswith(AUTHORITATIVE_SUFFIXES)
     except Exception:
         return False
 
@@ -28,8 +41,5 @@ def is_authoritative(url: str) -> bool:
 def normalize_module(value: str | None) -> str:
     """Resolve various module spellings into the canonical label."""
     lowered = (value or "").strip().lower()
-    for token in _NORMALIZATION_TOKENS:
-        pattern = rf"(?<!\w){re.escape(token.lower())}(?!\w)"
-        if re.search(pattern, lowered):
-            return token
-    return ""
+    best = min((_LOWER_TO_RANKED[m.group(1)] for m in _MODULE_ALT_RE.finditer(lowered)), default=None)
+    return best[1] if best else ""
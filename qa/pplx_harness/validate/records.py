@@ -2,64 +2,84 @@
 
 from __future__ import annotations
 
-import re
 from typing import Any
 
 from ..constants import ALLOWED_CONTROLS
 from ..sanitize.limitations import is_sentinel
+from ..text.regexes import NUMBERED_LINE_RE, NUMBERED_LINES_RE, OTHER_LINE_BREAK_RE
 from .evidence import is_authoritative, normalize_module
 
 __all__ = ["validate_record"]
 
 
-def _extract_numbered_lines(text: str) -> list[str]:
-    return [line for line in text.splitlines() if re.match(r"^\d+[.)]\s+", line)]
+def _scan_answer(raw_text: str) -> tuple[int, bool]:
+    """
+    Count numbered item lines of ``raw_text.strip()`` and detect the sentinel.
+    Items are counted by one MULTILINE regex pass; text using line breaks other than
+    ``\n``/``\r\n`` falls back to matching each ``splitlines()`` line.
+    """
+    text = raw_text.strip()
+    if OTHER_LINE_BREAK_RE.search(text):
+        items = sum(1 for line in text.splitlines() if NUMBERED_LINE_RE.match(line))
+    else:
+        items = len(NUMBERED_LINES_RE.findall(text))
+    # The sentinel is a single numbered line, so longer answers skip the normalising comparison.
+    return items, items <= 1 and is_sentinel(raw_text)
 
 
-def validate_record(record: dict[str, Any], min_items: int = 3) -> dict[str, Any]:
+def _clean_row(row: Any) -> dict[str, Any] | None:
+    """
+    Return the row with its module normalised, or None when it fails a sanity check.
+    Cheap field checks run first so the module and evidence lookups only run for plausible rows;
+    rows whose module is already canonical are kept as-is rather than copied.
+    """
+    if not isinstance(row, dict):
+        return None
+    if not (row.get("object") or "").strip() or not (row.get("impact") or "").strip():
+        return None
+    if (row.get("control") or "").strip().lower() not in ALLOWED_CONTROLS:
+        return None
+    evidence = (row.get("evidence_pointer") or "").strip()
+    # The KBA prefix test lowercases seven characters, so it runs before the URL parse.
+    if not evidence or not (evidence[:7].lower() == "sap kba" or is_authoritative(evidence)):
+        return None
+    module = normalize_module(row.get("module"))
+    if not module:
+        return None
+    if row.get("module") == module:
+        return row
+    return {**row, "module": module}
+
+
+def validate_record(record: dict[str, Any], min_items: int = 3, *, in_place: bool = False) -> dict[str, Any]:
     """
     Post-validation gate: enforce minimum item count, authoritative evidence, and row sanity.
-    Mutates neither the input nor nested structures; returns a copy.
+    Without ``in_place`` the input and its ``validation`` section are left untouched: the result
+    is a shallow copy, and rows that needed no change are shared with the input rather than copied.
+    With ``in_place=True`` the result keys are written onto ``record`` itself, for callers that own it.
     """
-    output = dict(record)
+    output = record if in_place else dict(record)
     raw_text = output.get("research_analysis") or ""
-    text = raw_text.strip()
     validation_section = (
-        output.get("validation") if isinstance(output.get("validation"), dict) else {"validation": []}
+        dict(output["validation"]) if isinstance(output.get("validation"), dict) else {"validation": []}
     )
     rows = validation_section.get("validation") if isinstance(validation_section.get("validation"), list) else []
 
-    items = _extract_numbered_lines(text)
-    sentinel = is_sentinel(raw_text)
+    item_count, sentinel = _scan_answer(raw_text)
     violations: list[str] = []
 
     if sentinel and rows:
         violations.append("sentinel_with_validation")
 
-    if not sentinel and len(items) < min_items:
+    if not sentinel and item_count < min_items:
         violations.append(f"min_items<{min_items}")
 
-    pruned_rows: list[dict[str, Any]] = []
-    for row in rows:
-        if not isinstance(row, dict):
-            continue
-        obj = (row.get("object") or "").strip()
-        module = normalize_module(row.get("module"))
-        control = (row.get("control") or "").strip().lower()
-        impact = (row.get("impact") or "").strip()
-        evidence = (row.get("evidence_pointer") or "").strip()
-        evidence_ok = evidence and (is_authoritative(evidence) or evidence.lower().startswith("sap kba"))
-        control_ok = control in ALLOWED_CONTROLS
-        valid = bool(obj) and bool(module) and control_ok and evidence_ok and bool(impact)
-        if valid:
-            cleaned = dict(row)
-            cleaned["module"] = module
-            pruned_rows.append(cleaned)
+    pruned_rows = [cleaned for row in rows if (cleaned := _clean_row(row)) is not None]
 
     if not sentinel and len(pruned_rows) == 0:
         violations.append("missing_validation")
 
-    if not sentinel and pruned_rows and len(pruned_rows) > len(items):
+    if not sentinel and pruned_rows and len(pruned_rows) > item_count:
         violations.append("validation_count>items")
 
     validation_section["validation"] = pruned_rows
@@ -69,10 +89,10 @@ def validate_record(record: dict[str, Any], min_items: int = 3) -> dict[str, Any
         output["processed"] = not violations
     else:
         output["processed"] = (
-            len(items) >= min_items and len(pruned_rows) == len(items) and not violations
+            item_count >= min_items and len(pruned_rows) == item_count and not violations
         )
 
-    output["metrics"] = {"items": len(items), "validation_rows": len(pruned_rows), "min_items": min_items}
+    output["metrics"] = {"items": item_count, "validation_rows": len(pruned_rows), "min_items": min_items}
 
     if violations:
         output["failure_reason"] = ",".join(violations)
@@ -0,0 +1,40 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+from pplx_harness.net.cache import AnswerCache, CachedClient
+from pplx_harness.net.pplx import collect_stream_text
+
+
+class CountingClient:
+    def __init__(self, response: str) -> None:
+        self.response = response
+        self.calls = 0
+
+    def ask_stream(self, prompt: str):
+        self.calls += 1
+        yield SimpleNamespace(delta=self.response[:5], last_chunk=False)
+        yield SimpleNamespace(delta=self.response[5:], last_chunk=True, answer=self.response)
+
+    def ask_once(self, prompt: str) -> str:
+        self.calls += 1
+        return self.response
+
+
+def test_cached_client_reuses_answers_for_identical_prompts(tmp_path: Path) -> None:
+    inner = CountingClient("1. Limitation one.")
+    client = CachedClient(inner, AnswerCache(tmp_path))
+
+    assert collect_stream_text(client, "prompt") == "1. Limitation one."
+    assert collect_stream_text(client, "prompt") == "1. Limitation one."
+    assert client.ask_once("prompt") == "1. Limitation one."
+    assert inner.calls == 1
+
+    assert collect_stream_text(client, "other prompt") == "1. Limitation one."
+    assert inner.calls == 2
+
+
+def test_answer_cache_namespaces_are_isolated(tmp_path: Path) -> None:
+    AnswerCache(tmp_path, namespace="a").put("prompt", "answer")
+
+    assert AnswerCache(tmp_path, namespace="a").get("prompt") == "answer"
+    assert AnswerCache(tmp_path, namespace="b").get("prompt") is None
@@ -0,0 +1,112 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pytest
+
+from debate import agents
+from debate.agents import cached_call, clear_prompt_cache
+
+
+class CountingClient:
+    def __init__(self, response: str = "answer") -> None:
+        self.response = response
+        self.calls = 0
+
+    def call_api(self, prompt: str) -> str:
+        self.calls += 1
+        return f"{self.response} {self.calls}"
+
+
+class BlockingClient:
+    """Holds the leader inside ``call_api`` until every waiter has joined the in-flight request."""
+
+    def __init__(self, release: threading.Event, error: Exception | None = None) -> None:
+        self.release = release
+        self.error = error
+        self.started = threading.Event()
+        self.calls = 0
+
+    def call_api(self, prompt: str) -> str:
+        self.calls += 1
+        self.started.set()
+        self.release.wait(timeout=5)
+        if self.error is not None:
+            raise self.error
+        return "shared answer"
+
+
+@pytest.fixture(autouse=True)
+def _empty_prompt_cache():
+    clear_prompt_cache()
+    yield
+    clear_prompt_cache()
+
+
+def _run_concurrently(monkeypatch: pytest.MonkeyPatch, client: BlockingClient, release: threading.Event, callers: int = 4):
+    joined = threading.Semaphore(0)
+
+    class JoinTrackingFuture(Future):
+        def result(self, timeout=None):
+            joined.release()
+            return super().result(timeout)
+
+    monkeypatch.setattr(agents, "Future", JoinTrackingFuture)
+    with ThreadPoolExecutor(max_workers=callers) as pool:
+        leader = pool.submit(cached_call, client, "prompt")
+        assert client.started.wait(timeout=5)
+        waiters = [pool.submit(cached_call, client, "prompt") for _ in range(callers - 1)]
+        for _ in waiters:
+            assert joined.acquire(timeout=5)
+        release.set()
+        return [leader, *waiters]
+
+
+def test_concurrent_identical_prompts_share_one_call(monkeypatch: pytest.MonkeyPatch) -> None:
+    release = threading.Event()
+    client = BlockingClient(release)
+
+    futures = _run_concurrently(monkeypatch, client, release)
+
+    assert [future.result(timeout=5) for future in futures] == ["shared answer"] * 4
+    assert client.calls == 1
+    assert not agents._inflight
+
+
+def test_leader_exception_reaches_every_waiter(monkeypatch: pytest.MonkeyPatch) -> None:
+    release = threading.Event()
+    client = BlockingClient(release, error=RuntimeError("api down"))
+
+    futures = _run_concurrently(monkeypatch, client, release)
+
+    for future in futures:
+        with pytest.raises(RuntimeError, match="api down"):
+            future.result(timeout=5)
+    assert client.calls == 1
+    assert not agents._inflight
+    assert not agents._prompt_cache
+
+
+def test_prompt_cache_evicts_least_recently_used(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(agents, "PROMPT_CACHE_SIZE", 2)
+    client = CountingClient()
+
+    cached_call(client, "a")
+    cached_call(client, "b")
+    cached_call(client, "a")
+    cached_call(client, "c")
+
+    assert len(agents._prompt_cache) == 2
+    assert cached_call(client, "a") == "answer 1"
+    assert client.calls == 3
+    assert cached_call(client, "b") == "answer 4"
+    assert client.calls == 4
+
+
+def test_bypass_cache_refreshes_entry() -> None:
+    client = CountingClient()
+
+    assert cached_call(client, "prompt") == "answer 1"
+    assert cached_call(client, "prompt") == "answer 1"
+    assert cached_call(client, "prompt", bypass_cache=True) == "answer 2"
+    assert cached_call(client, "prompt") == "answer 2"
+    assert client.calls == 2
@@ -3,8 +3,10 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
+import io
 import json
 import pytest
+import requests
 
 import generate_wricef_prompts as wricef_cli
 
@@ -111,6 +113,35 @@ def test_process_records_attaches_completion(monkeypatch: pytest.MonkeyPatch) ->
     assert enriched[0]["wricef_record_key"] == "Req"
 
 
+def test_stream_wricef_api_decodes_utf8_event_stream() -> None:
+    body = (
+        'data: {"choices":[{"delta":{"content":"Café – "}}]}\n\n'
+        'data: {"choices":[{"delta":{"content":"naïve"}}]}\n\n'
+        "data: [DONE]\n\n"
+    ).encode("utf-8")
+
+    class FakeSession:
+        def post(self, url: str, **kwargs: Any) -> requests.Response:
+            response = requests.Response()
+            response.status_code = 200
+            response.headers["Content-Type"] = "text/event-stream"
+            response.raw = io.BytesIO(body)
+            return response
+
+    config = wricef_cli.ApiConfig(
+        url="http://example.com",
+        token="token",
+        model="model",
+        temperature=0.1,
+        timeout=5.0,
+        include_raw=False,
+    )
+
+    pieces = list(wricef_cli.stream_wricef_api("Prompt", config=config, session=FakeSession()))
+
+    assert "".join(pieces) == "Café – naïve"
+
+
 def test_process_records_handles_api_error(monkeypatch: pytest.MonkeyPatch) -> None:
     records = [{"Title": "Req"}]
     prompts = ["Prompt text"]
@@ -0,0 +1,41 @@
+from pathlib import Path
+
+import pytest
+
+from pplx_harness.io.jsonl import iter_jsonl, read_jsonl, write_jsonl
+
+
+def test_read_jsonl_skips_blank_lines_and_honours_limit(tmp_path: Path) -> None:
+    path = tmp_path / "records.jsonl"
+    path.write_bytes('{"Title": "Café"}\r\n\n   \n{"Title": "T2"}\n{"Title": "T3"}'.encode("utf-8"))
+
+    assert [r["Title"] for r in read_jsonl(path)] == ["Café", "T2", "T3"]
+    assert [r["Title"] for r in read_jsonl(path, limit=2)] == ["Café", "T2"]
+
+
+def test_read_jsonl_reports_line_number_on_invalid_json(tmp_path: Path) -> None:
+    path = tmp_path / "broken.jsonl"
+    path.write_text('{"Title": "ok"}\n{broken\n', encoding="utf-8")
+
+    with pytest.raises(ValueError, match="line 2"):
+        read_jsonl(path)
+
+
+def test_iter_jsonl_parses_lazily(tmp_path: Path) -> None:
+    path = tmp_path / "partial.jsonl"
+    path.write_text('{"Title": "ok"}\n{broken\n', encoding="utf-8")
+
+    records = iter_jsonl(path)
+
+    assert next(records) == {"Title": "ok"}
+    with pytest.raises(ValueError, match="line 2"):
+        next(records)
+
+
+def test_write_jsonl_streams_compact_lines(tmp_path: Path) -> None:
+    path = tmp_path / "out" / "records.jsonl"
+
+    written = write_jsonl(path, ({"Title": title, "n": idx} for idx, title in enumerate(["Café", "T2"])))
+
+    assert written == 2
+    assert path.read_text(encoding="utf-8") == '{"Title":"Café","n":0}\n{"Title":"T2","n":1}\n'
@@ -1,9 +1,10 @@
 import os
+from contextlib import nullcontext
 from types import SimpleNamespace
 
 os.environ["REWRITER_ENABLED"] = "0"
 
-from pplx_harness.processing.pipeline import process_single_record
+from pplx_harness.processing.pipeline import iter_process_records, process_records, process_single_record
 
 
 class FakeClient:
@@ -40,3 +41,144 @@ def test_process_single_record_smoke() -> None:
     assert processed["processed"] is True
     assert processed["validation"]["validation"]
     assert processed["human_readable"]
+
+
+def test_process_records_rewrites_each_record() -> None:
+    records = [
+        {"Title": f"Sample {idx}", "Description": "Workflow approvals for teaching staff with routing gaps."}
+        for idx in range(3)
+    ]
+    client = FakeClient(RAW_RESPONSE)
+
+    processed = process_records(records, client, min_items=2)
+
+    assert len(processed) == 3
+    for record in processed:
+        assert record["human_readable"].startswith("- Route map approvals cannot be sequenced")
+
+
+def test_process_records_concurrent_keeps_input_order() -> None:
+    records = [
+        {"Title": f"Sample {idx}", "Description": "Workflow approvals for teaching staff with routing gaps."}
+        for idx in range(6)
+    ]
+    created: list[FakeClient] = []
+
+    def factory() -> FakeClient:
+        client = FakeClient(RAW_RESPONSE)
+        created.append(client)
+        return client
+
+    processed = process_records(records, FakeClient(RAW_RESPONSE), min_items=2, concurrency=3, client_factory=factory)
+
+    assert [record["Title"] for record in processed] == [f"Sample {idx}" for idx in range(6)]
+    assert all(record["processed"] for record in processed)
+    assert 1 <= len(created) <= 3
+
+
+def test_process_records_advances_progress_when_client_factory_fails() -> None:
+    records = [
+        {"Title": f"Sample {idx}", "Description": "Workflow approvals for teaching staff with routing gaps."}
+        for idx in range(6)
+    ]
+    attempts: list[int] = []
+    advanced: list[int] = []
+
+    class Callbacks:
+        def info(self, message: str) -> None:
+            pass
+
+        def warn(self, message: str) -> None:
+            pass
+
+        def err(self, message: str) -> None:
+            pass
+
+        def panel_status(self, title: str):
+            return nullcontext()
+
+        def advance(self, count: int = 1) -> None:
+            advanced.append(count)
+
+    def factory() -> FakeClient:
+        attempts.append(1)
+        raise RuntimeError("no session")
+
+    processed = process_records(
+        records, FakeClient(RAW_RESPONSE), min_items=2, concurrency=3, client_factory=factory, callbacks=Callbacks()
+    )
+
+    assert processed == []
+    assert sum(advanced) == 6
+    assert 1 <= len(attempts) <= 3
+
+
+def test_process_records_batches_share_one_request() -> None:
+    records = [
+        {"Title": f"Sample {idx}", "Description": "Workflow approvals for teaching staff with routing gaps."}
+        for idx in range(3)
+    ]
+    batched = "\n".join(f"===RECORD {idx}===\n{RAW_RESPONSE}" for idx in (1, 2))
+    prompts: list[str] = []
+
+    class BatchClient(FakeClient):
+        def ask_stream(self, prompt: str):
+            prompts.append(prompt)
+            return super().ask_stream(prompt)
+
+    processed = process_records(records, BatchClient(batched), min_items=2, batch_size=2)
+
+    assert [record["Title"] for record in processed] == [f"Sample {idx}" for idx in range(3)]
+    assert processed[0]["validation"]["validation"]
+    assert processed[1]["human_readable"].startswith("- Route map approvals cannot be sequenced")
+    assert "Feature 2:" in prompts[0]
+    assert len(prompts) == 2
+
+
+def test_iter_process_records_yields_before_the_run_finishes() -> None:
+    records = [
+        {"Title": f"Sample {idx}", "Description": "Workflow approvals for teaching staff with routing gaps."}
+        for idx in range(4)
+    ]
+    prompts: list[str] = []
+
+    class CountingClient(FakeClient):
+        def ask_stream(self, prompt: str):
+            prompts.append(prompt)
+            return super().ask_stream(prompt)
+
+    stream = iter_process_records(records, CountingClient(RAW_RESPONSE), min_items=2, rewrite_window=1)
+
+    first = next(stream)
+    assert first["Title"] == "Sample 0"
+    assert len(prompts) == 1
+    assert [record["Title"] for record in stream] == [f"Sample {idx}" for idx in range(1, 4)]
+
+
+def test_iter_process_records_consumes_input_lazily() -> None:
+    pulled: list[int] = []
+
+    def records():
+        for idx in range(50):
+            pulled.append(idx)
+            yield {"Title": f"Sample {idx}", "Description": "Workflow approvals for teaching staff with routing gaps."}
+
+    stream = iter_process_records(records(), FakeClient(RAW_RESPONSE), min_items=2, max_records=10)
+
+    assert next(stream)["Title"] == "Sample 0"
+    assert len(pulled) == 1
+    assert len(list(stream)) == 9
+    assert len(pulled) == 10
+
+
+def test_process_records_offloads_post_processing_to_processes() -> None:
+    records = [
+        {"Title": f"Sample {idx}", "Description": "Workflow approvals for teaching staff with routing gaps."}
+        for idx in range(3)
+    ]
+
+    processed = process_records(records, FakeClient(RAW_RESPONSE), min_items=2, concurrency=2, cpu_workers=2)
+
+    assert [record["Title"] for record in processed] == [f"Sample {idx}" for idx in range(3)]
+    assert all(record["processed"] for record in processed)
+    assert processed[0]["human_readable"].startswith("- Route map approvals cannot be sequenced")
@@ -1,4 +1,4 @@
-from pplx_harness.sanitize.limitations import sanitize_limitations_output
+from pplx_harness.sanitize.limitations import extract_validation_from_raw, sanitize_limitations_output
 
 
 RAW_WITH_VALIDATION = """1. Route map approvals cannot be sequenced for teaching staff to meet compliance obligations (SAP Help 123456).
@@ -30,3 +30,53 @@ def test_sanitize_limitations_output_returns_sentinel_when_no_items() -> None:
 
     assert result["text"] == "1. No verified limitations found within the specified scope."
     assert result["validation"]["validation"] == []
+
+
+def test_sanitize_limitations_output_strips_bullets_and_citations() -> None:
+    raw = "1. • Route map approvals cannot be sequenced for teaching staff [2].\n2. ➤ HR notifications cannot be triggered as required by policy [SAP Help]."
+    description = "Workflow approvals for teaching staff with routing gaps."
+
+    result = sanitize_limitations_output(raw, description, min_items=2)
+
+    assert result["text"].startswith("1. Route map approvals cannot be sequenced for teaching staff")
+    assert "•" not in result["text"] and "➤" not in result["text"]
+    assert "[" not in result["text"]
+
+
+def test_extract_validation_from_raw_finds_block_followed_by_text() -> None:
+    raw = (
+        "1. Approvals {draft} cannot be routed.\n"
+        '{"validation":[{"item":1,"control":"governance","impact":"a } in text"}]}\n'
+        "Sources listed above."
+    )
+
+    text, validation = extract_validation_from_raw(raw)
+
+    assert text == "1. Approvals {draft} cannot be routed."
+    assert validation["validation"][0]["impact"] == "a } in text"
+
+
+def test_extract_validation_from_raw_skips_braces_inside_strings() -> None:
+    raw = (
+        "1. Approvals cannot be routed.\n"
+        '{"note": "a } b", "validation":[{"item":1,"control":"governance"}]}\n'
+        "Sources listed above."
+    )
+
+    text, validation = extract_validation_from_raw(raw)
+
+    assert text == "1. Approvals cannot be routed."
+    assert validation["validation"][0]["control"] == "governance"
+
+
+def test_extract_validation_from_raw_ignores_later_prose_mention() -> None:
+    raw = (
+        "1. Approvals cannot be routed.\n"
+        '{"validation":[{"item":1,"control":"governance"}]}\n'
+        'Trailing mention of "validation" here.'
+    )
+
+    text, validation = extract_validation_from_raw(raw)
+
+    assert text == "1. Approvals cannot be routed."
+    assert validation["validation"][0]["control"] == "governance"
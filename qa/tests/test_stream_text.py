@@ -0,0 +1,36 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from pplx_harness.net.pplx import DEFAULT_STREAM_TIMEOUT, collect_stream_text, stream_timeout
+
+
+class SlowClient:
+    def ask_stream(self, prompt: str):
+        yield SimpleNamespace(delta="1. First", last_chunk=False)
+        time.sleep(0.05)
+        yield SimpleNamespace(delta=" item.", last_chunk=True, answer="1. First item.")
+
+    def ask_once(self, prompt: str) -> str:
+        return "1. First item."
+
+
+def test_collect_stream_text_prefers_final_answer() -> None:
+    assert collect_stream_text(SlowClient(), "prompt", timeout=None) == "1. First item."
+
+
+def test_collect_stream_text_enforces_deadline() -> None:
+    with pytest.raises(TimeoutError):
+        collect_stream_text(SlowClient(), "prompt", timeout=0.01)
+
+
+def test_collect_stream_text_reads_env_timeout_at_call_time(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PPLX_STREAM_TIMEOUT", "0.01")
+    with pytest.raises(TimeoutError):
+        collect_stream_text(SlowClient(), "prompt")
+
+
+def test_stream_timeout_falls_back_on_invalid_value(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PPLX_STREAM_TIMEOUT", "soon")
+    assert stream_timeout() == DEFAULT_STREAM_TIMEOUT
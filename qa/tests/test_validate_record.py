@@ -38,6 +38,8 @@ def test_validate_record_prunes_invalid_rows() -> None:
     assert len(rows) == 1
     assert rows[0]["module"] == "RCM"  # normalized
     assert validated["processed"] is False
+    assert len(record["validation"]["validation"]) == 2  # input left untouched
+    assert record["validation"]["validation"][0]["module"] == "rcm"
 
 
 def test_validate_record_flags_sentinel_with_validation() -> None:
@@ -62,3 +64,15 @@ def test_validate_record_flags_sentinel_with_validation() -> None:
 
     assert validated["processed"] is False
     assert "sentinel_with_validation" in validated["failure_reason"]
+
+
+def test_validate_record_in_place_updates_the_given_dict() -> None:
+    record = {"research_analysis": SENTINEL_TEXT, "validation": {"validation": []}}
+
+    copied = validate_record(record, min_items=2)
+    assert "processed" not in record
+
+    validated = validate_record(record, min_items=2, in_place=True)
+    assert validated is record
+    assert validated["processed"] is True
+    assert validated["metrics"] == copied["metrics"]
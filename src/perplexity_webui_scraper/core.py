@@ -1,4 +1,5 @@
 # Standard modules
+from logging import DEBUG
 from mimetypes import guess_type
 from os import PathLike
 from pathlib import Path
@@ -71,19 +72,23 @@ class Perplexity:
             if isinstance(line, bytes):
                 if line.startswith(b"data: "):
                     result = loads(line[6:])
-                    self.logger.debug(f"Extracted JSON from bytes line: {str(result)[:200]}{'...' if len(str(result)) > 200 else ''}")
+                    if self.logger.isEnabledFor(DEBUG):
+                        preview = str(result)
+                        self.logger.debug("Extracted JSON from bytes line: %s%s", preview[:200], "..." if len(preview) > 200 else "")
                     return result
                 else:
                     return None
             else:
                 if line.startswith("data: "):
                     result = loads(line[6:])
-                    self.logger.debug(f"Extracted JSON from string line: {str(result)[:200]}{'...' if len(str(result)) > 200 else ''}")
+                    if self.logger.isEnabledFor(DEBUG):
+                        preview = str(result)
+                        self.logger.debug("Extracted JSON from string line: %s%s", preview[:200], "..." if len(preview) > 200 else "")
                     return result
                 else:
                     return None
         except Exception as e:
-            self.logger.warning(f"Failed to extract JSON from line: {e}")
+            self.logger.warning("Failed to extract JSON from line: %s", e)
             return None
 
     def validate_files(self, files: str | PathLike | list[str | PathLike] | None) -> list[dict[str, str | int | bool]]:
@@ -287,28 +292,28 @@ class Perplexity:
         self,
         data: dict[str, Any],
     ) -> None:
-        self.logger.debug(f"Processing incoming data chunk: {list(data.keys())}")
+        self.logger.debug("Processing incoming data chunk: %s", data.keys())
 
         if self.conversation_uuid is None and "backend_uuid" in data:
             self.conversation_uuid = data["backend_uuid"]
-            self.logger.info(f"Conversation UUID established: {self.conversation_uuid}")
+            self.logger.info("Conversation UUID established: %s", self.conversation_uuid)
 
         if "text" in data:
             self.logger.debug("Processing text data from response")
             try:
                 json_data = loads(data["text"])
-                self.logger.debug(f"Parsed JSON data type: {type(json_data)}")
+                self.logger.debug("Parsed JSON data type: %s", type(json_data))
             except Exception as e:
-                self.logger.error(f"Failed to parse JSON from text data: {e}")
+                self.logger.error("Failed to parse JSON from text data: %s", e)
                 return
 
             answer_data = {}
 
             if isinstance(json_data, list):
-                self.logger.debug(f"Processing list with {len(json_data)} items")
+                self.logger.debug("Processing list with %d items", len(json_data))
                 for i, item in enumerate(json_data):
                     step_type = item.get("step_type")
-                    self.logger.debug(f"Item {i}: step_type = {step_type}")
+                    self.logger.debug("Item %d: step_type = %s", i, step_type)
 
                     if step_type == "FINAL":
                         self.logger.info("Found FINAL step, processing answer content")
@@ -320,7 +325,7 @@ class Perplexity:
                             try:
                                 answer_data = loads(answer_content)
                             except Exception as e:
-                                self.logger.warning(f"Failed to parse answer JSON: {e}")
+                                self.logger.warning("Failed to parse answer JSON: %s", e)
                                 answer_data = raw_content
                         else:
                             answer_data = raw_content
@@ -336,14 +341,14 @@ class Perplexity:
         title: str | None,
         answer_data: dict[str, Any],
     ) -> None:
-        self.logger.debug(f"Updating response data with title: {title}")
-        self.logger.debug(f"Answer data keys: {list(answer_data.keys()) if answer_data else 'None'}")
+        self.logger.debug("Updating response data with title: %s", title)
+        self.logger.debug("Answer data keys: %s", answer_data.keys() if answer_data else None)
 
         self.title = title
 
         # Process search results
         web_results = answer_data.get("web_results", [])
-        self.logger.debug(f"Processing {len(web_results)} web results")
+        self.logger.debug("Processing %d web results", len(web_results))
 
         self.search_results = [
             SearchResultItem(title=r.get("name"), snippet=r.get("snippet"), url=r.get("url"))
@@ -358,8 +363,8 @@ class Perplexity:
         self.last_chunk = self.chunks[-1] if self.chunks else None
         self.raw_data = answer_data
 
-        self.logger.debug(f"Response updated - Answer length: {len(self.answer) if self.answer else 0}, " +
-                         f"Chunks: {len(self.chunks)}, Search results: {len(self.search_results)}")
+        self.logger.debug("Response updated - Answer length: %d, Chunks: %d, Search results: %d",
+                          len(self.answer) if self.answer else 0, len(self.chunks), len(self.search_results))
 
     def ask(
         self,
@@ -138,6 +138,10 @@ def log_request_details(logger: logging.Logger, method: str, url: str,
         data: Request data (optional, will be truncated if too long)
         params: URL parameters (optional)
     """
+    # Skip all formatting (including str() of the payload) when DEBUG is off
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+
     # Build full URL with params for logging
     full_url = url
     if params:
@@ -178,6 +182,10 @@ def log_response_details(logger: logging.Logger, status_code: int,
         response_data: Response data (optional, will be truncated if too long)
         truncate_at: Maximum length for response data logging
     """
+    # Skip all formatting (including str() of the response) when DEBUG is off
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+
     logger.debug(f"HTTP Response: Status {status_code}")
 
     if response_data:
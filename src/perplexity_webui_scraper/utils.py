@@ -1,11 +1,12 @@
 # Standard modules
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
 from enum import Enum
 from re import Match
 from re import compile as re_compile
 from typing import Any
 
 # Third-party modules
+from httpx import Response
 from pydantic import BaseModel, Field
 
 # Local modules
@@ -99,6 +100,33 @@ class TimeRange(Enum):
     LAST_YEAR = "YEAR"
 
 
+def iter_response_lines(response: Response, chunk_size: int = 65536) -> Iterator[bytes]:
+    """
+    Split a streamed response body into lines without decoding it first.
+
+    Args:
+        response: The streaming response to read from.
+        chunk_size: Number of bytes requested from the network per read.
+
+    Yields:
+        Each line as raw bytes, with the trailing newline (and carriage return) removed.
+    """
+
+    buffer = bytearray()
+
+    for chunk in response.iter_bytes(chunk_size):
+        buffer += chunk
+
+        while (index := buffer.find(b"\n")) >= 0:
+            end = index - 1 if index and buffer[index - 1] == 0x0D else index
+            line = bytes(buffer[:end])
+            del buffer[: index + 1]
+            yield line
+
+    if buffer:
+        yield bytes(buffer.rstrip(b"\r"))
+
+
 class AskCall:
     def __init__(self, parent, json_data: dict[str, Any]) -> None:
         self._parent = parent
@@ -142,10 +170,10 @@ class AskCall:
             self.logger.debug("Stream established, processing response lines")
 
             line_count = 0
-            for line in response.iter_lines():
+            for line in iter_response_lines(response):
                 line_count += 1
                 if line_count % 10 == 0:  # Log every 10th line to avoid spam
-                    self.logger.debug(f"Processed {line_count} lines")
+                    self.logger.debug("Processed %d lines", line_count)
 
                 data = self._parent._extract_json_line(line)
 
@@ -208,10 +236,10 @@ class AskCall:
             line_count = 0
             yield_count = 0
 
-            for line in response.iter_lines():
+            for line in iter_response_lines(response):
                 line_count += 1
                 if line_count % 20 == 0:  # Log every 20th line for stream mode
-                    self.logger.debug(f"Processed {line_count} lines, yielded {yield_count} responses")
+                    self.logger.debug("Processed %d lines, yielded %d responses", line_count, yield_count)
 
                 data = self._parent._extract_json_line(line)
 
@@ -228,7 +256,7 @@ class AskCall:
                         raw_data=data,
                     )
 
-                    self.logger.debug(f"Yielding response {yield_count} - Answer: {len(stream_response.answer) if stream_response.answer else 0} chars")
+                    self.logger.debug("Yielding response %d - Answer: %d chars", yield_count, len(stream_response.answer) if stream_response.answer else 0)
                     yield stream_response
 
                     if data.get("final"):